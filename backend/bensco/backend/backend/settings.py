@@ -43,6 +43,7 @@ INSTALLED_APPS = [
     'django.contrib.sessions',
     'django.contrib.messages',
     'django.contrib.staticfiles',
+    'django.contrib.postgres',
     'corsheaders',
     'clients',
     'contributions',
@@ -107,6 +108,40 @@ DATABASES = {
 }
 
 
+# Cache
+# Client list pages and their version counters must be seen by every worker process.
+# REDIS_URL is shared by all hosts; CACHE_DIR only by the workers on one host.
+# Without either the cache is per-process local memory, fine for runserver only.
+
+REDIS_URL = os.environ.get('REDIS_URL')
+CACHE_DIR = os.environ.get('CACHE_DIR')
+
+if REDIS_URL:
+    CACHES = {
+        'default': {
+            'BACKEND': 'django.core.cache.backends.redis.RedisCache',
+            'LOCATION': REDIS_URL,
+        }
+    }
+else:
+    CACHES = {
+        'default': {
+            'BACKEND': (
+                'django.core.cache.backends.filebased.FileBasedCache' if CACHE_DIR
+                else 'django.core.cache.backends.locmem.LocMemCache'
+            ),
+            'LOCATION': CACHE_DIR or 'bensco',
+            'OPTIONS': {'MAX_ENTRIES': 10000},
+        }
+    }
+
+# Cache client list pages and validate them from the cached version counter. Off with
+# DEBUG off and only local memory: other workers would never see a write's version bump,
+# so lists are then read and validated from the database.
+CLIENT_LIST_CACHE = DEBUG or bool(REDIS_URL or CACHE_DIR)
+CLIENT_LIST_CACHE_TIMEOUT = 600  # seconds; writes invalidate sooner through the version counter
+
+
 # Password validation
 # https://docs.djangoproject.com/en/5.2/ref/settings/#auth-password-validators
 
@@ -155,12 +190,51 @@ AUTH_USER_MODEL = "users.UserModel"
 
 REST_FRAMEWORK = {
     'DEFAULT_AUTHENTICATION_CLASSES': (
-        'rest_framework_simplejwt.authentication.JWTAuthentication',
+        'users.authentication.StatelessJWTAuthentication',
+    ),
+    'DEFAULT_RENDERER_CLASSES': (
+        'core.renderers.FastJSONRenderer',
+        'rest_framework.renderers.BrowsableAPIRenderer',
+    ),
+    'DEFAULT_PARSER_CLASSES': (
+        'core.parsers.FastJSONParser',
+        'rest_framework.parsers.FormParser',
+        'rest_framework.parsers.MultiPartParser',
     ),
     'DEFAULT_PAGINATION_CLASS': 'rest_framework.pagination.PageNumberPagination',
     'PAGE_SIZE': 10
 }
 
+# Seconds a user's active/token_version check is reused by StatelessJWTAuthentication
+AUTH_USER_STATE_TTL = 30
+
+# Seconds between rebuilds of the in-process revoked-token filter from the database
+TOKEN_REVOCATION_REFRESH = 5
+
+# Login/logout audit rows are queued in process and written in batches (users.audit.AuditBuffer)
+AUTH_LOG_BUFFER = {
+    'max_size': 10000,
+    'batch_size': 500,
+    'flush_interval': 2.0,
+    'overflow': 'flush',
+}
+
+# Database job queue (core.jobs); run workers with `manage.py run_worker --workers N`
+JOB_MAX_ATTEMPTS = 5
+JOB_RETRY_BACKOFF = 30  # seconds before the first retry; doubles per attempt
+JOB_RETRY_BACKOFF_MAX = 3600
+JOB_LOCK_TIMEOUT = 600  # seconds before a RUNNING job whose worker vanished is retried
+
+# Notification outbox (core.notifications): emails are stored with the event that
+# causes them and sent in batches, one email per recipient and one SMTP connection per batch
+NOTIFICATION_OUTBOX = {
+    'dispatch_delay': 30,  # seconds a burst of events may accumulate before a batch is sent
+    'max_emails_per_run': 100,
+    'recipient_interval': 60,  # minimum seconds between two emails to one address
+    'max_attempts': 5,
+    'send_timeout': 600,  # seconds before a SENDING row whose dispatcher vanished is sent again
+}
+
 SIMPLE_JWT = {
     'ACCESS_TOKEN_LIFETIME': timedelta(minutes=30),
     'REFRESH_TOKEN_LIFETIME': timedelta(days=1),
@@ -168,10 +242,10 @@ SIMPLE_JWT = {
 }
 
 #Authentication BAckends
-# AUTHENTICATION_BACKENDS = [
-#     'users.authentication.EmailOrUsernameBackend', 
-#     'django.contrib.auth.backends.ModelBackend',  
-# ]
+AUTHENTICATION_BACKENDS = [
+    'users.authentication.EmailOrUsernameBackend',
+    'django.contrib.auth.backends.ModelBackend',
+]
 
 ## Email Settings
 EMAIL_BACKEND = 'django.core.mail.backends.smtp.EmailBackend'
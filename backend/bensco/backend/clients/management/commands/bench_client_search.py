@@ -0,0 +1,83 @@
+import random
+import statistics
+import time
+import uuid
+
+from django.core.management.base import BaseCommand
+from django.db import connection, transaction
+from django.db.models import Q
+from django.utils import timezone
+
+from clients.models import ClientModel
+from clients.utils import normalize_phone, search_clients
+from users.models import UserModel
+
+FIRST_NAMES = ['Kwame', 'Ama', 'Kofi', 'Akosua', 'Yaw', 'Abena', 'Kojo', 'Efua', 'Kwesi', 'Adwoa']
+LAST_NAMES = ['Mensah', 'Owusu', 'Boateng', 'Asante', 'Osei', 'Agyeman', 'Appiah', 'Darko', 'Ofori', 'Addo']
+
+
+class Command(BaseCommand):
+    help = "Benchmark client search: legacy icontains vs indexed ranked search (rolled back)."
+
+    def add_arguments(self, parser):
+        parser.add_argument('--clients', type=int, default=500_000)
+        parser.add_argument('--seed-chunk', type=int, default=5000)
+        parser.add_argument('--repeat', type=int, default=5, help="Runs per term; the median is reported")
+        parser.add_argument('--page-size', type=int, default=10)
+
+    def handle(self, *args, **options):
+        rng = random.Random(42)
+        page = options['page_size']
+
+        with transaction.atomic():
+            tag = uuid.uuid4().hex[:8]
+            collector = UserModel.objects.create_user(
+                username=f'bench-{tag}', email=f'bench-{tag}@example.com', password='x', role='collector'
+            )
+            today = timezone.now().date()
+            remaining = options['clients']
+            seeded = 0
+            while remaining > 0:
+                chunk = min(remaining, options['seed_chunk'])
+                batch = []
+                for i in range(seeded, seeded + chunk):
+                    phone = f'+233 5{rng.randint(0, 9)} {rng.randint(0, 999):03d} {rng.randint(0, 9999):04d}'
+                    batch.append(ClientModel(
+                        name=f'{rng.choice(FIRST_NAMES)} {rng.choice(LAST_NAMES)} {i}',
+                        unique_code=f'BENCH-{tag}-{i}',
+                        phone_number=phone,
+                        phone_digits=normalize_phone(phone),
+                        collector=collector,
+                        amount_daily=5,
+                        start_date=today,
+                    ))
+                ClientModel.objects.bulk_create(batch)
+                seeded += chunk
+                remaining -= chunk
+            if connection.vendor == 'postgresql':
+                with connection.cursor() as cursor:
+                    cursor.execute('ANALYZE clients_clientmodel')
+
+            clients = ClientModel.objects.filter(collector=collector)
+            terms = ['Owusu', 'Akosu', 'Boatneg', '055 12', '+233 24']
+
+            def legacy(term):
+                return clients.filter(Q(name__icontains=term) | Q(phone_number__icontains=term))
+
+            def timed(build, term):
+                runs = []
+                for _ in range(options['repeat']):
+                    started = time.perf_counter()
+                    list(build(term)[:page])
+                    runs.append((time.perf_counter() - started) * 1000)
+                return statistics.median(runs)
+
+            self.stdout.write(f"{seeded} clients on {connection.vendor}")
+            self.stdout.write(f"{'term':>12} {'legacy ms':>10} {'ranked ms':>10}")
+            for term in terms:
+                self.stdout.write(
+                    f"{term:>12} {timed(legacy, term):>10.1f} "
+                    f"{timed(lambda t: search_clients(clients, t), term):>10.1f}"
+                )
+
+            transaction.set_rollback(True)
@@ -0,0 +1,30 @@
+# Generated by Django 5.2.3 on 2026-10-18 08:32
+
+from django.conf import settings
+from django.db import migrations, models
+
+
+def backfill_updated_at(apps, schema_editor):
+    ClientModel = apps.get_model('clients', 'ClientModel')
+    ClientModel.objects.update(updated_at=models.F('created_at'))
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('clients', '0002_initial'),
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='clientmodel',
+            name='updated_at',
+            field=models.DateTimeField(auto_now=True),
+        ),
+        migrations.RunPython(backfill_updated_at, migrations.RunPython.noop),
+        migrations.AddIndex(
+            model_name='clientmodel',
+            index=models.Index(fields=['collector', 'updated_at', 'id'], name='client_collector_updated_idx'),
+        ),
+    ]
@@ -0,0 +1,69 @@
+# Generated by Django 5.2.3 on 2026-10-18 08:41
+
+import re
+
+from django.conf import settings
+from django.db import migrations, models
+
+NON_DIGITS = re.compile(r'\D')
+
+
+def normalize_phone(phone_number):
+    # A frozen copy of clients.utils.normalize_phone, so later changes there leave this migration alone
+    if not phone_number:
+        return None
+    digits = NON_DIGITS.sub('', phone_number)
+    if digits.startswith('233'):
+        digits = '0' + digits[3:]
+    return digits or None
+
+
+def backfill_phone_digits(apps, schema_editor):
+    ClientModel = apps.get_model('clients', 'ClientModel')
+    batch = []
+    for client in ClientModel.objects.exclude(phone_number=None).only('id', 'phone_number').iterator(chunk_size=2000):
+        client.phone_digits = normalize_phone(client.phone_number)
+        batch.append(client)
+        if len(batch) == 2000:
+            ClientModel.objects.bulk_update(batch, ['phone_digits'])
+            batch = []
+    if batch:
+        ClientModel.objects.bulk_update(batch, ['phone_digits'])
+
+
+def create_name_trigram_index(apps, schema_editor):
+    # GIN trigram index for similarity (%) and word similarity (%>) on name, PostgreSQL only
+    if schema_editor.connection.vendor != 'postgresql':
+        return
+    schema_editor.execute('CREATE EXTENSION IF NOT EXISTS pg_trgm')
+    schema_editor.execute(
+        'CREATE INDEX IF NOT EXISTS client_name_trgm_idx ON clients_clientmodel USING gin (name gin_trgm_ops)'
+    )
+
+
+def drop_name_trigram_index(apps, schema_editor):
+    if schema_editor.connection.vendor != 'postgresql':
+        return
+    schema_editor.execute('DROP INDEX IF EXISTS client_name_trgm_idx')
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('clients', '0003_sync_updated_at'),
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='clientmodel',
+            name='phone_digits',
+            field=models.CharField(blank=True, editable=False, max_length=20, null=True),
+        ),
+        migrations.RunPython(backfill_phone_digits, migrations.RunPython.noop),
+        migrations.AddIndex(
+            model_name='clientmodel',
+            index=models.Index(fields=['phone_digits'], name='client_phone_digits_idx', opclasses=['varchar_pattern_ops']),
+        ),
+        migrations.RunPython(create_name_trigram_index, drop_name_trigram_index),
+    ]
@@ -2,6 +2,7 @@ from django.db import models
 import uuid
 from users.models import UserModel
 from core.utils import generate_hex_id , generate_unique_code
+from .utils import invalidate_client_lists, normalize_phone
 
 
 
@@ -20,6 +21,7 @@ class ClientModel(models.Model):
     unique_code = models.CharField(max_length=20, unique=True, null=True, blank=True)
     name = models.CharField(max_length=255)
     phone_number = models.CharField(max_length=20, blank=True, null=True)
+    phone_digits = models.CharField(max_length=20, blank=True, null=True, editable=False)  # normalized for prefix search
     collector = models.ForeignKey(UserModel, on_delete=models.CASCADE, related_name='clients')
     address = models.ForeignKey(AddressModel, on_delete=models.SET_NULL, null=True, blank=True, related_name='clients')
     dob = models.DateField(blank=True, null=True)
@@ -28,11 +30,38 @@ class ClientModel(models.Model):
     is_fixed = models.BooleanField(default=True)
     start_date = models.DateField()
     created_at = models.DateTimeField(auto_now_add=True)
+    updated_at = models.DateTimeField(auto_now=True)
+
+    class Meta:
+        indexes = [
+            models.Index(fields=['collector', 'updated_at', 'id'], name='client_collector_updated_idx'),
+            # pattern ops let PostgreSQL serve LIKE 'prefix%' from the index
+            models.Index(fields=['phone_digits'], name='client_phone_digits_idx', opclasses=['varchar_pattern_ops']),
+        ]
 
     def __str__(self):
         return self.name
-    
+
+    @classmethod
+    def from_db(cls, db, field_names, values):
+        instance = super().from_db(db, field_names, values)
+        # Remembered so a change of collector also invalidates the old collector's list
+        instance._loaded_collector_id = instance.__dict__.get('collector_id')
+        return instance
+
     def save(self, *args, **kwargs):
         if not self.unique_code:
             self.unique_code = generate_unique_code(ClientModel, 'CLI')
+        self.phone_digits = normalize_phone(self.phone_number)
+        update_fields = kwargs.get('update_fields')
+        if update_fields is not None and 'phone_number' in update_fields:
+            kwargs['update_fields'] = {*update_fields, 'phone_digits'}
         super().save(*args, **kwargs)
+        invalidate_client_lists(self.collector_id, getattr(self, '_loaded_collector_id', None))
+        self._loaded_collector_id = self.collector_id
+
+    def delete(self, *args, **kwargs):
+        collector_id = self.collector_id
+        result = super().delete(*args, **kwargs)
+        invalidate_client_lists(collector_id)
+        return result
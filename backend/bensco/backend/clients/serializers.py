@@ -1,5 +1,6 @@
 from rest_framework import serializers
 from .models import ClientModel
+from core.readpath import ReadField, ValuesSerializer, as_date, as_datetime, as_decimal, as_str
 from core.utils import generate_unique_code
 from .models import AddressModel
 
@@ -29,7 +30,29 @@ class ClientModelSerializer(serializers.ModelSerializer):
         ]
         read_only_fields = ['id', 'unique_code', 'collector_username', 'created_at']
 
+    @staticmethod
+    def setup_eager_loading(queryset):
+        # collector_username reads the related user
+        return queryset.select_related('collector')
+
     def create(self, validated_data):
         if not validated_data.get('unique_code'):
             validated_data['unique_code'] = generate_unique_code(ClientModel, 'CLI')
         return super().create(validated_data)
+
+
+class ClientReadSerializer(ValuesSerializer):
+    # Same output as ClientModelSerializer, from .values() rows
+    fields = (
+        ReadField('id', 'id', as_str),
+        ReadField('name', 'name'),
+        ReadField('phone_number', 'phone_number'),
+        ReadField('amount_daily', 'amount_daily', as_decimal(2)),
+        ReadField('is_fixed', 'is_fixed'),
+        ReadField('start_date', 'start_date', as_date),
+        ReadField('unique_code', 'unique_code'),
+        ReadField('collector', 'collector_id'),
+        ReadField('collector_username', 'collector__username', omit_without='collector_id'),
+        ReadField('created_at', 'created_at', as_datetime),
+        ReadField('address', 'address_id'),
+    )
@@ -0,0 +1,99 @@
+from django.core.cache import cache
+from django.db import connection
+from django.test import TestCase, override_settings
+from django.test.utils import CaptureQueriesContext
+from django.urls import reverse
+from django.utils import timezone
+from rest_framework.test import APIClient
+
+from clients.models import ClientModel
+from users.models import UserModel
+
+
+class ClientListCacheTestCase(TestCase):
+    def setUp(self):
+        cache.clear()
+        self.collector = UserModel.objects.create_user(
+            username='collector1',
+            email='collector1@example.com',
+            password='password123',
+            role='collector'
+        )
+        self.other = UserModel.objects.create_user(
+            username='collector2',
+            email='collector2@example.com',
+            password='password123',
+            role='collector'
+        )
+        self.client_obj = self._client('Ama Owusu', self.collector)
+        self.api = APIClient()
+        self.api.force_authenticate(user=self.collector)
+
+    def _client(self, name, collector):
+        return ClientModel.objects.create(
+            name=name,
+            collector=collector,
+            amount_daily=5.0,
+            start_date=timezone.now().date(),
+        )
+
+    def _names(self, response):
+        return [row['name'] for row in response.data['results']]
+
+    def test_repeat_read_skips_the_database(self):
+        self.api.get(reverse('list_clients'))
+        with CaptureQueriesContext(connection) as ctx:
+            response = self.api.get(reverse('list_clients'))
+
+        self.assertEqual(self._names(response), ['Ama Owusu'])
+        self.assertEqual(len(ctx.captured_queries), 0)
+
+    def test_query_params_are_cached_separately(self):
+        self._client('Kofi Mensah', self.collector)
+        self.assertEqual(len(self._names(self.api.get(reverse('list_clients')))), 2)
+        response = self.api.get(reverse('list_clients'), {'search': 'Kofi'})
+        self.assertEqual(self._names(response), ['Kofi Mensah'])
+
+    def test_create_and_patch_invalidate(self):
+        self.api.get(reverse('list_clients'))
+
+        response = self.api.post(reverse('create_client'), {
+            'name': 'Kofi Mensah', 'amount_daily': '5.00', 'start_date': str(timezone.now().date())
+        }, format='json')
+        self.assertEqual(response.status_code, 201)
+        self.assertCountEqual(self._names(self.api.get(reverse('list_clients'))), ['Ama Owusu', 'Kofi Mensah'])
+
+        self.api.patch(reverse('client_profile', args=[self.client_obj.id]), {'name': 'Ama Boateng'}, format='json')
+        self.assertIn('Ama Boateng', self._names(self.api.get(reverse('list_clients'))))
+
+    def test_collector_change_invalidates_both_lists(self):
+        other_api = APIClient()
+        other_api.force_authenticate(user=self.other)
+        self.api.get(reverse('list_clients'))
+        other_api.get(reverse('list_clients'))
+
+        client = ClientModel.objects.get(pk=self.client_obj.pk)
+        client.collector = self.other
+        client.save()
+
+        self.assertEqual(self._names(self.api.get(reverse('list_clients'))), [])
+        self.assertEqual(self._names(other_api.get(reverse('list_clients'))), ['Ama Owusu'])
+
+    def test_write_for_one_collector_keeps_others_cached(self):
+        self.api.get(reverse('list_clients'))
+        self._client('Kofi Mensah', self.other)
+
+        with CaptureQueriesContext(connection) as ctx:
+            self.api.get(reverse('list_clients'))
+        self.assertEqual(len(ctx.captured_queries), 0)
+
+    @override_settings(CLIENT_LIST_CACHE=False)
+    def test_without_a_shared_cache_every_read_hits_the_database(self):
+        self.api.get(reverse('list_clients'))
+        # A write whose version bump this process never saw, as from another worker
+        ClientModel.objects.filter(pk=self.client_obj.pk).update(name='Ama Boateng')
+
+        with CaptureQueriesContext(connection) as ctx:
+            response = self.api.get(reverse('list_clients'))
+        self.assertEqual(self._names(response), ['Ama Boateng'])
+        self.assertGreater(len(ctx.captured_queries), 0)
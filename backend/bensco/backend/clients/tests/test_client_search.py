@@ -0,0 +1,84 @@
+from unittest import skipUnless
+
+from django.db import connection
+from django.test import TestCase
+from django.urls import reverse
+from django.utils import timezone
+from rest_framework.test import APIClient
+
+from clients.models import ClientModel
+from clients.utils import normalize_phone, search_clients
+from users.models import UserModel
+
+
+class NormalizePhoneTestCase(TestCase):
+    def test_strips_formatting_and_country_code(self):
+        self.assertEqual(normalize_phone('+233 55 000 1111'), '0550001111')
+        self.assertEqual(normalize_phone('(055) 000-1111'), '0550001111')
+        self.assertIsNone(normalize_phone(''))
+        self.assertIsNone(normalize_phone(None))
+
+
+class ClientSearchTestCase(TestCase):
+    def setUp(self):
+        self.collector = UserModel.objects.create_user(
+            username='collector1',
+            email='collector1@example.com',
+            password='password123',
+            role='collector'
+        )
+        names_and_phones = [
+            ('Ama Owusu', '+233 55 000 1111'),
+            ('Kofi Owusu-Ansah', '0240002222'),
+            ('Owusu Mensah', '0200003333'),
+            ('Yaw Boateng', None),
+        ]
+        self.clients = {
+            name: ClientModel.objects.create(
+                name=name,
+                phone_number=phone,
+                collector=self.collector,
+                amount_daily=5.0,
+                start_date=timezone.now().date(),
+            )
+            for name, phone in names_and_phones
+        }
+
+    def test_phone_digits_kept_in_sync(self):
+        client = self.clients['Ama Owusu']
+        self.assertEqual(client.phone_digits, '0550001111')
+        client.phone_number = '024 999 8888'
+        client.save(update_fields=['phone_number'])
+        client.refresh_from_db()
+        self.assertEqual(client.phone_digits, '0249998888')
+
+    def test_phone_prefix_matches_any_format(self):
+        for term in ('055 000', '+233 55 000', '0550'):
+            results = list(search_clients(ClientModel.objects.all(), term))
+            self.assertEqual([client.name for client in results], ['Ama Owusu'], term)
+
+    def test_name_matches_ranked_by_relevance(self):
+        results = [client.name for client in search_clients(ClientModel.objects.all(), 'owusu')]
+        self.assertEqual(results[0], 'Owusu Mensah')
+        self.assertCountEqual(results, ['Ama Owusu', 'Kofi Owusu-Ansah', 'Owusu Mensah'])
+
+    def test_ranked_mode_on_list_endpoint(self):
+        api = APIClient()
+        api.force_authenticate(user=self.collector)
+        response = api.get(reverse('list_clients'), {'search': '0240', 'search_mode': 'ranked'})
+
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual([row['name'] for row in response.data['results']], ['Kofi Owusu-Ansah'])
+
+    @skipUnless(connection.vendor == 'postgresql', "trigram index is PostgreSQL only")
+    def test_name_and_phone_search_uses_indexes(self):
+        with connection.cursor() as cursor:
+            # Four rows are cheaper to scan; make the planner show whether the indexes apply at all
+            cursor.execute('SET LOCAL enable_seqscan = off')
+        plan = search_clients(ClientModel.objects.all(), '055 owusu').explain()
+        self.assertIn('client_name_trgm_idx', plan)
+        self.assertNotIn('Seq Scan', plan)
+
+        plan = search_clients(ClientModel.objects.all(), '0550').explain()
+        self.assertIn('client_phone_digits_idx', plan)
+        self.assertNotIn('Seq Scan', plan)
@@ -0,0 +1,97 @@
+from django.core.cache import cache
+from django.db import connection
+from django.test import TestCase, override_settings
+from django.test.utils import CaptureQueriesContext
+from django.urls import reverse
+from django.utils import timezone
+from rest_framework.test import APIClient
+
+from clients.models import ClientModel
+from users.models import UserModel
+
+
+class ClientConditionalGetTestCase(TestCase):
+    def setUp(self):
+        cache.clear()
+        self.collector = UserModel.objects.create_user(
+            username='collector1',
+            email='collector1@example.com',
+            password='password123',
+            role='collector'
+        )
+        self.client_obj = ClientModel.objects.create(
+            name='Ama Owusu',
+            collector=self.collector,
+            amount_daily=5.0,
+            start_date=timezone.now().date(),
+        )
+        self.api = APIClient()
+        self.api.force_authenticate(user=self.collector)
+
+    def test_profile_not_modified_in_one_query(self):
+        url = reverse('client_profile', args=[self.client_obj.id])
+        first = self.api.get(url)
+        self.assertEqual(first.status_code, 200)
+        self.assertIn('Last-Modified', first)
+
+        with CaptureQueriesContext(connection) as ctx:
+            response = self.api.get(url, HTTP_IF_NONE_MATCH=first['ETag'])
+        self.assertEqual(response.status_code, 304)
+        self.assertEqual(len(ctx.captured_queries), 1)
+
+    def test_profile_etag_changes_on_edit(self):
+        url = reverse('client_profile', args=[self.client_obj.id])
+        etag = self.api.get(url)['ETag']
+        self.api.patch(url, {'name': 'Ama Boateng'}, format='json')
+
+        response = self.api.get(url, HTTP_IF_NONE_MATCH=etag)
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(response.data['name'], 'Ama Boateng')
+
+    def test_list_not_modified_without_queries(self):
+        url = reverse('list_clients')
+        first = self.api.get(url)
+
+        with CaptureQueriesContext(connection) as ctx:
+            response = self.api.get(url, HTTP_IF_NONE_MATCH=first['ETag'])
+        self.assertEqual(response.status_code, 304)
+        self.assertEqual(len(ctx.captured_queries), 0)
+
+        with CaptureQueriesContext(connection) as ctx:
+            response = self.api.get(url, HTTP_IF_MODIFIED_SINCE=first['Last-Modified'])
+        self.assertEqual(response.status_code, 304)
+        self.assertEqual(len(ctx.captured_queries), 0)
+
+    def test_list_etag_changes_on_write_and_params(self):
+        url = reverse('list_clients')
+        etag = self.api.get(url)['ETag']
+
+        self.assertEqual(self.api.get(url, {'search': 'Ama'}, HTTP_IF_NONE_MATCH=etag).status_code, 200)
+
+        ClientModel.objects.create(
+            name='Kofi Mensah', collector=self.collector, amount_daily=5.0, start_date=timezone.now().date()
+        )
+        response = self.api.get(url, HTTP_IF_NONE_MATCH=etag)
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(response.data['count'], 2)
+
+    @override_settings(CLIENT_LIST_CACHE=False)
+    def test_list_validators_come_from_the_database_without_a_shared_cache(self):
+        url = reverse('list_clients')
+        first = self.api.get(url)
+
+        with CaptureQueriesContext(connection) as ctx:
+            response = self.api.get(url, HTTP_IF_NONE_MATCH=first['ETag'])
+        self.assertEqual(response.status_code, 304)
+        self.assertEqual(len(ctx.captured_queries), 1)
+
+        # Writes this process never saw a version bump for, as from another worker
+        ClientModel.objects.filter(pk=self.client_obj.pk).update(name='Ama Boateng', updated_at=timezone.now())
+        edited = self.api.get(url, HTTP_IF_NONE_MATCH=first['ETag'])
+        self.assertEqual(edited.status_code, 200)
+        self.assertEqual(edited.data['results'][0]['name'], 'Ama Boateng')
+
+        ClientModel.objects.filter(pk=self.client_obj.pk).delete()
+        response = self.api.get(url, HTTP_IF_NONE_MATCH=edited['ETag'])
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(response.data['count'], 0)
@@ -0,0 +1,108 @@
+import hashlib
+import re
+import time
+
+from django.core.cache import cache
+from django.db import connection, transaction
+from django.db.models import Case, Count, FloatField, Max, Q, Value, When
+
+NON_DIGITS = re.compile(r'\D')
+PHONE_LIKE = re.compile(r'^[\d\s+()-]*\d[\d\s+()-]*$')
+
+ALL_CLIENTS = 'all'
+CLIENT_LIST_VERSION_KEY = 'clients:list:version:{}'
+
+
+def normalize_phone(phone_number):
+    """
+    Digits only, with a leading 233 country code folded to the local 0 prefix
+    (local numbers always start with 0, so a leading 233 is never part of one).
+    example '+233 55 000 1111' -> '0550001111'
+    """
+    if not phone_number:
+        return None
+    digits = NON_DIGITS.sub('', phone_number)
+    if digits.startswith('233'):
+        digits = '0' + digits[3:]
+    return digits or None
+
+
+def search_clients(queryset, term):
+    """
+    Indexed search on name (trigram on PostgreSQL) and phone prefix, best match first.
+    """
+    term = term.strip()
+    digits = normalize_phone(term) if PHONE_LIKE.match(term) else None
+
+    matches = Q()
+    if digits:
+        matches |= Q(phone_digits__startswith=digits)
+        phone_rank = Case(When(phone_digits__startswith=digits, then=Value(1.0)), default=Value(0.0),
+                          output_field=FloatField())
+    else:
+        phone_rank = Value(0.0, output_field=FloatField())
+
+    if connection.vendor == 'postgresql':
+        from django.contrib.postgres.search import TrigramSimilarity
+
+        # % and %> (word similarity) are what client_name_trgm_idx serves; icontains compiles to
+        # UPPER(name) LIKE, which it cannot, and one such arm turns the OR into a seq scan
+        matches |= Q(name__trigram_similar=term) | Q(name__trigram_word_similar=term)
+        name_rank = TrigramSimilarity('name', term)
+    else:
+        matches |= Q(name__icontains=term)
+        name_rank = Case(
+            When(name__iexact=term, then=Value(1.0)),
+            When(name__istartswith=term, then=Value(0.8)),
+            When(name__icontains=term, then=Value(0.5)),
+            default=Value(0.0),
+            output_field=FloatField(),
+        )
+
+    return queryset.filter(matches).annotate(rank=name_rank + phone_rank).order_by('-rank', 'name', 'id')
+
+
+def _fresh_version():
+    # Nanosecond write time: unique per bump, never reused after eviction, and usable as Last-Modified
+    return time.time_ns()
+
+
+def client_list_version(scope):
+    return cache.get_or_set(CLIENT_LIST_VERSION_KEY.format(scope), _fresh_version, timeout=None)
+
+
+def client_list_state(queryset):
+    """
+    A version for a client list read from the database, for when no shared cache
+    holds one: the count catches deletes, the latest updated_at every other write.
+    One aggregate over the (collector, updated_at) index. Returns (version, last_modified).
+    """
+    state = queryset.order_by().aggregate(count=Count('pk'), last_modified=Max('updated_at'))
+    last_modified = state['last_modified']
+    return f"{state['count']}:{last_modified.isoformat() if last_modified else ''}", last_modified
+
+
+def client_list_cache_key(scope, version, request):
+    """
+    Cache key for one page of a client list: scope (collector id or 'all'),
+    the scope's current version and the request's query params.
+    """
+    params = sorted(request.query_params.lists())
+    digest = hashlib.md5(f"{request.get_host()}|{params}".encode()).hexdigest()
+    return f"clients:list:{scope}:{version}:{digest}"
+
+
+def _bump(scopes):
+    version = _fresh_version()
+    cache.set_many({CLIENT_LIST_VERSION_KEY.format(scope): version for scope in scopes}, timeout=None)
+
+
+def invalidate_client_lists(*collector_ids):
+    """
+    Bump the list version of each collector (and of the admin-wide list).
+    Bumped again on commit, so a read that raced the open transaction
+    cannot leave pre-commit data cached under the current version.
+    """
+    scopes = {str(collector_id) for collector_id in collector_ids if collector_id} | {ALL_CLIENTS}
+    _bump(scopes)
+    transaction.on_commit(lambda: _bump(scopes))
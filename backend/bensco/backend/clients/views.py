@@ -1,14 +1,20 @@
+import uuid
+
 from django.shortcuts import render
 from .models import ClientModel, AddressModel
 from rest_framework.decorators import api_view, permission_classes
 from rest_framework import status
 from rest_framework.permissions import IsAuthenticated
 from rest_framework.response import Response
-from .serializers import ClientModelSerializer
+from .serializers import ClientModelSerializer, ClientReadSerializer
 from django.shortcuts import get_object_or_404
 from django.db.models import Q
 from rest_framework.pagination import PageNumberPagination
 from .serializers import AddressModelSerializer
+from .utils import ALL_CLIENTS, client_list_cache_key, client_list_state, client_list_version, search_clients
+from core.conditional import conditional_get, make_etag, set_validators, timestamp_to_datetime
+from django.conf import settings
+from django.core.cache import cache
 # Create your views here.
 
 
@@ -48,29 +54,62 @@ def create_client_view(request):
 @permission_classes([IsAuthenticated])
 def get_clients_view(request):
     search = request.query_params.get('search')
+    search_mode = request.query_params.get('search_mode')
     collector_id = request.query_params.get('collector')
 
     # Admin sees all, Collector sees only their clients
     if request.user.role == 'admin':
-        clients = ClientModel.objects.all()
         if collector_id:
-            clients = clients.filter(collector__id=collector_id)
+            try:
+                collector_id = str(uuid.UUID(collector_id))
+            except ValueError:
+                return Response({"error": "Invalid collector id."}, status=status.HTTP_400_BAD_REQUEST)
+        scope = collector_id or ALL_CLIENTS
     elif request.user.role == 'collector':
-        clients = ClientModel.objects.filter(collector=request.user)
+        scope = str(request.user.id)
     else:
         return Response({'detail': 'Unauthorized role.'}, status=403)
 
+    clients = ClientModel.objects.all()
+    if request.user.role == 'admin':
+        if collector_id:
+            clients = clients.filter(collector__id=collector_id)
+    else:
+        clients = clients.filter(collector=request.user)
+
+    if settings.CLIENT_LIST_CACHE:
+        # The scope's version changes on every client write, so it validates without a query
+        version = client_list_version(scope)
+        last_modified = timestamp_to_datetime(version)
+    else:
+        # No shared cache to hold the version: validate from the rows, one aggregate query
+        version, last_modified = client_list_state(clients)
+    cache_key = client_list_cache_key(scope, version, request)
+    etag = make_etag(cache_key)
+    not_modified = conditional_get(request, etag, last_modified)
+    if not_modified is not None:
+        return not_modified
+
+    # Served from cache until a client in this scope is written
+    cached = cache.get(cache_key) if settings.CLIENT_LIST_CACHE else None
+    if cached is not None:
+        return set_validators(Response(cached), etag, last_modified)
+
     # Apply search (name or phone)
-    if search:
+    if search and search_mode == 'ranked':
+        clients = search_clients(clients, search)
+    elif search:
         clients = clients.filter(
             Q(name__icontains=search) |
             Q(phone_number__icontains=search)
         )
 
     paginator = PageNumberPagination()
-    paginted_clients = paginator.paginate_queryset(clients, request)
-    serializer = ClientModelSerializer(paginted_clients, many=True)
-    return paginator.get_paginated_response(serializer.data)
+    paginted_clients = paginator.paginate_queryset(ClientReadSerializer.values(clients), request)
+    response = paginator.get_paginated_response(ClientReadSerializer.to_representation(paginted_clients))
+    if settings.CLIENT_LIST_CACHE:
+        cache.set(cache_key, response.data, settings.CLIENT_LIST_CACHE_TIMEOUT)
+    return set_validators(response, etag, last_modified)
 
 #Get Client Info
 @api_view(['GET', 'PATCH'])
@@ -78,8 +117,12 @@ def client_profile(request, id):
     client_data = get_object_or_404(ClientModel, id=id)
 
     if request.method == "GET":
+        etag = make_etag(client_data.id, client_data.updated_at.isoformat())
+        not_modified = conditional_get(request, etag, client_data.updated_at)
+        if not_modified is not None:
+            return not_modified
         serialized = ClientModelSerializer(instance=client_data)
-        return Response(data=serialized.data, status=status.HTTP_200_OK)
+        return set_validators(Response(data=serialized.data, status=status.HTTP_200_OK), etag, client_data.updated_at)
     elif request.method == "PATCH":
         data = request.data
         client_data = ClientModel.objects.get(id=id)
@@ -4,3 +4,7 @@ from django.apps import AppConfig
 class ContributionsConfig(AppConfig):
     default_auto_field = 'django.db.models.BigAutoField'
     name = 'contributions'
+
+    def ready(self):
+        # Registers the post_delete receiver that keeps rollups in step with deletes
+        from . import signals  # noqa: F401
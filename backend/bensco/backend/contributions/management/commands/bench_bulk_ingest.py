@@ -0,0 +1,49 @@
+import time
+import uuid
+
+from django.core.management.base import BaseCommand
+from django.db import connection, transaction
+from django.test.utils import CaptureQueriesContext
+from django.utils import timezone
+
+from clients.models import ClientModel
+from contributions.utils import bulk_ingest_contributions
+from users.models import UserModel
+
+
+class Command(BaseCommand):
+    help = "Benchmark bulk contribution ingest: queries and time per batch size (rolled back)."
+
+    def add_arguments(self, parser):
+        parser.add_argument('--sizes', default='10,100,300,500', help="Comma separated batch sizes")
+        parser.add_argument('--clients', type=int, default=50, help="Distinct clients per batch")
+
+    def handle(self, *args, **options):
+        sizes = [int(size) for size in options['sizes'].split(',')]
+
+        with transaction.atomic():
+            tag = uuid.uuid4().hex[:8]
+            collector = UserModel.objects.create_user(
+                username=f'bench-{tag}', email=f'bench-{tag}@example.com', password='x', role='collector'
+            )
+            clients = ClientModel.objects.bulk_create([
+                ClientModel(
+                    name=f'Bench Client {i}',
+                    unique_code=f'BENCH-{tag}-{i}',
+                    collector=collector,
+                    amount_daily=5,
+                    start_date=timezone.now().date(),
+                )
+                for i in range(options['clients'])
+            ])
+
+            self.stdout.write(f"{'rows':>8} {'queries':>8} {'ms':>10}")
+            for size in sizes:
+                rows = [{'client': str(clients[i % len(clients)].id), 'amount': '5.00'} for i in range(size)]
+                with CaptureQueriesContext(connection) as ctx:
+                    started = time.perf_counter()
+                    bulk_ingest_contributions(rows, collector=collector)
+                    elapsed = (time.perf_counter() - started) * 1000
+                self.stdout.write(f"{size:>8} {len(ctx.captured_queries):>8} {elapsed:>10.1f}")
+
+            transaction.set_rollback(True)
@@ -0,0 +1,14 @@
+from django.core.management.base import BaseCommand
+
+from contributions.rollups import rebuild_collector_totals
+
+
+class Command(BaseCommand):
+    help = "Rebuild the per-collector daily totals behind the collector summary from the contributions ledger."
+
+    def add_arguments(self, parser):
+        parser.add_argument('--collector', action='append', help="Only rebuild this collector id (repeatable)")
+
+    def handle(self, *args, **options):
+        written = rebuild_collector_totals(collector_ids=options['collector'])
+        self.stdout.write(self.style.SUCCESS(f"Wrote {written} collector-day total(s)."))
@@ -0,0 +1,33 @@
+# Generated by Django 5.2.3 on 2026-10-18 08:30
+
+from django.conf import settings
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('clients', '0002_initial'),
+        ('contributions', '0003_rename_cycle_contributionmodel_savings_cycle_and_more'),
+        ('savings', '0003_savingscyclemodel_total_days_covered'),
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='contributionmodel',
+            index=models.Index(fields=['-created_at', '-id'], name='contrib_created_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='contributionmodel',
+            index=models.Index(fields=['collector', '-created_at', '-id'], name='contrib_collector_created_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='contributionmodel',
+            index=models.Index(fields=['client', '-created_at', '-id'], name='contrib_client_created_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='contributionmodel',
+            index=models.Index(fields=['savings_cycle', '-created_at', '-id'], name='contrib_cycle_created_idx'),
+        ),
+    ]
@@ -0,0 +1,18 @@
+# Generated by Django 5.2.3 on 2026-10-18 08:30
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('contributions', '0004_contribution_listing_indexes'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='contributionmodel',
+            name='idempotency_key',
+            field=models.UUIDField(blank=True, help_text='Client-generated id so offline retries are not stored twice', null=True, unique=True),
+        ),
+    ]
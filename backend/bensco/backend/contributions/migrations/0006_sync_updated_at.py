@@ -0,0 +1,32 @@
+# Generated by Django 5.2.3 on 2026-10-18 08:32
+
+from django.conf import settings
+from django.db import migrations, models
+
+
+def backfill_updated_at(apps, schema_editor):
+    ContributionModel = apps.get_model('contributions', 'ContributionModel')
+    ContributionModel.objects.update(updated_at=models.F('created_at'))
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('clients', '0003_sync_updated_at'),
+        ('contributions', '0005_contributionmodel_idempotency_key'),
+        ('savings', '0004_sync_updated_at'),
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='contributionmodel',
+            name='updated_at',
+            field=models.DateTimeField(auto_now=True),
+        ),
+        migrations.RunPython(backfill_updated_at, migrations.RunPython.noop),
+        migrations.AddIndex(
+            model_name='contributionmodel',
+            index=models.Index(fields=['updated_at', 'id'], name='contrib_updated_idx'),
+        ),
+    ]
@@ -0,0 +1,21 @@
+# Generated by Django 5.2.3 on 2026-10-18 08:45
+
+from django.conf import settings
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('clients', '0004_client_search'),
+        ('contributions', '0006_sync_updated_at'),
+        ('savings', '0006_savingscyclemodel_expected_end_date'),
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='contributionmodel',
+            index=models.Index(fields=['client', 'updated_at'], name='contrib_client_updated_idx'),
+        ),
+    ]
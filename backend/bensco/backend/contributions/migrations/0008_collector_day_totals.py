@@ -0,0 +1,42 @@
+# Generated by Django 5.2.3 on 2026-10-18 09:33
+
+import django.db.models.deletion
+from django.conf import settings
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('clients', '0004_client_search'),
+        ('contributions', '0007_client_updated_index'),
+        ('savings', '0006_savingscyclemodel_expected_end_date'),
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='CollectorDayTotalModel',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('date', models.DateField()),
+                ('amount_collected', models.DecimalField(decimal_places=2, default=0, max_digits=12)),
+                ('contribution_count', models.PositiveIntegerField(default=0)),
+                ('clients_paid', models.PositiveIntegerField(default=0)),
+                ('updated_at', models.DateTimeField(auto_now=True)),
+            ],
+        ),
+        migrations.AddIndex(
+            model_name='contributionmodel',
+            index=models.Index(fields=['client', 'date'], name='contrib_client_date_idx'),
+        ),
+        migrations.AddField(
+            model_name='collectordaytotalmodel',
+            name='collector',
+            field=models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='day_totals', to=settings.AUTH_USER_MODEL),
+        ),
+        migrations.AddConstraint(
+            model_name='collectordaytotalmodel',
+            constraint=models.UniqueConstraint(fields=('collector', 'date'), name='one_total_per_collector_day'),
+        ),
+    ]
@@ -0,0 +1,39 @@
+# Generated by Django 5.2.3 on 2026-10-18 11:05
+
+from django.db import migrations
+from django.db.models import Count, Sum
+
+
+def backfill_day_totals(apps, schema_editor):
+    # A frozen copy of contributions.rollups.rebuild_collector_totals, so later changes there leave this migration alone
+    ContributionModel = apps.get_model('contributions', 'ContributionModel')
+    CollectorDayTotalModel = apps.get_model('contributions', 'CollectorDayTotalModel')
+    ledger = (
+        ContributionModel.objects
+        .filter(client__collector_id__isnull=False)
+        .values('client__collector_id', 'date')
+        .annotate(amount=Sum('amount'), count=Count('pk'), clients=Count('client_id', distinct=True))
+        .order_by()
+    )
+    CollectorDayTotalModel.objects.all().delete()
+    CollectorDayTotalModel.objects.bulk_create(
+        (
+            CollectorDayTotalModel(
+                collector_id=row['client__collector_id'], date=row['date'], amount_collected=row['amount'],
+                contribution_count=row['count'], clients_paid=row['clients'],
+            )
+            for row in ledger.iterator(chunk_size=2000)
+        ),
+        batch_size=1000,
+    )
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('contributions', '0008_collector_day_totals'),
+    ]
+
+    operations = [
+        migrations.RunPython(backfill_day_totals, migrations.RunPython.noop),
+    ]
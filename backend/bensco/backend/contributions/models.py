@@ -18,7 +18,7 @@
 #         return f"{self.client.name} - {self.amount} on {self.paid_for_date}"
 
 
-from django.db import models
+from django.db import models, transaction
 from users.models import UserModel
 from clients.models import ClientModel
 from savings.models import SavingsCycleModel
@@ -41,31 +41,97 @@ class ContributionModel(models.Model):
     days_covered = models.PositiveIntegerField(default=1)
     note = models.TextField(blank=True, null=True)
     is_override = models.BooleanField(default=False)
+    idempotency_key = models.UUIDField(
+        unique=True, null=True, blank=True, help_text="Client-generated id so offline retries are not stored twice"
+    )
 
     created_at = models.DateTimeField(auto_now_add=True)
+    updated_at = models.DateTimeField(auto_now=True)
 
-    def save(self, *args, **kwargs):
-        # Automatically link or create a savings cycle
-        if not self.savings_cycle:
-            self.savings_cycle = get_active_or_create_savings_cycle(self.client)
+    class Meta:
+        indexes = [
+            models.Index(fields=['updated_at', 'id'], name='contrib_updated_idx'),
+            # Keyset pagination on (created_at, id), optionally narrowed by one filter
+            models.Index(fields=['-created_at', '-id'], name='contrib_created_idx'),
+            models.Index(fields=['collector', '-created_at', '-id'], name='contrib_collector_created_idx'),
+            models.Index(fields=['client', '-created_at', '-id'], name='contrib_client_created_idx'),
+            # Covers count/max(updated_at) per client for conditional GETs
+            models.Index(fields=['client', 'updated_at'], name='contrib_client_updated_idx'),
+            models.Index(fields=['savings_cycle', '-created_at', '-id'], name='contrib_cycle_created_idx'),
+            # Did this client already pay on this date (collector rollups)
+            models.Index(fields=['client', 'date'], name='contrib_client_date_idx'),
+        ]
 
+    def apply_days_covered(self):
         # Calculate days covered if fixed amount and bulk
-        if self.client.is_fixed and self.amount >= self.client.amount_daily:
-            self.days_covered = int(self.amount / self.client.amount_daily)
-            self.is_bulk = self.days_covered > 1
+        daily = self.client.amount_daily
+        if self.client.is_fixed and daily:
+            amount, daily = Decimal(str(self.amount)), Decimal(str(daily))
+            if amount >= daily:
+                self.days_covered = int(amount / daily)
+                self.is_bulk = self.days_covered > 1
+
+    def save(self, *args, **kwargs):
+        self.apply_days_covered()
+
+        previous = None
+        if not self._state.adding:
+            previous = ContributionModel.objects.filter(pk=self.pk).values(
+                'amount', 'days_covered', 'savings_cycle_id', 'date', 'client__collector_id'
+            ).first()
+
+        # local import to avoid circular import
+        from .rollups import rebuild_collector_totals, record_contributions
+
+        with transaction.atomic():
+            # Automatically link or create a savings cycle, locked until this insert commits
+            if not self.savings_cycle_id:
+                self.savings_cycle = get_active_or_create_savings_cycle(self.client)
 
-        super().save(*args, **kwargs)
+            super().save(*args, **kwargs)
 
-        # Optional: update the cycle total or trigger closure
-        # self.savings_cycle.check_and_close()
+            # Collector-day totals: add a new row, recompute the days an edit touched
+            if previous:
+                rebuild_collector_totals(
+                    collector_ids={previous['client__collector_id'], self.client.collector_id} - {None},
+                    days={previous['date'], self.date},
+                )
+            else:
+                record_contributions([self])
 
-        if self.savings_cycle:
-            total_days = sum(
-                self.savings_cycle.contributions.values_list('days_covered', flat=True)
-            )
-            if total_days >= self.savings_cycle.cycle_length:
-                self.savings_cycle.status = SavingsCycleModel.Status.CLOSED
-                self.savings_cycle.save()
+            # Keep the cycle's running totals in step with the ledger
+            if previous and previous['savings_cycle_id'] != self.savings_cycle_id:
+                SavingsCycleModel.adjust_totals(
+                    previous['savings_cycle_id'], -previous['amount'], -previous['days_covered']
+                )
+                previous = None
+            if previous:
+                amount = Decimal(str(self.amount)) - previous['amount']
+                days = self.days_covered - previous['days_covered']
+            else:
+                amount, days = self.amount, self.days_covered
+            self.savings_cycle.apply_contribution(amount, days)
+
+        self.savings_cycle.check_and_close()
 
     def __str__(self):
         return f"{self.client.name} - GHS {self.amount} on {self.date}"
+
+
+class CollectorDayTotalModel(models.Model):
+    # Running totals of one collector's contributions on one date, keyed by the
+    # client's collector; maintained by contributions.rollups
+    collector = models.ForeignKey(UserModel, on_delete=models.CASCADE, related_name='day_totals')
+    date = models.DateField()
+    amount_collected = models.DecimalField(max_digits=12, decimal_places=2, default=0)
+    contribution_count = models.PositiveIntegerField(default=0)
+    clients_paid = models.PositiveIntegerField(default=0)
+    updated_at = models.DateTimeField(auto_now=True)
+
+    class Meta:
+        constraints = [
+            models.UniqueConstraint(fields=['collector', 'date'], name='one_total_per_collector_day'),
+        ]
+
+    def __str__(self):
+        return f"{self.collector_id} on {self.date}: {self.amount_collected}"
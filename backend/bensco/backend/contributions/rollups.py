@@ -0,0 +1,108 @@
+from collections import defaultdict
+from decimal import Decimal
+
+from django.db import transaction
+from django.db.models import Case, Count, DecimalField, F, PositiveIntegerField, Q, Sum, Value, When
+from django.utils import timezone
+
+from .models import CollectorDayTotalModel, ContributionModel
+
+
+def record_contributions(contributions):
+    """
+    Add newly inserted contributions to their collector-day totals with a fixed
+    number of queries per batch. Each contribution needs `client` loaded, since
+    totals are keyed by the client's collector.
+    """
+    to_date = ContributionModel._meta.get_field('date').to_python  # the default, timezone.now, is a datetime
+    deltas = {}
+    clients = defaultdict(set)
+    for contribution in contributions:
+        key = (contribution.client.collector_id, to_date(contribution.date))
+        amount, count = deltas.get(key, (Decimal('0'), 0))
+        deltas[key] = (amount + Decimal(str(contribution.amount)), count + 1)
+        clients[key].add(contribution.client_id)
+    if not deltas:
+        return
+
+    # A client counts as paid once per date: skip those with an earlier contribution that day
+    client_ids = {client_id for ids in clients.values() for client_id in ids}
+    paid_before = set(
+        ContributionModel.objects
+        .filter(client_id__in=client_ids, date__in={day for _, day in deltas})
+        .exclude(pk__in=[contribution.pk for contribution in contributions])
+        .values_list('client_id', 'date')
+        .distinct()
+    )
+    newly_paid = {
+        key: sum((client_id, key[1]) not in paid_before for client_id in ids) for key, ids in clients.items()
+    }
+    _apply_deltas({key: (amount, count, newly_paid[key]) for key, (amount, count) in deltas.items()})
+
+
+def _apply_deltas(deltas):
+    CollectorDayTotalModel.objects.bulk_create(
+        [CollectorDayTotalModel(collector_id=collector_id, date=day) for collector_id, day in deltas],
+        ignore_conflicts=True,
+    )
+
+    # One UPDATE adds every key's delta, as in contributions.utils._apply_cycle_totals
+    def case(index, output_field):
+        return Case(
+            *[
+                When(collector_id=collector_id, date=day, then=Value(values[index]))
+                for (collector_id, day), values in deltas.items()
+            ],
+            output_field=output_field,
+        )
+
+    keys = Q()
+    for collector_id, day in deltas:
+        keys |= Q(collector_id=collector_id, date=day)
+    CollectorDayTotalModel.objects.filter(keys).update(
+        amount_collected=F('amount_collected') + case(0, DecimalField(max_digits=12, decimal_places=2)),
+        contribution_count=F('contribution_count') + case(1, PositiveIntegerField()),
+        clients_paid=F('clients_paid') + case(2, PositiveIntegerField()),
+        updated_at=timezone.now(),
+    )
+
+
+def ledger_day_totals(queryset=None):
+    # Collector-day totals recomputed from the contributions ledger, one grouped query
+    if queryset is None:
+        queryset = ContributionModel.objects.all()
+    return (
+        queryset
+        .filter(client__collector_id__isnull=False)
+        .values('client__collector_id', 'date')
+        .annotate(amount=Sum('amount'), count=Count('pk'), clients=Count('client_id', distinct=True))
+        .order_by()
+    )
+
+
+def rebuild_collector_totals(collector_ids=None, days=None):
+    """
+    Replace collector-day totals with values recomputed from the ledger, for all
+    of them or only the given collectors and/or dates. Used after edits and
+    deletes, and to repair drift. Returns the number of totals written.
+    """
+    contributions = ContributionModel.objects.all()
+    totals = CollectorDayTotalModel.objects.all()
+    if collector_ids is not None:
+        contributions = contributions.filter(client__collector_id__in=collector_ids)
+        totals = totals.filter(collector_id__in=collector_ids)
+    if days is not None:
+        contributions = contributions.filter(date__in=days)
+        totals = totals.filter(date__in=days)
+
+    rows = [
+        CollectorDayTotalModel(
+            collector_id=row['client__collector_id'], date=row['date'], amount_collected=row['amount'],
+            contribution_count=row['count'], clients_paid=row['clients'],
+        )
+        for row in ledger_day_totals(contributions)
+    ]
+    with transaction.atomic():
+        totals.delete()
+        CollectorDayTotalModel.objects.bulk_create(rows, batch_size=1000)
+    return len(rows)
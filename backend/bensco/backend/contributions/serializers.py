@@ -1,10 +1,8 @@
 from rest_framework import serializers
 from .models import ContributionModel
-from savings.models import SavingsCycleModel
-from clients.models import ClientModel
-from django.utils import timezone
-from datetime import timedelta
-from core.utils import check_and_close
+from django.db import transaction
+from core.readpath import ReadField, ValuesSerializer, as_datetime, as_decimal, as_str
+from core.utils import get_active_or_create_savings_cycle
 class ContributionModelSerializer(serializers.ModelSerializer):
     client_name = serializers.CharField(source='client.name', read_only=True)
     collector_username = serializers.CharField(source='collector.username', read_only=True)
@@ -22,76 +20,36 @@ class ContributionModelSerializer(serializers.ModelSerializer):
             # 'contribution_date',
             'savings_cycle',
             'is_override',
+            'idempotency_key',
             'created_at'
         ]
         read_only_fields = ['id', 'created_at', 'client_name', 'collector_username', 'savings_cycle']
 
-    # def create(self, validated_data):
-    #     client = validated_data.get('client')
-    #     today = timezone.now().date()
+    @staticmethod
+    def setup_eager_loading(queryset):
+        # client_name and collector_username read the related rows
+        return queryset.select_related('client', 'collector')
 
-    #     # Match enum status value
-    #     active_status = SavingsCycleModel.Status.ACTIVE
-
-    #     active_cycle = SavingsCycleModel.objects.filter(
-    #         client=client,
-    #         status=active_status,
-    #         start_date__lte=today,
-    #         end_date__gte=today
-    #     ).first()
-
-    #     # Create new cycle if none found or logically expired
-    #     if not active_cycle:
-    #         start_date = today
-    #         cycle_length = 31  # could be dynamic later
-    #         end_date = start_date + timedelta(days=cycle_length)
-
-    #         active_cycle = SavingsCycleModel.objects.create(
-    #             client=client,
-    #             start_date=start_date,
-    #             cycle_length=cycle_length,
-    #             end_date=end_date,
-    #             status=active_status
-    #         )
-
-    #     validated_data['savings_cycle'] = active_cycle
-    #     contribution = super().create(validated_data)
-
-    #     # Check if the cycle should now be closed (after this contribution)
-    #     contribution.savings_cycle.check_and_close()
-
-    #     return contribution
     def create(self, validated_data):
-        client = validated_data.get('client')
-        today = timezone.now().date()
-
-        active_status = SavingsCycleModel.Status.ACTIVE
-
-        active_cycle = SavingsCycleModel.objects.filter(
-            client=client,
-            status=active_status,
-            start_date__lte=today,
-            end_date__gte=today
-        ).first()
-
-        if not active_cycle:
-            start_date = today
-            cycle_length = 31
-            end_date = start_date + timedelta(days=cycle_length)
-
-            active_cycle = SavingsCycleModel.objects.create(
-                client=client,
-                start_date=start_date,
-                cycle_length=cycle_length,
-                end_date=end_date,
-                status=active_status
-            )
-
-        validated_data['savings_cycle'] = active_cycle
-
-        contribution = super().create(validated_data)
-
-        # Add this line
-        active_cycle.check_and_close()
-
-        return contribution
\ No newline at end of file
+        # The cycle stays locked until the insert commits, so it cannot close in between;
+        # ContributionModel.save updates its totals and runs the close check
+        with transaction.atomic():
+            validated_data['savings_cycle'] = get_active_or_create_savings_cycle(validated_data['client'])
+            return super().create(validated_data)
+
+
+class ContributionReadSerializer(ValuesSerializer):
+    # Same output as ContributionModelSerializer, from .values() rows
+    fields = (
+        ReadField('id', 'id', as_str),
+        ReadField('client', 'client_id'),
+        ReadField('client_name', 'client__name'),
+        ReadField('collector', 'collector_id'),
+        ReadField('collector_username', 'collector__username', omit_without='collector_id'),
+        ReadField('amount', 'amount', as_decimal(2)),
+        ReadField('days_covered', 'days_covered'),
+        ReadField('savings_cycle', 'savings_cycle_id'),
+        ReadField('is_override', 'is_override'),
+        ReadField('idempotency_key', 'idempotency_key', as_str),
+        ReadField('created_at', 'created_at', as_datetime),
+    )
@@ -0,0 +1,29 @@
+from decimal import Decimal
+
+from django.db.models.signals import post_delete
+from django.dispatch import receiver
+
+from clients.models import ClientModel
+from savings.models import SavingsCycleModel
+
+from .models import ContributionModel
+from .rollups import rebuild_collector_totals
+
+
+@receiver(post_delete, sender=ContributionModel, dispatch_uid='contributions.reverse_deleted_contribution')
+def reverse_deleted_contribution(sender, instance, **kwargs):
+    """
+    Take a deleted contribution back out of its cycle's running totals and its
+    collector-day total. A receiver rather than ContributionModel.delete(), so
+    QuerySet.delete() and the client -> contribution cascade are covered too;
+    Django sends post_delete for every row those remove, inside their transaction.
+    """
+    SavingsCycleModel.adjust_totals(instance.savings_cycle_id, -Decimal(str(instance.amount)), -instance.days_covered)
+
+    # On a cascade the client row goes after its contributions, so it can still be read here
+    if ContributionModel.client.is_cached(instance):
+        collector_id = instance.client.collector_id
+    else:
+        collector_id = ClientModel.objects.filter(pk=instance.client_id).values_list('collector_id', flat=True).first()
+    if collector_id:
+        rebuild_collector_totals(collector_ids=[collector_id], days=[instance.date])
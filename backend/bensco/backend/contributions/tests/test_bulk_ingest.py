@@ -0,0 +1,112 @@
+from django.db import connection
+from django.test import TestCase, skipUnlessDBFeature
+from django.test.utils import CaptureQueriesContext
+from django.urls import reverse
+from django.utils import timezone
+from rest_framework.test import APIClient
+
+from users.models import UserModel
+from clients.models import ClientModel
+from contributions.models import ContributionModel
+from contributions.utils import bulk_ingest_contributions
+from savings.models import SavingsCycleModel
+
+
+class BulkIngestTestCase(TestCase):
+    def setUp(self):
+        self.collector = UserModel.objects.create_user(
+            username='collector1',
+            email='collector1@example.com',
+            password='password123',
+            role='collector'
+        )
+        self.clients = [
+            ClientModel.objects.create(
+                name=f"Client {i}",
+                collector=self.collector,
+                amount_daily=5.0,
+                start_date=timezone.now().date(),
+                is_fixed=True
+            )
+            for i in range(5)
+        ]
+
+    def _rows(self, n):
+        return [
+            {'client': str(self.clients[i % len(self.clients)].id), 'amount': '5.00'}
+            for i in range(n)
+        ]
+
+    def test_creates_contributions_and_one_cycle_per_client(self):
+        results = bulk_ingest_contributions(self._rows(10), collector=self.collector)
+
+        self.assertTrue(all(result['status'] == 'accepted' for result in results))
+        self.assertEqual(ContributionModel.objects.count(), 10)
+        self.assertEqual(
+            SavingsCycleModel.objects.filter(status=SavingsCycleModel.Status.ACTIVE).count(),
+            len(self.clients)
+        )
+
+    def test_reuses_existing_active_cycle(self):
+        cycle = SavingsCycleModel.objects.create(client=self.clients[0], collector=self.collector)
+        results = bulk_ingest_contributions(
+            [{'client': str(self.clients[0].id), 'amount': '10.00'}],
+            collector=self.collector
+        )
+        self.assertEqual(results[0]['savings_cycle'], cycle.id)
+        self.assertEqual(results[0]['days_covered'], 2)
+        cycle.refresh_from_db()
+        self.assertEqual(cycle.total_days_covered, 2)
+        self.assertEqual(cycle.total_saved, 10)
+
+    @skipUnlessDBFeature('has_select_for_update')
+    def test_active_cycles_are_locked_until_the_insert_commits(self):
+        SavingsCycleModel.objects.create(client=self.clients[0], collector=self.collector)
+        with CaptureQueriesContext(connection) as queries:
+            bulk_ingest_contributions(self._rows(1), collector=self.collector)
+
+        cycle_table = SavingsCycleModel._meta.db_table
+        reads = [query['sql'] for query in queries if query['sql'].startswith('SELECT') and cycle_table in query['sql']]
+        self.assertTrue(reads)
+        self.assertIn('FOR UPDATE', reads[0])
+
+    def test_cycle_closes_and_rolls_over(self):
+        SavingsCycleModel.objects.create(client=self.clients[0], collector=self.collector, cycle_length=3)
+        rows = [{'client': str(self.clients[0].id), 'amount': '5.00'} for _ in range(4)]
+        results = bulk_ingest_contributions(rows, collector=self.collector)
+
+        cycles = SavingsCycleModel.objects.filter(client=self.clients[0]).order_by('created_at')
+        self.assertEqual(cycles.count(), 2)
+        self.assertEqual(cycles[0].status, SavingsCycleModel.Status.CLOSED)
+        self.assertEqual(cycles[1].status, SavingsCycleModel.Status.ACTIVE)
+        self.assertEqual(results[3]['savings_cycle'], cycles[1].id)
+
+    def test_invalid_rows_are_rejected_individually(self):
+        rows = self._rows(2) + [
+            {'client': 'not-a-uuid', 'amount': '5.00'},
+            {'client': '00000000-0000-0000-0000-000000000000', 'amount': '5.00'},
+        ]
+        results = bulk_ingest_contributions(rows, collector=self.collector)
+
+        self.assertEqual([result['status'] for result in results], ['accepted', 'accepted', 'rejected', 'rejected'])
+        self.assertEqual(ContributionModel.objects.count(), 2)
+
+    def test_query_count_is_constant(self):
+        # Kept below SQLite's bound-parameter limit so bulk_create issues one INSERT per table
+        counts = []
+        for size in (10, 25, 50):
+            with CaptureQueriesContext(connection) as ctx:
+                bulk_ingest_contributions(self._rows(size), collector=self.collector)
+            counts.append(len(ctx.captured_queries))
+            ContributionModel.objects.all().delete()
+            SavingsCycleModel.objects.all().delete()
+        self.assertEqual(len(set(counts)), 1, counts)
+
+    def test_bulk_endpoint_returns_per_row_results(self):
+        api = APIClient()
+        api.force_authenticate(user=self.collector)
+        response = api.post(reverse('bulk_write'), self._rows(3), format='json')
+
+        self.assertEqual(response.status_code, 201)
+        self.assertEqual(response.data['accepted'], 3)
+        self.assertEqual(len(response.data['results']), 3)
@@ -0,0 +1,193 @@
+from datetime import timedelta
+from decimal import Decimal
+from io import StringIO
+
+from django.core.management import call_command
+from django.db import connection
+from django.test import TestCase
+from django.test.utils import CaptureQueriesContext
+from django.urls import reverse
+from django.utils import timezone
+from rest_framework.test import APIClient
+
+from users.models import UserModel
+from clients.models import ClientModel
+from contributions.models import CollectorDayTotalModel, ContributionModel
+from contributions.rollups import rebuild_collector_totals
+from contributions.utils import bulk_ingest_contributions
+from savings.models import SavingsCycleModel
+
+
+class CollectorTotalsTestCase(TestCase):
+    def setUp(self):
+        self.collector = UserModel.objects.create_user(
+            username='collector1', email='collector1@example.com', password='password123', role='collector'
+        )
+        self.other = UserModel.objects.create_user(
+            username='collector2', email='collector2@example.com', password='password123', role='collector'
+        )
+        self.today = timezone.now().date()
+        self.clients = [
+            ClientModel.objects.create(
+                name=f"Client {i}", collector=self.collector, amount_daily=5, start_date=self.today
+            )
+            for i in range(4)
+        ]
+        self.stranger = ClientModel.objects.create(
+            name="Not mine", collector=self.other, amount_daily=5, start_date=self.today
+        )
+
+    def _totals(self, collector=None, day=None):
+        return CollectorDayTotalModel.objects.filter(
+            collector=collector or self.collector, date=day or self.today
+        ).values('amount_collected', 'contribution_count', 'clients_paid').first()
+
+    def _snapshot(self):
+        return sorted(
+            CollectorDayTotalModel.objects.values_list(
+                'collector_id', 'date', 'amount_collected', 'contribution_count', 'clients_paid'
+            )
+        )
+
+    def test_create_adds_to_todays_total(self):
+        ContributionModel.objects.create(client=self.clients[0], collector=self.collector, amount=5)
+        ContributionModel.objects.create(client=self.clients[0], collector=self.collector, amount=10)
+        ContributionModel.objects.create(client=self.clients[1], collector=self.collector, amount=5)
+
+        self.assertEqual(
+            self._totals(),
+            {'amount_collected': Decimal('20.00'), 'contribution_count': 3, 'clients_paid': 2}
+        )
+        self.assertIsNone(self._totals(collector=self.other))
+
+    def test_bulk_ingest_adds_to_totals(self):
+        ContributionModel.objects.create(client=self.clients[0], collector=self.collector, amount=5)
+        rows = [{'client': str(client.id), 'amount': '5.00'} for client in self.clients + self.clients[:2]]
+        rows.append({'client': str(self.stranger.id), 'amount': '5.00'})
+        bulk_ingest_contributions(rows, collector=self.collector)
+
+        self.assertEqual(
+            self._totals(),
+            {'amount_collected': Decimal('35.00'), 'contribution_count': 7, 'clients_paid': 4}
+        )
+        self.assertEqual(self._totals(collector=self.other)['contribution_count'], 1)
+
+    def test_edit_and_delete_recompute_the_days_they_touch(self):
+        yesterday = self.today - timedelta(days=1)
+        contribution = ContributionModel.objects.create(client=self.clients[0], collector=self.collector, amount=5)
+        ContributionModel.objects.create(client=self.clients[1], collector=self.collector, amount=5)
+
+        contribution.amount = 15
+        contribution.date = yesterday
+        contribution.save()
+        self.assertEqual(
+            self._totals(),
+            {'amount_collected': Decimal('5.00'), 'contribution_count': 1, 'clients_paid': 1}
+        )
+        self.assertEqual(self._totals(day=yesterday)['amount_collected'], Decimal('15.00'))
+
+        contribution.delete()
+        self.assertIsNone(self._totals(day=yesterday))
+
+    def test_queryset_and_cascade_deletes_recompute_totals(self):
+        for client in self.clients:
+            ContributionModel.objects.create(client=client, collector=self.collector, amount=5)
+        ContributionModel.objects.create(client=self.clients[0], collector=self.collector, amount=10)
+
+        ContributionModel.objects.filter(client=self.clients[1]).delete()
+        self.assertEqual(
+            self._totals(),
+            {'amount_collected': Decimal('25.00'), 'contribution_count': 4, 'clients_paid': 3}
+        )
+
+        self.clients[0].delete()
+        self.assertEqual(
+            self._totals(),
+            {'amount_collected': Decimal('10.00'), 'contribution_count': 2, 'clients_paid': 2}
+        )
+
+    def test_rebuild_matches_incremental_totals(self):
+        for client in self.clients + [self.stranger]:
+            ContributionModel.objects.create(client=client, collector=self.collector, amount=5)
+        bulk_ingest_contributions(
+            [{'client': str(client.id), 'amount': '10.00'} for client in self.clients[:3]],
+            collector=self.collector,
+        )
+        incremental = self._snapshot()
+
+        CollectorDayTotalModel.objects.update(amount_collected=0, contribution_count=0, clients_paid=0)
+        call_command('rebuild_collector_totals', stdout=StringIO())
+        self.assertEqual(self._snapshot(), incremental)
+        self.assertEqual(rebuild_collector_totals(collector_ids=[self.other.pk]), 1)
+        self.assertEqual(self._snapshot(), incremental)
+
+
+class CollectorSummaryViewTestCase(TestCase):
+    def setUp(self):
+        self.collector = UserModel.objects.create_user(
+            username='collector1', email='collector1@example.com', password='password123', role='collector'
+        )
+        self.admin = UserModel.objects.create_user(
+            username='admin1', email='admin1@example.com', password='password123', role='admin'
+        )
+        self.today = timezone.now().date()
+        self.clients = [
+            ClientModel.objects.create(
+                name=f"Client {i}", collector=self.collector, amount_daily=5, start_date=self.today
+            )
+            for i in range(3)
+        ]
+        closing = SavingsCycleModel.objects.create(client=self.clients[0], cycle_length=31)
+        SavingsCycleModel.objects.filter(pk=closing.pk).update(expected_end_date=self.today + timedelta(days=3))
+        ContributionModel.objects.create(
+            client=self.clients[0], collector=self.collector, savings_cycle=closing, amount=10
+        )
+        ContributionModel.objects.create(client=self.clients[1], collector=self.collector, amount=5)
+
+        self.api = APIClient()
+        self.url = reverse('collector_summary')
+
+    def test_collector_gets_own_summary(self):
+        self.api.force_authenticate(user=self.collector)
+        response = self.api.get(self.url)
+
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(Decimal(response.data['collected_today']), Decimal('15.00'))
+        self.assertEqual(response.data['contributions_today'], 2)
+        self.assertEqual(response.data['clients_paid_today'], 2)
+        self.assertEqual(response.data['clients_outstanding'], 1)
+        self.assertEqual(response.data['total_clients'], 3)
+        self.assertEqual(response.data['active_cycles'], 2)
+        self.assertEqual(response.data['cycles_closing_this_week'], 1)
+
+    def test_admin_picks_a_collector(self):
+        self.api.force_authenticate(user=self.admin)
+        self.assertEqual(self.api.get(self.url).status_code, 400)
+        self.assertEqual(self.api.get(self.url, {'collector': str(self.admin.pk)}).status_code, 404)
+
+        response = self.api.get(self.url, {'collector': str(self.collector.pk)})
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(response.data['clients_paid_today'], 2)
+
+    def test_other_roles_are_forbidden(self):
+        client_user = UserModel.objects.create_user(
+            username='client1', email='client1@example.com', password='password123', role='client'
+        )
+        self.api.force_authenticate(user=client_user)
+        self.assertEqual(self.api.get(self.url).status_code, 403)
+
+    def test_query_count_does_not_grow_with_history(self):
+        self.api.force_authenticate(user=self.collector)
+
+        def count_queries():
+            with CaptureQueriesContext(connection) as queries:
+                self.assertEqual(self.api.get(self.url).status_code, 200)
+            return len(queries)
+
+        before = count_queries()
+        for days_ago in range(1, 31):
+            ContributionModel.objects.create(
+                client=self.clients[2], collector=self.collector, amount=5,
+                date=self.today - timedelta(days=days_ago)
+            )
+        self.assertEqual(count_queries(), before)
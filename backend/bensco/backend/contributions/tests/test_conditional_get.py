@@ -0,0 +1,57 @@
+from django.db import connection
+from django.test import TestCase
+from django.test.utils import CaptureQueriesContext
+from django.urls import reverse
+from django.utils import timezone
+from rest_framework.test import APIClient
+
+from clients.models import ClientModel
+from contributions.models import ContributionModel
+from users.models import UserModel
+
+
+class ClientContributionsConditionalGetTestCase(TestCase):
+    def setUp(self):
+        self.collector = UserModel.objects.create_user(
+            username='collector1',
+            email='collector1@example.com',
+            password='password123',
+            role='collector'
+        )
+        self.client_obj = ClientModel.objects.create(
+            name='Ama Owusu',
+            collector=self.collector,
+            amount_daily=5.0,
+            start_date=timezone.now().date(),
+        )
+        self.contribution = ContributionModel.objects.create(
+            client=self.client_obj, collector=self.collector, amount=5
+        )
+        self.url = reverse('client_contributions', args=[self.client_obj.id])
+        self.api = APIClient()
+        self.api.force_authenticate(user=self.collector)
+
+    def test_not_modified_in_one_query(self):
+        first = self.api.get(self.url)
+        self.assertEqual(first.status_code, 200)
+        self.assertEqual(len(first.data), 1)
+
+        with CaptureQueriesContext(connection) as ctx:
+            response = self.api.get(self.url, HTTP_IF_NONE_MATCH=first['ETag'])
+        self.assertEqual(response.status_code, 304)
+        self.assertEqual(len(ctx.captured_queries), 1)
+
+    def test_new_and_deleted_contributions_change_etag(self):
+        etag = self.api.get(self.url)['ETag']
+        other = ContributionModel.objects.create(client=self.client_obj, collector=self.collector, amount=5)
+        response = self.api.get(self.url, HTTP_IF_NONE_MATCH=etag)
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(len(response.data), 2)
+
+        etag = response['ETag']
+        other.delete()
+        self.assertEqual(self.api.get(self.url, HTTP_IF_NONE_MATCH=etag).status_code, 200)
+
+    def test_unknown_client_is_404(self):
+        response = self.api.get(reverse('client_contributions', args=['00000000-0000-0000-0000-000000000000']))
+        self.assertEqual(response.status_code, 404)
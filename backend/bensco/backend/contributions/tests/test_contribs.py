@@ -1,10 +1,12 @@
 from django.test import TestCase
 from django.utils import timezone
 from datetime import timedelta
+from unittest import mock
 
 from users.models import UserModel
 from clients.models import ClientModel, AddressModel
 from contributions.models import ContributionModel
+from contributions.serializers import ContributionModelSerializer
 from savings.models import SavingsCycleModel
 
 
@@ -68,3 +70,23 @@ class ContributionCycleClosureTestCase(TestCase):
 
         self.cycle.refresh_from_db()
         self.assertEqual(self.cycle.status, SavingsCycleModel.Status.CLOSED)
+
+    def test_serializer_closes_the_cycle_once_and_rolls_over(self):
+        def create():
+            serializer = ContributionModelSerializer(
+                data={'client': str(self.client.id), 'collector': str(self.collector.id), 'amount': '5.00'}
+            )
+            self.assertTrue(serializer.is_valid(), serializer.errors)
+            return serializer.save()
+
+        with mock.patch.object(
+            SavingsCycleModel, 'check_and_close', autospec=True, side_effect=SavingsCycleModel.check_and_close
+        ) as check_and_close:
+            contributions = [create() for _ in range(3)]
+        self.assertEqual(check_and_close.call_count, 3)
+
+        self.cycle.refresh_from_db()
+        self.assertEqual(self.cycle.status, SavingsCycleModel.Status.CLOSED)
+        self.assertEqual(self.cycle.total_days_covered, 3)
+        self.assertTrue(all(contribution.savings_cycle_id == self.cycle.id for contribution in contributions))
+        self.assertNotEqual(create().savings_cycle_id, self.cycle.id)
@@ -0,0 +1,113 @@
+from datetime import timedelta
+
+from django.db import connection
+from django.test import TestCase
+from django.test.utils import CaptureQueriesContext
+from django.urls import reverse
+from django.utils import timezone
+from rest_framework.test import APIClient
+
+from users.models import UserModel
+from clients.models import ClientModel
+from contributions.models import ContributionModel
+from savings.models import SavingsCycleModel
+
+
+class ListContributionsTestCase(TestCase):
+    def setUp(self):
+        self.collector = UserModel.objects.create_user(
+            username='collector1',
+            email='collector1@example.com',
+            password='password123',
+            role='collector'
+        )
+        self.other_collector = UserModel.objects.create_user(
+            username='collector2',
+            email='collector2@example.com',
+            password='password123',
+            role='collector'
+        )
+        self.client_a = ClientModel.objects.create(
+            name="Client A", collector=self.collector, amount_daily=5, start_date=timezone.now().date()
+        )
+        self.client_b = ClientModel.objects.create(
+            name="Client B", collector=self.other_collector, amount_daily=5, start_date=timezone.now().date()
+        )
+        self.cycle_a = SavingsCycleModel.objects.create(client=self.client_a, cycle_length=100)
+        self.cycle_b = SavingsCycleModel.objects.create(client=self.client_b, cycle_length=100)
+
+        today = timezone.now().date()
+        for i in range(12):
+            ContributionModel.objects.create(
+                client=self.client_a, collector=self.collector, savings_cycle=self.cycle_a,
+                amount=5, date=today - timedelta(days=i)
+            )
+        for i in range(3):
+            ContributionModel.objects.create(
+                client=self.client_b, collector=self.other_collector, savings_cycle=self.cycle_b,
+                amount=5, date=today
+            )
+
+        self.api = APIClient()
+        self.api.force_authenticate(user=self.collector)
+        self.url = reverse('list_contributions')
+
+    def _walk(self, params):
+        ids, url, pages = [], self.url, 0
+        while url:
+            response = self.api.get(url, params if pages == 0 else None)
+            self.assertEqual(response.status_code, 200)
+            ids.extend(row['id'] for row in response.data['results'])
+            url = response.data['next']
+            pages += 1
+        return ids, pages
+
+    def test_cursor_walk_returns_every_row_once(self):
+        ids, pages = self._walk({'page_size': 4})
+        self.assertEqual(len(ids), 15)
+        self.assertEqual(len(set(ids)), 15)
+        self.assertEqual(pages, 4)
+
+    def test_filters(self):
+        ids, _ = self._walk({'collector': str(self.other_collector.id)})
+        self.assertEqual(len(ids), 3)
+        ids, _ = self._walk({'client': str(self.client_a.id)})
+        self.assertEqual(len(ids), 12)
+        ids, _ = self._walk({'cycle': str(self.cycle_b.id)})
+        self.assertEqual(len(ids), 3)
+
+        today = timezone.now().date()
+        ids, _ = self._walk({
+            'client': str(self.client_a.id),
+            'date_from': str(today - timedelta(days=4)),
+            'date_to': str(today - timedelta(days=1)),
+        })
+        self.assertEqual(len(ids), 4)
+
+    def test_invalid_filters_are_rejected(self):
+        self.assertEqual(self.api.get(self.url, {'client': 'nope'}).status_code, 400)
+        self.assertEqual(self.api.get(self.url, {'date_from': '2024-13-40'}).status_code, 400)
+
+    def test_later_pages_cost_the_same_queries(self):
+        first = self.api.get(self.url, {'page_size': 4})
+        with self.assertNumQueries(1):
+            self.api.get(first.data['next'])
+
+    def test_rows_sharing_a_timestamp_are_keyed_on_id(self):
+        # Bulk ingest stamps a whole batch with one created_at
+        ContributionModel.objects.update(created_at=timezone.now())
+        ids, pages = self._walk({'page_size': 4})
+        self.assertEqual(len(set(ids)), 15)
+        self.assertEqual(pages, 4)
+
+        first = self.api.get(self.url, {'page_size': 4})
+        with CaptureQueriesContext(connection) as queries:
+            second = self.api.get(first.data['next'])
+        self.assertNotIn('OFFSET', queries[0]['sql'].upper())
+
+        previous = self.api.get(second.data['previous'])
+        self.assertEqual(
+            [row['id'] for row in previous.data['results']],
+            [row['id'] for row in first.data['results']],
+        )
+        self.assertIsNone(previous.data['previous'])
@@ -0,0 +1,66 @@
+import uuid
+from django.db import connection
+from django.test import TestCase
+from django.test.utils import CaptureQueriesContext
+from django.urls import reverse
+from django.utils import timezone
+from rest_framework.test import APIClient
+
+from users.models import UserModel
+from clients.models import ClientModel
+from contributions.models import ContributionModel
+from savings.models import SavingsCycleModel
+
+
+class SyncContributionsTestCase(TestCase):
+    def setUp(self):
+        self.collector = UserModel.objects.create_user(
+            username='collector1',
+            email='collector1@example.com',
+            password='password123',
+            role='collector'
+        )
+        self.client_record = ClientModel.objects.create(
+            name="Client A", collector=self.collector, amount_daily=5, start_date=timezone.now().date()
+        )
+        self.api = APIClient()
+        self.api.force_authenticate(user=self.collector)
+        self.url = reverse('sync_contributions')
+
+    def _row(self, key=None):
+        return {'client': str(self.client_record.id), 'amount': '5.00', 'idempotency_key': str(key or uuid.uuid4())}
+
+    def test_retry_is_reported_as_duplicate(self):
+        rows = [self._row(), self._row()]
+        first = self.api.post(self.url, rows, format='json')
+        self.assertEqual(first.status_code, 200)
+        self.assertEqual(first.data['accepted'], 2)
+
+        retry = self.api.post(self.url, rows + [self._row()], format='json')
+        self.assertEqual([r['status'] for r in retry.data['results']], ['duplicate', 'duplicate', 'accepted'])
+        self.assertEqual(retry.data['results'][0]['id'], first.data['results'][0]['id'])
+        self.assertEqual(ContributionModel.objects.count(), 3)
+
+        cycle = SavingsCycleModel.objects.get(client=self.client_record)
+        self.assertEqual(cycle.total_days_covered, 3)
+
+    def test_repeated_key_within_batch_is_stored_once(self):
+        key = uuid.uuid4()
+        response = self.api.post(self.url, [self._row(key), self._row(key)], format='json')
+        self.assertEqual([r['status'] for r in response.data['results']], ['accepted', 'duplicate'])
+        self.assertEqual(ContributionModel.objects.count(), 1)
+
+    def test_rows_without_key_are_rejected(self):
+        row = self._row()
+        del row['idempotency_key']
+        response = self.api.post(self.url, [row], format='json')
+        self.assertEqual(response.data['rejected'], 1)
+        self.assertEqual(ContributionModel.objects.count(), 0)
+
+    def test_duplicate_lookup_is_one_query_per_batch(self):
+        rows = [self._row() for _ in range(20)]
+        self.api.post(self.url, rows, format='json')
+        with CaptureQueriesContext(connection) as ctx:
+            self.api.post(self.url, rows, format='json')
+        # A fully duplicate retry only runs the key lookup
+        self.assertEqual(len(ctx.captured_queries), 1)
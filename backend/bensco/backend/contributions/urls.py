@@ -6,4 +6,5 @@ urlpatterns = [
     path('create/', views.create_contribution, name='create_contribution'),
     path('client/<uuid:client_id>/', views.client_contributions, name='client_contributions'),
     path('create/bulk/', views.create_bulk_contributions, name='bulk_write'),
+    path('sync/', views.sync_contributions, name='sync_contributions'),
 ]
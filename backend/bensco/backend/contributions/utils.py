@@ -0,0 +1,237 @@
+from datetime import date, timedelta
+from decimal import Decimal
+
+from django.db import IntegrityError, transaction
+from django.db.models import Case, DecimalField, F, PositiveIntegerField, Value, When
+from django.utils import timezone
+from rest_framework import serializers
+
+from clients.models import ClientModel
+from savings.models import SavingsCycleModel
+from users.models import UserModel
+from .models import ContributionModel
+from .rollups import record_contributions
+
+
+class BulkContributionRowSerializer(serializers.Serializer):
+    # Plain fields only: related rows are resolved once per batch, not per row
+    client = serializers.UUIDField()
+    collector = serializers.UUIDField(required=False, allow_null=True)
+    amount = serializers.DecimalField(max_digits=10, decimal_places=2, min_value=Decimal('0.01'))
+    days_covered = serializers.IntegerField(min_value=1, required=False, default=1)
+    date = serializers.DateField(required=False)
+    note = serializers.CharField(required=False, allow_blank=True, allow_null=True)
+    is_override = serializers.BooleanField(required=False, default=False)
+    idempotency_key = serializers.UUIDField(required=False, allow_null=True)
+
+
+class SyncContributionRowSerializer(BulkContributionRowSerializer):
+    idempotency_key = serializers.UUIDField()
+
+
+def _rejected(index, errors, key=None):
+    return {'index': index, 'status': 'rejected', 'idempotency_key': key, 'errors': errors}
+
+
+def _cycle_is_due(cycle, days_paid, today):
+    days_passed = (today - (cycle.start_date or today)).days
+    return days_paid >= cycle.cycle_length or days_passed >= cycle.cycle_length
+
+
+def _apply_cycle_totals(batch_totals):
+    # One UPDATE adds every affected cycle's batch delta to its running totals
+    amount_case = Case(
+        *[When(pk=pk, then=Value(amount)) for pk, (amount, _) in batch_totals.items()],
+        output_field=DecimalField(max_digits=10, decimal_places=2),
+    )
+    days_case = Case(
+        *[When(pk=pk, then=Value(days)) for pk, (_, days) in batch_totals.items()],
+        output_field=PositiveIntegerField(),
+    )
+    SavingsCycleModel.objects.filter(pk__in=batch_totals.keys()).update(
+        total_saved=F('total_saved') + amount_case,
+        total_days_covered=F('total_days_covered') + days_case,
+        updated_at=timezone.now(),
+    )
+
+
+def bulk_ingest_contributions(rows, collector=None, row_serializer_class=BulkContributionRowSerializer):
+    """
+    Insert a batch of contributions using a fixed number of queries.
+    Returns one result per input row, in the same order as `rows`.
+    Rows whose idempotency_key is already stored come back as duplicates.
+    """
+    try:
+        return _ingest(rows, collector, row_serializer_class)
+    except IntegrityError:
+        # A concurrent sync stored one of our keys first; on retry it is reported as a duplicate
+        return _ingest(rows, collector, row_serializer_class)
+
+
+def _ingest(rows, collector, row_serializer_class):
+    results = [None] * len(rows)
+    parsed = []
+    for index, row in enumerate(rows):
+        row_serializer = row_serializer_class(data=row)
+        if row_serializer.is_valid():
+            parsed.append((index, row_serializer.validated_data))
+        else:
+            results[index] = _rejected(index, row_serializer.errors)
+
+    # One indexed lookup for every key in the batch
+    keys = [data['idempotency_key'] for _, data in parsed if data.get('idempotency_key')]
+    stored = {}
+    if keys:
+        stored = dict(
+            ContributionModel.objects.filter(idempotency_key__in=keys).values_list('idempotency_key', 'id')
+        )
+
+    valid = []
+    first_seen = {}
+    repeated = []
+    for index, data in parsed:
+        key = data.get('idempotency_key')
+        if key and key in stored:
+            results[index] = {'index': index, 'status': 'duplicate', 'idempotency_key': key, 'id': stored[key]}
+        elif key and key in first_seen:
+            # Repeated within the same batch: the first occurrence wins
+            repeated.append((index, first_seen[key]))
+        else:
+            if key:
+                first_seen[key] = index
+            valid.append((index, data))
+
+    if valid:
+        _insert(valid, results, collector)
+
+    for index, first in repeated:
+        if results[first]['status'] == 'accepted':
+            results[index] = {
+                'index': index,
+                'status': 'duplicate',
+                'idempotency_key': results[first]['idempotency_key'],
+                'id': results[first]['id'],
+            }
+        else:
+            results[index] = dict(results[first], index=index)
+    return results
+
+
+def _insert(valid, results, collector):
+    collector_ids = {data['collector'] for _, data in valid if data.get('collector')}
+    collectors = UserModel.objects.in_bulk(collector_ids) if collector_ids else {}
+
+    today = date.today()
+
+    with transaction.atomic():
+        # Row locks on the batch's clients, taken in pk order, keep concurrent
+        # writers from opening a second active cycle for the same client
+        locked = ClientModel.objects.select_for_update().filter(
+            pk__in={data['client'] for _, data in valid}
+        ).order_by('pk')
+        clients = {client.pk: client for client in locked}
+
+        # One query for every active cycle in the batch, with its running totals,
+        # locked as in get_active_or_create_savings_cycle so the close sweep
+        # cannot close a cycle before these contributions commit
+        active_cycles = (
+            SavingsCycleModel.objects
+            .select_for_update()
+            .filter(client_id__in=clients.keys(), status=SavingsCycleModel.Status.ACTIVE)
+            .order_by('created_at')
+        )
+        cycles = {}
+        days_paid = {}
+        for cycle in active_cycles:
+            if cycle.client_id not in cycles:
+                cycles[cycle.client_id] = cycle
+                days_paid[cycle.pk] = cycle.total_days_covered
+
+        new_cycles = []
+        closed_cycles = []
+        contributions = []
+        batch_totals = {}
+
+        for index, data in valid:
+            client = clients.get(data['client'])
+            key = data.get('idempotency_key')
+            if client is None:
+                results[index] = _rejected(index, {'client': ['Client not found.']}, key)
+                continue
+
+            row_collector = collector
+            if data.get('collector'):
+                row_collector = collectors.get(data['collector'])
+                if row_collector is None:
+                    results[index] = _rejected(index, {'collector': ['Collector not found.']}, key)
+                    continue
+
+            cycle = cycles.get(client.pk)
+            if cycle is None:
+                cycle = SavingsCycleModel(client=client, collector_id=client.collector_id)
+                cycle.expected_end_date = today + timedelta(days=cycle.cycle_length)
+                cycles[client.pk] = cycle
+                days_paid[cycle.pk] = 0
+                new_cycles.append(cycle)
+
+            contribution = ContributionModel(
+                client=client,
+                collector=row_collector,
+                savings_cycle=cycle,
+                amount=data['amount'],
+                days_covered=data['days_covered'],
+                date=data.get('date') or timezone.now().date(),
+                note=data.get('note'),
+                is_override=data['is_override'],
+                idempotency_key=key,
+            )
+            contribution.apply_days_covered()
+            contributions.append(contribution)
+
+            days_paid[cycle.pk] += contribution.days_covered
+            amount, days = batch_totals.get(cycle.pk, (Decimal('0'), 0))
+            batch_totals[cycle.pk] = (amount + contribution.amount, days + contribution.days_covered)
+            if _cycle_is_due(cycle, days_paid[cycle.pk], today):
+                # Later rows for this client roll over into a fresh cycle
+                if cycle._state.adding:
+                    cycle.status = SavingsCycleModel.Status.CLOSED
+                    cycle.end_date = today
+                else:
+                    closed_cycles.append(cycle)
+                del cycles[client.pk]
+
+            results[index] = {
+                'index': index,
+                'status': 'accepted',
+                'idempotency_key': key,
+                'id': contribution.id,
+                'client': client.pk,
+                'savings_cycle': cycle.pk,
+                'days_covered': contribution.days_covered,
+            }
+
+        # Close before inserting replacements so at most one cycle per client is ever active
+        if closed_cycles:
+            SavingsCycleModel.objects.filter(
+                pk__in=[cycle.pk for cycle in closed_cycles],
+                status=SavingsCycleModel.Status.ACTIVE,
+            ).update(
+                status=SavingsCycleModel.Status.CLOSED,
+                end_date=today,
+                updated_at=timezone.now(),
+            )
+        if new_cycles:
+            SavingsCycleModel.objects.bulk_create(new_cycles)
+        if contributions:
+            ContributionModel.objects.bulk_create(contributions)
+            _apply_cycle_totals(batch_totals)
+            record_contributions(contributions)
+
+
+
+def summarize_ingest(results):
+    summary = {'accepted': 0, 'duplicate': 0, 'rejected': 0}
+    for result in results:
+        summary[result['status']] += 1
+    summary['results'] = results
+    return summary
@@ -2,10 +2,17 @@ from rest_framework.decorators import api_view, permission_classes
 from rest_framework.permissions import IsAuthenticated
 from rest_framework.response import Response
 from rest_framework import status
+from django.db.models import Count, Max
+from django.utils.dateparse import parse_date
+import uuid
 
 from .models import ContributionModel
-from .serializers import ContributionModelSerializer
+from .serializers import ContributionModelSerializer, ContributionReadSerializer
+from .utils import SyncContributionRowSerializer, bulk_ingest_contributions, summarize_ingest
 from clients.models import ClientModel
+from core.conditional import conditional_get, make_etag, set_validators
+from core.pagination import CreatedAtCursorPagination
+from core.renderers import stream_json_array
 
 
 @api_view(['POST'])
@@ -24,31 +31,89 @@ def create_contribution(request):
 @permission_classes([IsAuthenticated])
 def create_bulk_contributions(request):
     data = request.data
-    serialized = ContributionModelSerializer(data=data, many=True)
-    if not serialized.is_valid():
-        return Response(data=serialized.error_messages,status=status.HTTP_400_BAD_REQUEST)
-    serialized.save()
-    return Response(data=serialized.data, status=status.HTTP_201_CREATED)
+    if not isinstance(data, list):
+        return Response({"error": "Expected a list of contributions."}, status=status.HTTP_400_BAD_REQUEST)
+
+    results = bulk_ingest_contributions(data, collector=request.user)
+    summary = summarize_ingest(results)
+    response_status = status.HTTP_400_BAD_REQUEST if summary['rejected'] == len(results) else status.HTTP_201_CREATED
+    return Response(summary, status=response_status)
+
+
+@api_view(['POST'])
+@permission_classes([IsAuthenticated])
+def sync_contributions(request):
+    # Offline sync: every row carries a client-generated idempotency_key, so retries are safe
+    data = request.data
+    if not isinstance(data, list):
+        return Response({"error": "Expected a list of contributions."}, status=status.HTTP_400_BAD_REQUEST)
+
+    results = bulk_ingest_contributions(
+        data, collector=request.user, row_serializer_class=SyncContributionRowSerializer
+    )
+    return Response(summarize_ingest(results), status=status.HTTP_200_OK)
 
 
 
 @api_view(['GET'])
 @permission_classes([IsAuthenticated])
 def list_contributions(request):
-    contributions = ContributionModel.objects.all().order_by('-created_at')
-    serializer = ContributionModelSerializer(contributions, many=True)
-    return Response(serializer.data, status=status.HTTP_200_OK)
+    params = request.query_params
+    contributions = ContributionReadSerializer.values(ContributionModel.objects.all())
+
+    # Each filter lines up with a (<column>, created_at, id) index
+    for param, field in (('collector', 'collector_id'), ('client', 'client_id'), ('cycle', 'savings_cycle_id')):
+        if params.get(param):
+            try:
+                contributions = contributions.filter(**{field: uuid.UUID(params[param])})
+            except ValueError:
+                return Response({"error": f"Invalid {param} id."}, status=status.HTTP_400_BAD_REQUEST)
+
+    for param, lookup in (('date_from', 'date__gte'), ('date_to', 'date__lte')):
+        if params.get(param):
+            try:
+                value = parse_date(params[param])
+            except ValueError:
+                value = None
+            if value is None:
+                return Response({"error": f"{param} must be YYYY-MM-DD."}, status=status.HTTP_400_BAD_REQUEST)
+            contributions = contributions.filter(**{lookup: value})
+
+    if params.get('stream') in ('1', 'true') and request.user.role == 'admin':
+        # Unpaginated export: rows are encoded as the database cursor yields them
+        rows = contributions.order_by('-created_at', '-id').iterator(chunk_size=2000)
+        return stream_json_array(ContributionReadSerializer.iter_representation(rows))
+
+    paginator = CreatedAtCursorPagination()
+    page = paginator.paginate_queryset(contributions, request)
+    return paginator.get_paginated_response(ContributionReadSerializer.to_representation(page))
 
 
 
 @api_view(['GET'])
 @permission_classes([IsAuthenticated])
 def client_contributions(request, client_id):
-    try:
-        client = ClientModel.objects.get(id=client_id)
-    except ClientModel.DoesNotExist:
+    # One query for the validators: the client's own stamp plus its contributions' count and latest write
+    rows = (
+        ClientModel.objects.filter(id=client_id)
+        .values('updated_at')
+        .annotate(contribution_count=Count('contributions'), last_contribution=Max('contributions__updated_at'))
+    )
+    if not rows:
         return Response({"error": "Client not found."}, status=status.HTTP_404_NOT_FOUND)
+    validators = rows[0]
+
+    last_modified = max(filter(None, (validators['updated_at'], validators['last_contribution'])))
+    etag = make_etag(
+        client_id, validators['updated_at'].isoformat(), validators['contribution_count'],
+        validators['last_contribution'] and validators['last_contribution'].isoformat(),
+    )
+    not_modified = conditional_get(request, etag, last_modified)
+    if not_modified is not None:
+        return not_modified
 
-    contributions = ContributionModel.objects.filter(client=client).order_by('-date')
+    contributions = ContributionModelSerializer.setup_eager_loading(
+        ContributionModel.objects.filter(client_id=client_id).order_by('-date')
+    )
     serializer = ContributionModelSerializer(contributions, many=True)
-    return Response(serializer.data, status=status.HTTP_200_OK)
+    return set_validators(Response(serializer.data, status=status.HTTP_200_OK), etag, last_modified)
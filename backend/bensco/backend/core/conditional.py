@@ -0,0 +1,39 @@
+import hashlib
+from datetime import datetime, timezone
+
+from django.utils.cache import get_conditional_response, patch_cache_control, patch_vary_headers
+from django.utils.http import http_date, quote_etag
+
+
+def make_etag(*parts):
+    # Weak: equal validators mean the same data, not necessarily byte-identical bodies
+    return 'W/' + quote_etag(hashlib.md5('|'.join(map(str, parts)).encode()).hexdigest())
+
+
+def timestamp_to_datetime(nanoseconds):
+    return datetime.fromtimestamp(nanoseconds / 1e9, tz=timezone.utc)
+
+
+def _seconds(last_modified):
+    return int(last_modified.timestamp()) if last_modified else None
+
+
+def conditional_get(request, etag, last_modified=None):
+    """
+    Evaluate If-None-Match / If-Modified-Since (and If-Match / If-Unmodified-Since)
+    against cheap validators. Returns the 304/412 response to send, or None to carry on.
+    """
+    response = get_conditional_response(request, etag=etag, last_modified=_seconds(last_modified))
+    if response is not None:
+        set_validators(response, etag, last_modified)
+    return response
+
+
+def set_validators(response, etag, last_modified=None):
+    response['ETag'] = etag
+    if last_modified:
+        response['Last-Modified'] = http_date(_seconds(last_modified))
+    # Per-user data: clients may keep it, but must revalidate before reuse
+    patch_cache_control(response, private=True, no_cache=True)
+    patch_vary_headers(response, ['Authorization'])
+    return response
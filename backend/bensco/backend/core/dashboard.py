@@ -0,0 +1,45 @@
+from datetime import timedelta
+from decimal import Decimal
+
+from django.db.models import Count, Q
+from django.utils import timezone
+
+from clients.models import ClientModel
+from contributions.models import CollectorDayTotalModel
+from savings.models import SavingsCycleModel
+
+# Active cycles whose expected end falls within this many days count as closing this week
+CLOSING_WINDOW_DAYS = 6
+
+
+def collector_summary(collector, today=None):
+    """
+    Dashboard figures for one collector's book in three indexed queries: today's
+    totals come from the collector-day rollup, so the cost does not grow with
+    the contributions history.
+    """
+    today = today or timezone.now().date()
+    totals = (
+        CollectorDayTotalModel.objects.filter(collector=collector, date=today)
+        .values('amount_collected', 'contribution_count', 'clients_paid')
+        .first()
+    ) or {'amount_collected': Decimal('0.00'), 'contribution_count': 0, 'clients_paid': 0}
+    total_clients = ClientModel.objects.filter(collector=collector).count()
+    cycles = SavingsCycleModel.objects.filter(
+        client__collector=collector, status=SavingsCycleModel.Status.ACTIVE
+    ).aggregate(
+        active=Count('pk'),
+        closing=Count('pk', filter=Q(expected_end_date__lte=today + timedelta(days=CLOSING_WINDOW_DAYS))),
+    )
+
+    return {
+        'collector': collector.pk,
+        'date': today,
+        'collected_today': totals['amount_collected'],
+        'contributions_today': totals['contribution_count'],
+        'clients_paid_today': totals['clients_paid'],
+        'clients_outstanding': max(total_clients - totals['clients_paid'], 0),
+        'total_clients': total_clients,
+        'active_cycles': cycles['active'],
+        'cycles_closing_this_week': cycles['closing'],
+    }
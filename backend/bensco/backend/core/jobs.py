@@ -0,0 +1,144 @@
+import logging
+import threading
+import time
+import traceback
+from datetime import timedelta
+
+from django.conf import settings
+from django.db import DatabaseError, close_old_connections, transaction
+from django.db.models import F
+from django.utils import timezone
+from django.utils.module_loading import import_string
+
+from .models import JobModel
+
+logger = logging.getLogger(__name__)
+
+
+def job_name(func):
+    return func if isinstance(func, str) else f'{func.__module__}.{func.__qualname__}'
+
+
+def enqueue(func, payload=None, run_at=None, max_attempts=None):
+    """
+    Store a job that calls `func(**payload)` on a worker. `func` is a module-level
+    function or its dotted path and the payload must be JSON serializable.
+    Enqueued inside a transaction, the job is only visible to workers once it commits.
+    """
+    return JobModel.objects.create(
+        name=job_name(func),
+        payload=payload or {},
+        run_at=run_at or timezone.now(),
+        max_attempts=max_attempts or getattr(settings, 'JOB_MAX_ATTEMPTS', 5),
+    )
+
+
+def retry_delay(attempts):
+    # Exponential backoff: base, 2*base, 4*base, ... capped at JOB_RETRY_BACKOFF_MAX
+    base = getattr(settings, 'JOB_RETRY_BACKOFF', 30)
+    return timedelta(seconds=min(base * 2 ** (attempts - 1), getattr(settings, 'JOB_RETRY_BACKOFF_MAX', 3600)))
+
+
+def claim_jobs(worker_id, limit=1):
+    """
+    Mark up to `limit` due jobs RUNNING for `worker_id` and return them, oldest first.
+    On PostgreSQL, FOR UPDATE SKIP LOCKED lets concurrent workers claim disjoint
+    rows without waiting on each other.
+    """
+    now = timezone.now()
+    with transaction.atomic():
+        pks = list(
+            JobModel.objects.select_for_update(skip_locked=True)
+            .filter(status=JobModel.Status.PENDING, run_at__lte=now)
+            .order_by('run_at', 'pk')
+            .values_list('pk', flat=True)[:limit]
+        )
+        if not pks:
+            return []
+        # The status predicate stops a double claim on backends without row locks (SQLite)
+        JobModel.objects.filter(pk__in=pks, status=JobModel.Status.PENDING).update(
+            status=JobModel.Status.RUNNING,
+            locked_by=worker_id,
+            locked_at=now,
+            attempts=F('attempts') + 1,
+            updated_at=now,
+        )
+    return list(
+        JobModel.objects.filter(pk__in=pks, status=JobModel.Status.RUNNING, locked_by=worker_id)
+        .order_by('run_at', 'pk')
+    )
+
+
+def run_job(job):
+    """
+    Call a claimed job's function and record the outcome. A failure is retried
+    after retry_delay() until max_attempts, then the job is left FAILED.
+    Returns True on success.
+    """
+    try:
+        func = import_string(job.name)
+        func(**job.payload)
+    except Exception:
+        logger.exception("Job %s #%s failed (attempt %d of %d)", job.name, job.pk, job.attempts, job.max_attempts)
+        now = timezone.now()
+        if job.attempts >= job.max_attempts:
+            changes = {'status': JobModel.Status.FAILED}
+        else:
+            changes = {'status': JobModel.Status.PENDING, 'run_at': now + retry_delay(job.attempts)}
+        # Only the worker still holding the job records the outcome
+        JobModel.objects.filter(pk=job.pk, locked_by=job.locked_by, status=JobModel.Status.RUNNING).update(
+            locked_at=None, last_error=traceback.format_exc(), updated_at=now, **changes
+        )
+        return False
+
+    JobModel.objects.filter(pk=job.pk, locked_by=job.locked_by, status=JobModel.Status.RUNNING).update(
+        status=JobModel.Status.DONE, locked_at=None, last_error='', updated_at=timezone.now()
+    )
+    return True
+
+
+def requeue_stale_jobs(timeout=None):
+    """
+    Release RUNNING jobs whose worker has held them longer than `timeout` seconds
+    (JOB_LOCK_TIMEOUT), e.g. after a crash. Returns the number released.
+    """
+    timeout = timeout if timeout is not None else getattr(settings, 'JOB_LOCK_TIMEOUT', 600)
+    now = timezone.now()
+    stale = JobModel.objects.filter(status=JobModel.Status.RUNNING, locked_at__lt=now - timedelta(seconds=timeout))
+    failed = stale.filter(attempts__gte=F('max_attempts')).update(
+        status=JobModel.Status.FAILED, locked_at=None, last_error='Worker lock timed out', updated_at=now
+    )
+    retried = stale.update(status=JobModel.Status.PENDING, locked_at=None, run_at=now, updated_at=now)
+    return failed + retried
+
+
+def work(worker_id, stop=None, batch_size=10, poll_interval=1.0, once=False):
+    """
+    Claim and run due jobs until `stop` is set, sleeping `poll_interval` seconds
+    when none are due. With once=True, return as soon as the queue has nothing due.
+    Returns the number of jobs run.
+    """
+    stop = stop or threading.Event()
+    reap_every = getattr(settings, 'JOB_LOCK_TIMEOUT', 600) / 4
+    last_reap = 0
+    ran = 0
+    while not stop.is_set():
+        try:
+            jobs = claim_jobs(worker_id, batch_size)
+            if not jobs:
+                if once:
+                    break
+                if time.monotonic() - last_reap >= reap_every:
+                    requeue_stale_jobs()
+                    last_reap = time.monotonic()
+                stop.wait(poll_interval)
+                continue
+            for job in jobs:
+                run_job(job)
+                ran += 1
+        except DatabaseError:
+            # Keep the worker alive through a database outage; claimed jobs are released by requeue_stale_jobs
+            logger.exception("Job worker %s lost the database, retrying", worker_id)
+            close_old_connections()
+            stop.wait(poll_interval)
+    return ran
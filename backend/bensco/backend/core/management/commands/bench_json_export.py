@@ -0,0 +1,60 @@
+import time
+import tracemalloc
+import uuid
+from datetime import date
+from decimal import Decimal
+
+from django.core.management.base import BaseCommand
+from rest_framework.renderers import JSONRenderer
+
+from core.renderers import FastJSONRenderer, stream_json_array
+
+
+def _rows(count):
+    # Shaped like PayoutReadSerializer output
+    for i in range(count):
+        yield {
+            'id': str(uuid.UUID(int=i)),
+            'client': uuid.UUID(int=i + 1),
+            'cycle': uuid.UUID(int=i + 2),
+            'total_paid': '{:f}'.format(Decimal('155.00')),
+            'commission': '5.00',
+            'net_payout': '150.00',
+            'status': 'pending',
+            'requested_by': uuid.UUID(int=3),
+            'requested_by_role': 'collector',
+            'requested_on': date(2025, 7, 1).isoformat(),
+            'approved_by': None,
+            'approved_on': None,
+            'paid_on': None,
+            'version': 0,
+            'created_at': '2025-07-01T08:30:00.123456Z',
+        }
+
+
+class Command(BaseCommand):
+    help = "Benchmark JSON export: DRF renderer vs orjson renderer vs streamed array (time and peak memory)."
+
+    def add_arguments(self, parser):
+        parser.add_argument('--sizes', default='10000,100000', help="Comma separated row counts")
+
+    def handle(self, *args, **options):
+        sizes = [int(size) for size in options['sizes'].split(',')]
+        modes = [
+            ('drf', lambda n: JSONRenderer().render(list(_rows(n)))),
+            ('orjson', lambda n: FastJSONRenderer().render(list(_rows(n)))),
+            ('stream', lambda n: sum(len(chunk) for chunk in stream_json_array(_rows(n)).streaming_content)),
+        ]
+
+        self.stdout.write(f"{'mode':>8} {'rows':>8} {'ms':>9} {'peak MiB':>9}")
+        for size in sizes:
+            for name, run in modes:
+                started = time.perf_counter()
+                run(size)
+                elapsed = (time.perf_counter() - started) * 1000
+                # Traced separately: tracemalloc slows allocation-heavy code down a lot
+                tracemalloc.start()
+                run(size)
+                peak = tracemalloc.get_traced_memory()[1] / 2 ** 20
+                tracemalloc.stop()
+                self.stdout.write(f"{name:>8} {size:>8} {elapsed:>9.1f} {peak:>9.1f}")
@@ -0,0 +1,145 @@
+import socketserver
+import threading
+import time
+import uuid
+
+from django.conf import settings
+from django.core.mail import get_connection, send_mail
+from django.core.management.base import BaseCommand
+from django.db import transaction
+from django.test.utils import override_settings
+from django.utils import timezone
+
+from core.models import NotificationModel
+from core.notifications import dispatch_notifications, notify_admins
+from users.models import UserModel
+
+
+class SMTPStandInHandler(socketserver.StreamRequestHandler):
+    # Just enough SMTP for smtplib: every command succeeds, DATA is read and discarded
+    def handle(self):
+        server = self.server
+        time.sleep(server.connect_latency)
+        with server.lock:
+            server.connections += 1
+        self.wfile.write(b'220 bench ESMTP\r\n')
+        in_data = False
+        for line in self.rfile:
+            if in_data:
+                if line == b'.\r\n':
+                    in_data = False
+                    with server.lock:
+                        server.messages += 1
+                    self.wfile.write(b'250 OK\r\n')
+                continue
+            command = line[:4].upper()
+            if command == b'DATA':
+                in_data = True
+                self.wfile.write(b'354 End data with <CR><LF>.<CR><LF>\r\n')
+            elif command == b'QUIT':
+                self.wfile.write(b'221 Bye\r\n')
+                return
+            else:
+                self.wfile.write(b'250 OK\r\n')
+
+
+class SMTPStandIn(socketserver.ThreadingTCPServer):
+    daemon_threads = True
+    allow_reuse_address = True
+
+    def __init__(self, connect_latency):
+        super().__init__(('127.0.0.1', 0), SMTPStandInHandler)
+        self.connect_latency = connect_latency
+        self.lock = threading.Lock()
+        self.connections = 0
+        self.messages = 0
+
+    def reset(self):
+        self.connections = self.messages = 0
+
+
+class Command(BaseCommand):
+    help = (
+        "Benchmark admin notifications: one SMTP send per event vs the batched outbox, "
+        "against a local SMTP stand-in (rolled back)."
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument('--events', type=int, default=200, help="Password reset events in the burst")
+        parser.add_argument('--admins', type=int, default=3, help="Active admins to notify")
+        parser.add_argument(
+            '--connect-latency', type=float, default=0.05,
+            help="Seconds added to each SMTP connection, standing in for the TLS handshake and login"
+        )
+
+    def handle(self, *args, **options):
+        server = SMTPStandIn(options['connect_latency'])
+        threading.Thread(target=server.serve_forever, daemon=True).start()
+        host, port = server.server_address
+
+        def smtp_connection():
+            return get_connection(
+                'django.core.mail.backends.smtp.EmailBackend',
+                host=host, port=port, username='', password='', use_tls=False, use_ssl=False, timeout=10,
+            )
+
+        events = options['events']
+        try:
+            with transaction.atomic():
+                tag = uuid.uuid4().hex[:8]
+                admin_emails = []
+                for i in range(options['admins']):
+                    admin = UserModel.objects.create_user(
+                        username=f'bench-admin-{tag}-{i}', email=f'bench-admin-{tag}-{i}@example.com',
+                        password='x', role='admin'
+                    )
+                    admin_emails.append(admin.email)
+                # Only this run's admins receive mail
+                UserModel.objects.filter(role='admin').exclude(email__in=admin_emails).update(
+                    is_active=False, updated_at=timezone.now()
+                )
+
+                # Before: every event opens a connection and sends on the request
+                start = time.perf_counter()
+                for i in range(events):
+                    emails = list(
+                        UserModel.objects.filter(role='admin', is_active=True, email__gt='')
+                        .values_list('email', flat=True)
+                    )
+                    send_mail(
+                        subject='Password Reset Request from Collector', message=f'Event {i}',
+                        from_email=settings.DEFAULT_FROM_EMAIL, recipient_list=emails,
+                        connection=smtp_connection(),
+                    )
+                inline_seconds = time.perf_counter() - start
+                inline = (server.connections, server.messages)
+                server.reset()
+
+                # After: events write outbox rows; one dispatch pass mails everything
+                NotificationModel.objects.all().delete()
+                start = time.perf_counter()
+                for i in range(events):
+                    with transaction.atomic():
+                        notify_admins('Password Reset Request from Collector', f'Event {i}')
+                request_seconds = time.perf_counter() - start
+
+                start = time.perf_counter()
+                with override_settings(NOTIFICATION_OUTBOX={'recipient_interval': 0, 'batch_size': events * len(admin_emails)}):
+                    dispatch_notifications(connection=smtp_connection())
+                dispatch_seconds = time.perf_counter() - start
+                outbox = (server.connections, server.messages)
+
+                transaction.set_rollback(True)
+        finally:
+            server.shutdown()
+            server.server_close()
+
+        self.stdout.write(f"{events} events, {len(admin_emails)} admins, {options['connect_latency'] * 1000:.0f} ms per SMTP connect")
+        self.stdout.write(
+            f"  send per event: {inline_seconds / events * 1000:8.2f} ms on the request path, "
+            f"{inline[0]} connections, {inline[1]} emails"
+        )
+        self.stdout.write(
+            f"  outbox:         {request_seconds / events * 1000:8.2f} ms on the request path, "
+            f"{outbox[0]} connections, {outbox[1]} emails, dispatch {dispatch_seconds * 1000:.1f} ms"
+        )
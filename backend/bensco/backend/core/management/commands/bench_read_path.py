@@ -0,0 +1,95 @@
+import time
+import uuid
+from decimal import Decimal
+
+from django.core.management.base import BaseCommand
+from django.db import transaction
+from django.utils import timezone
+from rest_framework.renderers import JSONRenderer
+
+from clients.models import ClientModel
+from clients.serializers import ClientModelSerializer, ClientReadSerializer
+from contributions.models import ContributionModel
+from contributions.serializers import ContributionModelSerializer, ContributionReadSerializer
+from payouts.models import PayoutModel
+from payouts.serializers import PayoutModelSerializer, PayoutReadSerializer
+from savings.models import SavingsCycleModel
+from users.models import UserModel
+
+
+class Command(BaseCommand):
+    help = "Benchmark list serialization: ModelSerializer vs .values() read path, rows/sec (rolled back)."
+
+    def add_arguments(self, parser):
+        parser.add_argument('--sizes', default='100,1000,10000', help="Comma separated row counts")
+        parser.add_argument('--repeat', type=int, default=3, help="Runs per measurement; the best is reported")
+
+    def handle(self, *args, **options):
+        sizes = [int(size) for size in options['sizes'].split(',')]
+        largest = max(sizes)
+
+        with transaction.atomic():
+            tag = uuid.uuid4().hex[:8]
+            collector = UserModel.objects.create_user(
+                username=f'bench-{tag}', email=f'bench-{tag}@example.com', password='x', role='collector'
+            )
+            today = timezone.now().date()
+            clients = ClientModel.objects.bulk_create([
+                ClientModel(
+                    name=f'Bench Client {i}', unique_code=f'BENCH-{tag}-{i}', phone_number='0550001111',
+                    collector=collector, amount_daily=5, start_date=today,
+                )
+                for i in range(largest)
+            ], batch_size=2000)
+            cycles = SavingsCycleModel.objects.bulk_create([
+                SavingsCycleModel(client=client, collector=collector, expected_end_date=today) for client in clients
+            ], batch_size=2000)
+            ContributionModel.objects.bulk_create([
+                ContributionModel(client=cycle.client, collector=collector, savings_cycle=cycle, amount=Decimal('5'))
+                for cycle in cycles
+            ], batch_size=2000)
+            PayoutModel.objects.bulk_create([
+                PayoutModel(
+                    client=cycle.client, cycle=cycle, total_paid=Decimal('155'), commission=Decimal('5'),
+                    net_payout=Decimal('150'), requested_by=collector,
+                )
+                for cycle in cycles
+            ], batch_size=2000)
+
+            cases = [
+                ('clients', ClientModel.objects.filter(collector=collector), ClientModelSerializer, ClientReadSerializer),
+                ('contributions', ContributionModel.objects.filter(collector=collector),
+                 ContributionModelSerializer, ContributionReadSerializer),
+                ('payouts', PayoutModel.objects.filter(requested_by=collector),
+                 PayoutModelSerializer, PayoutReadSerializer),
+            ]
+            renderer = JSONRenderer()
+
+            self.stdout.write(f"{'endpoint':>14} {'rows':>7} {'model rows/s':>13} {'values rows/s':>14} {'speedup':>8}")
+            for name, queryset, model_serializer, read_serializer in cases:
+                queryset = queryset.order_by('id')
+                for size in sizes:
+                    page = queryset[:size]
+
+                    def model_path():
+                        eager = model_serializer.setup_eager_loading(page)
+                        return renderer.render(model_serializer(eager, many=True).data)
+
+                    def values_path():
+                        return renderer.render(read_serializer.to_representation(read_serializer.values(page)))
+
+                    model_rate = size / self._best(model_path, options['repeat'])
+                    values_rate = size / self._best(values_path, options['repeat'])
+                    self.stdout.write(
+                        f"{name:>14} {size:>7} {model_rate:>13.0f} {values_rate:>14.0f} {values_rate / model_rate:>7.1f}x"
+                    )
+
+            transaction.set_rollback(True)
+
+    def _best(self, run, repeat):
+        timings = []
+        for _ in range(repeat):
+            started = time.perf_counter()
+            run()
+            timings.append(time.perf_counter() - started)
+        return min(timings)
@@ -0,0 +1,66 @@
+import os
+import signal
+import socket
+import threading
+
+from django.core.management.base import BaseCommand
+from django.db import connection
+
+from core.jobs import work
+
+
+class Command(BaseCommand):
+    help = (
+        "Run background jobs from the database queue with N worker threads. "
+        "Several run_worker processes may share one queue."
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument('--workers', type=int, default=1, help="Concurrent worker threads")
+        parser.add_argument('--batch-size', type=int, default=10, help="Jobs claimed per query")
+        parser.add_argument('--poll-interval', type=float, default=1.0, help="Seconds to sleep when the queue is empty")
+        parser.add_argument('--once', action='store_true', help="Exit once no job is due")
+
+    def handle(self, *args, **options):
+        stop = threading.Event()
+        counts = []
+        prefix = f'{socket.gethostname()}:{os.getpid()}'
+
+        def run(index):
+            try:
+                counts.append(work(
+                    f'{prefix}:{index}'[-64:],
+                    stop=stop,
+                    batch_size=options['batch_size'],
+                    poll_interval=options['poll_interval'],
+                    once=options['once'],
+                ))
+            finally:
+                # Each thread has its own connection
+                connection.close()
+
+        def shutdown(signum, frame):
+            self.stdout.write("Stopping after the current jobs...")
+            stop.set()
+
+        previous = {}
+        if threading.current_thread() is threading.main_thread():
+            for signum in (signal.SIGINT, signal.SIGTERM):
+                previous[signum] = signal.signal(signum, shutdown)
+
+        threads = [
+            threading.Thread(target=run, args=(index,), name=f'job-worker-{index}')
+            for index in range(options['workers'])
+        ]
+        try:
+            for thread in threads:
+                thread.start()
+            for thread in threads:
+                # Short joins keep the main thread responsive to signals
+                while thread.is_alive():
+                    thread.join(0.5)
+        finally:
+            for signum, handler in previous.items():
+                signal.signal(signum, handler)
+
+        self.stdout.write(self.style.SUCCESS(f"Ran {sum(counts)} jobs with {len(threads)} workers"))
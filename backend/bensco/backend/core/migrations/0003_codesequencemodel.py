@@ -0,0 +1,20 @@
+# Generated by Django 5.2.3 on 2026-10-18 08:38
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('core', '0002_initial'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='CodeSequenceModel',
+            fields=[
+                ('name', models.CharField(max_length=100, primary_key=True, serialize=False)),
+                ('next_value', models.PositiveBigIntegerField(default=0)),
+            ],
+        ),
+    ]
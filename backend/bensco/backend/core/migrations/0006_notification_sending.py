@@ -0,0 +1,23 @@
+# Generated by Django 5.2.3 on 2026-10-18 09:59
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('core', '0005_notificationmodel'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='notificationmodel',
+            name='claimed_at',
+            field=models.DateTimeField(blank=True, help_text='When a dispatcher took the row for SENDING', null=True),
+        ),
+        migrations.AlterField(
+            model_name='notificationmodel',
+            name='status',
+            field=models.CharField(choices=[('PENDING', 'Pending'), ('SENDING', 'Sending'), ('SENT', 'Sent'), ('FAILED', 'Failed')], default='PENDING', max_length=10),
+        ),
+    ]
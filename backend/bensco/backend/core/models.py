@@ -1,4 +1,5 @@
 from django.db import models
+from django.utils import timezone
 import uuid
 from users.models import UserModel
 from clients.models import ClientModel
@@ -22,3 +23,74 @@ class PasswordResetModel(models.Model):
 
     def __str__(self):
         return f"Reset token for {self.user.username}"
+
+
+class CodeSequenceModel(models.Model):
+    # Next unused position in a unique-code sequence; see core.utils.CodeAllocator
+    name = models.CharField(max_length=100, primary_key=True)
+    next_value = models.PositiveBigIntegerField(default=0)
+
+    def __str__(self):
+        return f"{self.name} @ {self.next_value}"
+
+
+class JobModel(models.Model):
+    # A unit of background work; see core.jobs for enqueueing and the worker loop
+    class Status(models.TextChoices):
+        PENDING = 'PENDING', 'Pending'
+        RUNNING = 'RUNNING', 'Running'
+        DONE = 'DONE', 'Done'
+        FAILED = 'FAILED', 'Failed'
+
+    id = models.BigAutoField(primary_key=True)
+    name = models.CharField(max_length=255)
+    payload = models.JSONField(default=dict, blank=True)
+    status = models.CharField(max_length=10, choices=Status.choices, default=Status.PENDING)
+    attempts = models.PositiveIntegerField(default=0)
+    max_attempts = models.PositiveIntegerField(default=5)
+    run_at = models.DateTimeField(default=timezone.now)
+    locked_by = models.CharField(max_length=64, blank=True, default='')
+    locked_at = models.DateTimeField(null=True, blank=True)
+    last_error = models.TextField(blank=True, default='')
+    created_at = models.DateTimeField(auto_now_add=True)
+    updated_at = models.DateTimeField(auto_now=True)
+
+    class Meta:
+        indexes = [
+            # Claim order: due PENDING jobs, oldest first
+            models.Index(fields=['status', 'run_at'], name='job_status_run_at_idx'),
+        ]
+
+    def __str__(self):
+        return f"{self.name} #{self.pk} ({self.status})"
+
+
+class NotificationModel(models.Model):
+    # Outbox row: one email for one recipient, written in the same transaction as
+    # the event that caused it and mailed later by core.notifications
+    class Status(models.TextChoices):
+        PENDING = 'PENDING', 'Pending'
+        SENDING = 'SENDING', 'Sending'
+        SENT = 'SENT', 'Sent'
+        FAILED = 'FAILED', 'Failed'
+
+    id = models.BigAutoField(primary_key=True)
+    recipient = models.EmailField()
+    subject = models.CharField(max_length=255)
+    body = models.TextField()
+    status = models.CharField(max_length=10, choices=Status.choices, default=Status.PENDING)
+    attempts = models.PositiveIntegerField(default=0)
+    last_error = models.TextField(blank=True, default='')
+    created_at = models.DateTimeField(auto_now_add=True)
+    claimed_at = models.DateTimeField(null=True, blank=True, help_text="When a dispatcher took the row for SENDING")
+    sent_at = models.DateTimeField(null=True, blank=True)
+
+    class Meta:
+        indexes = [
+            models.Index(fields=['status', 'created_at'], name='notification_status_idx'),
+            # Per-recipient rate limit: when was this address last mailed
+            models.Index(fields=['recipient', 'sent_at'], name='notification_recipient_idx'),
+        ]
+
+    def __str__(self):
+        return f"{self.subject} -> {self.recipient} ({self.status})"
@@ -0,0 +1,179 @@
+import logging
+from datetime import timedelta
+
+from django.conf import settings
+from django.core.mail import EmailMessage, get_connection
+from django.db import transaction
+from django.db.models import F, Q
+from django.utils import timezone
+
+from .jobs import enqueue, job_name
+from .models import JobModel, NotificationModel
+
+logger = logging.getLogger(__name__)
+
+OUTBOX_DEFAULTS = {
+    'dispatch_delay': 30,
+    'batch_size': 1000,
+    'max_emails_per_run': 100,
+    'recipient_interval': 60,
+    'max_attempts': 5,
+    'send_timeout': 600,
+}
+
+
+def outbox_settings():
+    return {**OUTBOX_DEFAULTS, **getattr(settings, 'NOTIFICATION_OUTBOX', {})}
+
+
+def notify(recipients, subject, body):
+    """
+    Queue one email per recipient in the outbox. Call it inside the transaction
+    that records the event: if that rolls back, nothing is sent.
+    """
+    recipients = sorted({recipient for recipient in recipients if recipient})
+    if not recipients:
+        return []
+    rows = NotificationModel.objects.bulk_create([
+        NotificationModel(recipient=recipient, subject=subject, body=body) for recipient in recipients
+    ])
+    schedule_dispatch()
+    return rows
+
+
+def notify_admins(subject, body):
+    # local import to avoid circular import
+    from users.models import UserModel
+
+    admins = UserModel.objects.filter(role='admin', is_active=True, email__gt='').values_list('email', flat=True)
+    return notify(admins, subject, body)
+
+
+def schedule_dispatch(delay=None):
+    # At most one dispatch waits at a time, so a burst of events shares one batch
+    name = job_name(dispatch_notifications)
+    if JobModel.objects.filter(name=name, status=JobModel.Status.PENDING).exists():
+        return
+    delay = outbox_settings()['dispatch_delay'] if delay is None else delay
+    enqueue(name, run_at=timezone.now() + timedelta(seconds=delay))
+
+
+def build_message(recipient, rows):
+    # Everything waiting for one recipient goes out as a single email
+    if len(rows) == 1:
+        subject, body = rows[0].subject, rows[0].body
+    else:
+        subject = f"{len(rows)} notifications from Bensco"
+        body = "\n\n----------\n\n".join(f"{row.subject}\n\n{row.body}" for row in rows)
+    return EmailMessage(subject=subject, body=body, from_email=settings.DEFAULT_FROM_EMAIL, to=[recipient])
+
+
+def dispatch_notifications(connection=None):
+    """
+    Send pending outbox rows, coalesced per recipient, over one SMTP connection.
+
+    Rows are claimed (marked SENDING) in a short transaction that commits
+    before any mail goes out, so no lock is held during SMTP. A claim older
+    than `send_timeout` seconds (a dispatcher that died mid-send) is taken
+    again, so a crash can repeat an email but never lose one.
+
+    Rate limits: at most `max_emails_per_run` emails per pass, and none to a
+    recipient mailed, or being mailed, in the last `recipient_interval` seconds.
+    Rows held back stay PENDING and another pass is scheduled. A failed email is
+    retried on later passes until `max_attempts`, as is every row claimed by a pass
+    that could not connect. Returns the number of emails sent.
+    """
+    options = outbox_settings()
+    groups = _claim_notifications(options)
+
+    sent, failed = [], []
+    emails = 0
+    error = ''
+    if groups:
+        connection = connection or get_connection()
+        try:
+            with connection:
+                for recipient, group in groups.items():
+                    try:
+                        connection.send_messages([build_message(recipient, group)])
+                    except Exception as exc:
+                        logger.exception("Notification email to %s failed", recipient)
+                        failed.extend(row.pk for row in group)
+                        error = repr(exc)
+                    else:
+                        sent.extend(row.pk for row in group)
+                        emails += 1
+        except Exception as exc:
+            # Opening the connection failed (or closing it did): every claimed row
+            # not yet sent counts as a failed attempt rather than staying SENDING
+            logger.exception("Notification SMTP connection failed")
+            done = set(sent) | set(failed)
+            failed.extend(row.pk for group in groups.values() for row in group if row.pk not in done)
+            error = repr(exc)
+
+    sending = NotificationModel.objects.filter(status=NotificationModel.Status.SENDING)
+    if sent:
+        sending.filter(pk__in=sent).update(
+            status=NotificationModel.Status.SENT, sent_at=timezone.now(), attempts=F('attempts') + 1
+        )
+    if failed:
+        sending.filter(pk__in=failed, attempts__gte=options['max_attempts'] - 1).update(
+            status=NotificationModel.Status.FAILED, attempts=F('attempts') + 1, last_error=error
+        )
+        sending.filter(pk__in=failed).update(
+            status=NotificationModel.Status.PENDING, attempts=F('attempts') + 1, last_error=error
+        )
+
+    if NotificationModel.objects.filter(status=NotificationModel.Status.PENDING).exists():
+        schedule_dispatch()
+    return emails
+
+
+def _claim_notifications(options):
+    # Returns {recipient: [rows]} now marked SENDING by this dispatcher, committed
+    now = timezone.now()
+    claimable = Q(status=NotificationModel.Status.PENDING) | Q(
+        status=NotificationModel.Status.SENDING, claimed_at__lt=now - timedelta(seconds=options['send_timeout'])
+    )
+    with transaction.atomic():
+        # Locked only until the claim commits; concurrent dispatchers skip these rows
+        rows = list(
+            NotificationModel.objects.select_for_update(skip_locked=True)
+            .filter(claimable)
+            .order_by('created_at', 'pk')[:options['batch_size']]
+        )
+        if not rows:
+            return {}
+
+        # Mailed lately, or being mailed right now by another dispatcher
+        recently_mailed = set(
+            NotificationModel.objects.filter(
+                Q(sent_at__gt=now - timedelta(seconds=options['recipient_interval']))
+                | (Q(status=NotificationModel.Status.SENDING) & ~claimable),
+                recipient__in={row.recipient for row in rows},
+            ).values_list('recipient', flat=True)
+        )
+        groups = {}
+        for row in rows:
+            if row.recipient in recently_mailed:
+                continue
+            if row.recipient not in groups and len(groups) >= options['max_emails_per_run']:
+                continue
+            groups.setdefault(row.recipient, []).append(row)
+
+        claimed = [row.pk for group in groups.values() for row in group]
+        if not claimed:
+            return {}
+        updated = NotificationModel.objects.filter(claimable, pk__in=claimed).update(
+            status=NotificationModel.Status.SENDING, claimed_at=now
+        )
+        if updated < len(claimed):
+            # Backends without row locks (SQLite): keep only the rows this claim won
+            won = set(
+                NotificationModel.objects.filter(pk__in=claimed, claimed_at=now).values_list('pk', flat=True)
+            )
+            groups = {
+                recipient: [row for row in group if row.pk in won] for recipient, group in groups.items()
+            }
+            groups = {recipient: group for recipient, group in groups.items() if group}
+    return groups
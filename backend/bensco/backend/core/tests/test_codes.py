@@ -0,0 +1,115 @@
+import re
+import threading
+
+from django.db import connection, transaction
+from django.test import TestCase, TransactionTestCase, skipUnlessDBFeature
+from django.utils import timezone
+
+from users.models import UserModel
+from clients.models import ClientModel
+from core.models import CodeSequenceModel
+from core.utils import CodeAllocator, generate_unique_codes, permute_code, unpermute_code
+
+CODE_RE = re.compile(r'^BSL-CLI-[0-9A-F]{6}$')
+
+
+class CodeAllocatorTestCase(TestCase):
+    def test_permutation_round_trips(self):
+        for value in (0, 1, 2, 12345, (1 << 24) - 1):
+            self.assertEqual(unpermute_code(permute_code(value)), value)
+
+    def test_bulk_allocation_is_unique_and_well_formed(self):
+        codes = generate_unique_codes(ClientModel, 'CLI', 500)
+        self.assertEqual(len(set(codes)), 500)
+        self.assertTrue(all(CODE_RE.match(code) for code in codes))
+
+    def test_workers_never_overlap(self):
+        workers = [CodeAllocator() for _ in range(4)]
+        codes = []
+        for _ in range(5):
+            for worker in workers:
+                codes.extend(worker.allocate(ClientModel, 'CLI', 7))
+        self.assertEqual(len(set(codes)), len(codes))
+
+    def test_bulk_allocation_reserves_once(self):
+        # On PostgreSQL reservations commit on a side connection, so start from whatever is there
+        before = CodeSequenceModel.objects.filter(name='clients.clientmodel').values_list('next_value', flat=True)
+        before = before.first() or 0
+        allocator = CodeAllocator()
+        allocator.allocate(ClientModel, 'CLI', 100)
+        sequence = CodeSequenceModel.objects.get(name='clients.clientmodel')
+        self.assertEqual(sequence.next_value, before + 100)
+
+    def test_models_receive_codes(self):
+        collector = UserModel.objects.create_user(
+            username='collector1', email='collector1@example.com', password='password123', role='collector'
+        )
+        client = ClientModel.objects.create(
+            name="Client", collector=collector, amount_daily=5, start_date=timezone.now().date()
+        )
+        self.assertTrue(collector.unique_code.startswith('BSL-COL-'))
+        self.assertTrue(CODE_RE.match(client.unique_code))
+
+
+class CodeAllocatorBlockTestCase(TransactionTestCase):
+    def test_blocks_are_cached_outside_transactions(self):
+        allocator = CodeAllocator()
+        allocator.allocate(ClientModel, 'CLI', 1)
+        with self.assertNumQueries(0):
+            allocator.allocate(ClientModel, 'CLI', allocator.block_size - 1)
+
+
+@skipUnlessDBFeature('has_select_for_update')
+class CodeAllocatorConcurrencyTestCase(TransactionTestCase):
+    threads = 12
+
+    def test_parallel_workers_get_distinct_codes(self):
+        barrier = threading.Barrier(self.threads)
+        codes, errors = [], []
+        lock = threading.Lock()
+
+        def worker():
+            allocator = CodeAllocator()
+            try:
+                barrier.wait()
+                for _ in range(10):
+                    batch = allocator.allocate(ClientModel, 'CLI', 13)
+                    with lock:
+                        codes.extend(batch)
+            except Exception as exc:
+                errors.append(exc)
+            finally:
+                connection.close()
+
+        workers = [threading.Thread(target=worker) for _ in range(self.threads)]
+        for thread in workers:
+            thread.start()
+        for thread in workers:
+            thread.join()
+
+        self.assertEqual(errors, [])
+        self.assertEqual(len(codes), self.threads * 130)
+        self.assertEqual(len(set(codes)), len(codes))
+
+    def test_reserving_inside_a_transaction_does_not_hold_the_sequence_lock(self):
+        if connection.vendor != 'postgresql':
+            self.skipTest('side-connection reservations are PostgreSQL only')
+        allocator = CodeAllocator()
+        reserved = threading.Event()
+        codes = []
+
+        def other_worker():
+            # Would block until the outer transaction below commits if the row were still locked
+            try:
+                codes.extend(CodeAllocator().allocate(ClientModel, 'CLI', 1))
+                reserved.set()
+            finally:
+                connection.close()
+
+        with transaction.atomic():
+            codes.extend(allocator.allocate(ClientModel, 'CLI', 1))
+            thread = threading.Thread(target=other_worker)
+            thread.start()
+            self.assertTrue(reserved.wait(timeout=5))
+        thread.join()
+        self.assertEqual(len(set(codes)), 2)
@@ -0,0 +1,107 @@
+import threading
+from datetime import timedelta
+from unittest import skipUnless
+
+from django.core.management import call_command
+from django.db import connection
+from django.test import TestCase, TransactionTestCase, override_settings
+from django.utils import timezone
+
+from core.jobs import claim_jobs, enqueue, requeue_stale_jobs, work
+from core.models import JobModel
+
+calls = []
+calls_lock = threading.Lock()
+
+
+def record_call(value):
+    with calls_lock:
+        calls.append(value)
+
+
+def always_fails(value):
+    raise RuntimeError(f'cannot handle {value}')
+
+
+@override_settings(JOB_RETRY_BACKOFF=30, JOB_RETRY_BACKOFF_MAX=3600)
+class JobQueueTestCase(TestCase):
+    def setUp(self):
+        calls.clear()
+
+    def test_enqueued_job_runs_once(self):
+        job = enqueue(record_call, {'value': 1})
+        self.assertEqual(job.name, 'core.tests.test_jobs.record_call')
+
+        self.assertEqual(work('test', once=True), 1)
+        self.assertEqual(work('test', once=True), 0)
+        job.refresh_from_db()
+        self.assertEqual(job.status, JobModel.Status.DONE)
+        self.assertEqual(job.attempts, 1)
+        self.assertEqual(calls, [1])
+
+    def test_future_jobs_wait(self):
+        enqueue(record_call, {'value': 1}, run_at=timezone.now() + timedelta(minutes=5))
+        self.assertEqual(work('test', once=True), 0)
+        self.assertEqual(calls, [])
+
+    def test_failure_retries_with_backoff_then_fails(self):
+        job = enqueue(always_fails, {'value': 1}, max_attempts=3)
+        delays = []
+        for _ in range(3):
+            before = timezone.now()
+            work('test', once=True)
+            job.refresh_from_db()
+            if job.status == JobModel.Status.PENDING:
+                delays.append(round((job.run_at - before).total_seconds()))
+                # Nothing is due until the backoff has passed
+                self.assertEqual(work('test', once=True), 0)
+                JobModel.objects.filter(pk=job.pk).update(run_at=timezone.now(), updated_at=timezone.now())
+
+        self.assertEqual(delays, [30, 60])
+        self.assertEqual(job.status, JobModel.Status.FAILED)
+        self.assertEqual(job.attempts, 3)
+        self.assertIn('cannot handle 1', job.last_error)
+
+    def test_claims_are_disjoint_and_ordered(self):
+        jobs = [enqueue(record_call, {'value': i}) for i in range(5)]
+        first = claim_jobs('a', limit=3)
+        second = claim_jobs('b', limit=3)
+
+        self.assertEqual([job.pk for job in first], [job.pk for job in jobs[:3]])
+        self.assertEqual([job.pk for job in second], [job.pk for job in jobs[3:]])
+        self.assertEqual(claim_jobs('c', limit=3), [])
+
+    def test_stale_running_jobs_are_requeued(self):
+        job = enqueue(record_call, {'value': 1})
+        claim_jobs('crashed')
+        JobModel.objects.filter(pk=job.pk).update(
+            locked_at=timezone.now() - timedelta(hours=1), updated_at=timezone.now()
+        )
+
+        self.assertEqual(requeue_stale_jobs(timeout=600), 1)
+        self.assertEqual(work('test', once=True), 1)
+        self.assertEqual(calls, [1])
+
+
+class RunWorkerCommandTestCase(TransactionTestCase):
+    def setUp(self):
+        calls.clear()
+
+    def test_worker_command_runs_due_jobs(self):
+        for i in range(5):
+            enqueue(record_call, {'value': i})
+
+        call_command('run_worker', once=True, stdout=open('/dev/null', 'w'))
+
+        self.assertEqual(calls, list(range(5)))
+        self.assertEqual(JobModel.objects.filter(status=JobModel.Status.DONE).count(), 5)
+
+    @skipUnless(connection.vendor == 'postgresql', "SKIP LOCKED needs PostgreSQL")
+    def test_workers_drain_the_queue_without_running_a_job_twice(self):
+        for i in range(40):
+            enqueue(record_call, {'value': i})
+
+        call_command('run_worker', workers=4, batch_size=3, once=True, stdout=open('/dev/null', 'w'))
+
+        self.assertEqual(sorted(calls), list(range(40)))
+        self.assertEqual(JobModel.objects.filter(status=JobModel.Status.DONE).count(), 40)
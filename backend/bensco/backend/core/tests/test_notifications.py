@@ -0,0 +1,164 @@
+from datetime import timedelta
+from unittest import mock
+
+from django.core import mail
+from django.core.mail import get_connection
+from django.db import connection as db_connection, transaction
+from django.test import TestCase, override_settings
+from django.utils import timezone
+
+from core.models import JobModel, NotificationModel
+from core.notifications import dispatch_notifications, notify
+
+
+class RecordingBackend:
+    # Notes the transaction depth and the outbox state while each message is sent
+    def __init__(self):
+        self.backend = get_connection('django.core.mail.backends.locmem.EmailBackend')
+        self.seen = []
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc_info):
+        return False
+
+    def send_messages(self, messages):
+        statuses = set(
+            NotificationModel.objects.filter(recipient=messages[0].to[0]).values_list('status', flat=True)
+        )
+        self.seen.append((len(db_connection.atomic_blocks), statuses))
+        return self.backend.send_messages(messages)
+
+
+class FlakyBackend:
+    # Wraps the locmem backend and refuses mail for one address
+    def __init__(self, refuse):
+        self.refuse = refuse
+        self.backend = get_connection('django.core.mail.backends.locmem.EmailBackend')
+        self.opened = 0
+
+    def __enter__(self):
+        self.opened += 1
+        return self
+
+    def __exit__(self, *exc_info):
+        return False
+
+    def send_messages(self, messages):
+        if any(self.refuse in message.to for message in messages):
+            raise OSError('recipient refused')
+        return self.backend.send_messages(messages)
+
+
+class UnreachableBackend:
+    # An SMTP server that cannot be reached: opening the connection raises
+    def __enter__(self):
+        raise ConnectionRefusedError('smtp down')
+
+    def __exit__(self, *exc_info):
+        return False
+
+
+@override_settings(NOTIFICATION_OUTBOX={'max_emails_per_run': 100, 'recipient_interval': 60, 'max_attempts': 2})
+class NotificationOutboxTestCase(TestCase):
+    def test_rows_roll_back_with_the_event(self):
+        with self.assertRaises(RuntimeError):
+            with transaction.atomic():
+                notify(['a@example.com'], 'Subject', 'Body')
+                raise RuntimeError('event failed')
+        self.assertFalse(NotificationModel.objects.exists())
+        self.assertFalse(JobModel.objects.exists())
+
+    def test_messages_are_coalesced_per_recipient_over_one_connection(self):
+        for i in range(3):
+            notify(['a@example.com', 'b@example.com'], f'Event {i}', f'Body {i}')
+        self.assertEqual(JobModel.objects.filter(status=JobModel.Status.PENDING).count(), 1)
+
+        with mock.patch('core.notifications.get_connection', wraps=get_connection) as opened:
+            self.assertEqual(dispatch_notifications(), 2)
+        self.assertEqual(opened.call_count, 1)
+
+        self.assertEqual(sorted(message.to[0] for message in mail.outbox), ['a@example.com', 'b@example.com'])
+        self.assertIn('Event 2', mail.outbox[0].body)
+        self.assertFalse(NotificationModel.objects.filter(status=NotificationModel.Status.PENDING).exists())
+
+    def test_recipient_interval_holds_back_new_mail(self):
+        notify(['a@example.com'], 'First', 'Body')
+        dispatch_notifications()
+        notify(['a@example.com'], 'Second', 'Body')
+
+        self.assertEqual(dispatch_notifications(), 0)
+        self.assertEqual(len(mail.outbox), 1)
+
+        NotificationModel.objects.filter(status=NotificationModel.Status.SENT).update(
+            sent_at=timezone.now() - timedelta(minutes=5)
+        )
+        self.assertEqual(dispatch_notifications(), 1)
+        self.assertEqual(mail.outbox[1].subject, 'Second')
+
+    @override_settings(NOTIFICATION_OUTBOX={'max_emails_per_run': 2})
+    def test_emails_per_run_are_capped(self):
+        notify([f'user{i}@example.com' for i in range(5)], 'Subject', 'Body')
+        JobModel.objects.all().delete()
+
+        self.assertEqual(dispatch_notifications(), 2)
+        self.assertEqual(NotificationModel.objects.filter(status=NotificationModel.Status.PENDING).count(), 3)
+        # The remainder gets its own pass
+        self.assertEqual(JobModel.objects.filter(status=JobModel.Status.PENDING).count(), 1)
+
+    def test_failed_email_is_retried_then_given_up(self):
+        notify(['a@example.com', 'bad@example.com'], 'Subject', 'Body')
+        backend = FlakyBackend(refuse='bad@example.com')
+
+        self.assertEqual(dispatch_notifications(connection=backend), 1)
+        bad = NotificationModel.objects.get(recipient='bad@example.com')
+        self.assertEqual((bad.status, bad.attempts), (NotificationModel.Status.PENDING, 1))
+        self.assertIn('recipient refused', bad.last_error)
+
+        self.assertEqual(dispatch_notifications(connection=backend), 0)
+        bad.refresh_from_db()
+        self.assertEqual((bad.status, bad.attempts), (NotificationModel.Status.FAILED, 2))
+        self.assertEqual(len(mail.outbox), 1)
+
+    def test_claims_are_released_when_the_connection_fails(self):
+        notify(['a@example.com'], 'Subject', 'Body')
+        JobModel.objects.all().delete()
+
+        with self.assertLogs('core.notifications', level='ERROR'):
+            self.assertEqual(dispatch_notifications(connection=UnreachableBackend()), 0)
+        row = NotificationModel.objects.get()
+        self.assertEqual((row.status, row.attempts), (NotificationModel.Status.PENDING, 1))
+        self.assertIn('smtp down', row.last_error)
+        self.assertEqual(JobModel.objects.filter(status=JobModel.Status.PENDING).count(), 1)
+
+        self.assertEqual(dispatch_notifications(), 1)
+        self.assertEqual(len(mail.outbox), 1)
+
+    def test_mail_is_sent_after_the_claim_commits(self):
+        notify(['a@example.com', 'b@example.com'], 'Subject', 'Body')
+        backend = RecordingBackend()
+        depth = len(db_connection.atomic_blocks)
+
+        self.assertEqual(dispatch_notifications(connection=backend), 2)
+        self.assertEqual(backend.seen, [(depth, {NotificationModel.Status.SENDING})] * 2)
+        self.assertEqual(
+            set(NotificationModel.objects.values_list('status', 'attempts')), {(NotificationModel.Status.SENT, 1)}
+        )
+
+    def test_stale_claims_are_sent_again_and_fresh_ones_hold_the_recipient(self):
+        notify(['a@example.com', 'b@example.com'], 'Subject', 'Body')
+        NotificationModel.objects.filter(recipient='a@example.com').update(
+            status=NotificationModel.Status.SENDING, claimed_at=timezone.now() - timedelta(hours=1)
+        )
+        NotificationModel.objects.filter(recipient='b@example.com').update(
+            status=NotificationModel.Status.SENDING, claimed_at=timezone.now()
+        )
+        notify(['b@example.com'], 'Second', 'Body')
+
+        self.assertEqual(dispatch_notifications(), 1)
+        self.assertEqual([message.to for message in mail.outbox], [['a@example.com']])
+        self.assertEqual(
+            NotificationModel.objects.filter(recipient='b@example.com', status=NotificationModel.Status.PENDING).count(),
+            1,
+        )
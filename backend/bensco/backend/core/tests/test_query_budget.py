@@ -0,0 +1,104 @@
+from decimal import Decimal
+
+from django.core.cache import cache
+from django.db import connection
+from django.test import TestCase
+from django.test.utils import CaptureQueriesContext
+from django.urls import reverse
+from django.utils import timezone
+from rest_framework.test import APIClient
+
+from users.models import UserModel
+from clients.models import ClientModel
+from contributions.models import ContributionModel
+from payouts.models import PayoutModel
+from savings.models import SavingsCycleModel
+
+
+class QueryBudgetTestCase(TestCase):
+    """
+    Every list endpoint runs a fixed number of queries, whatever the number of rows.
+    A serializer that starts reading an un-loaded relation per row fails here.
+    """
+    SIZES = (1, 10, 1000)
+
+    def setUp(self):
+        self.admin = UserModel.objects.create_user(
+            username='admin1',
+            email='admin1@example.com',
+            password='password123',
+            role='admin'
+        )
+        self.collector = UserModel.objects.create_user(
+            username='collector1',
+            email='collector1@example.com',
+            password='password123',
+            role='collector'
+        )
+        self.client_obj = ClientModel.objects.create(
+            name='Client 0', collector=self.collector, amount_daily=5, start_date=timezone.now().date()
+        )
+        self.cycle = SavingsCycleModel.objects.create(client=self.client_obj, collector=self.collector)
+        self.rows = 0
+        self.api = APIClient()
+        self.api.force_authenticate(user=self.admin)
+
+    def _grow(self, size):
+        # Top every table up to `size` rows; bulk_create keeps seeding fast
+        today = timezone.now().date()
+        count = size - self.rows
+        ClientModel.objects.bulk_create([
+            ClientModel(name=f'Client {self.rows + i + 1}', collector=self.collector, amount_daily=5, start_date=today)
+            for i in range(count - (1 if self.rows == 0 else 0))
+        ])
+        ContributionModel.objects.bulk_create([
+            ContributionModel(
+                client=self.client_obj, collector=self.collector, savings_cycle=self.cycle, amount=Decimal('5')
+            )
+            for _ in range(count)
+        ])
+        closed = SavingsCycleModel.objects.bulk_create([
+            SavingsCycleModel(
+                client=self.client_obj, collector=self.collector, status=SavingsCycleModel.Status.CLOSED,
+                expected_end_date=today,
+            )
+            for _ in range(count)
+        ])
+        PayoutModel.objects.bulk_create([
+            PayoutModel(
+                client=self.client_obj, cycle=cycle, total_paid=Decimal('155'), commission=Decimal('5'),
+                net_payout=Decimal('150'), requested_by=self.collector,
+            )
+            for cycle in closed
+        ])
+        self.rows = size
+
+    def assertQueryBudget(self, url, budget, params=None):
+        counts = []
+        for size in self.SIZES:
+            self._grow(size)
+            cache.clear()
+            with CaptureQueriesContext(connection) as ctx:
+                response = self.api.get(url, params or {})
+            self.assertEqual(response.status_code, 200)
+            counts.append(len(ctx.captured_queries))
+        self.assertLessEqual(max(counts), budget, counts)
+        self.assertEqual(len(set(counts)), 1, counts)
+
+    def test_list_clients(self):
+        self.assertQueryBudget(reverse('list_clients'), 2)
+
+    def test_list_contributions(self):
+        self.assertQueryBudget(reverse('list_contributions'), 1, {'page_size': 500})
+
+    def test_client_contributions(self):
+        self.assertQueryBudget(reverse('client_contributions', args=[self.client_obj.id]), 2)
+
+    def test_list_payouts(self):
+        self.assertQueryBudget(reverse('payout-list'), 1)
+
+    def test_get_users(self):
+        self.assertQueryBudget(reverse('get_users'), 1)
+
+    def test_sync_changes(self):
+        self.assertQueryBudget(reverse('sync_changes'), 4, {'limit': 1000})
@@ -0,0 +1,72 @@
+import uuid
+from decimal import Decimal
+
+from django.test import TestCase
+from django.utils import timezone
+from rest_framework.renderers import JSONRenderer
+
+from users.models import UserModel
+from clients.models import AddressModel, ClientModel
+from clients.serializers import ClientModelSerializer, ClientReadSerializer
+from contributions.models import ContributionModel
+from contributions.serializers import ContributionModelSerializer, ContributionReadSerializer
+from payouts.models import PayoutModel
+from payouts.serializers import PayoutModelSerializer, PayoutReadSerializer
+from savings.models import SavingsCycleModel
+
+
+class ReadPathTestCase(TestCase):
+    """
+    The .values() read serializers must render byte-for-byte what the ModelSerializers render.
+    """
+    def setUp(self):
+        self.admin = UserModel.objects.create_user(
+            username='admin1', email='admin1@example.com', password='password123', role='admin'
+        )
+        self.collector = UserModel.objects.create_user(
+            username='collector1', email='collector1@example.com', password='password123', role='collector'
+        )
+        address = AddressModel.objects.create(label='Kasoa')
+        self.client_a = ClientModel.objects.create(
+            name='Ama Owusu', phone_number='0550001111', collector=self.collector, address=address,
+            amount_daily=Decimal('7.5'), start_date=timezone.now().date(),
+        )
+        self.client_b = ClientModel.objects.create(
+            name='Kofi Mensah', collector=self.collector, start_date=timezone.now().date(),
+        )
+        cycle = SavingsCycleModel.objects.create(client=self.client_a, collector=self.collector)
+        ContributionModel.objects.create(
+            client=self.client_a, collector=self.collector, savings_cycle=cycle, amount=Decimal('15'),
+            idempotency_key=uuid.uuid4(),
+        )
+        ContributionModel.objects.create(client=self.client_b, amount=Decimal('3.25'), note='no collector')
+
+        closed = SavingsCycleModel.objects.create(
+            client=self.client_b, collector=self.collector, status=SavingsCycleModel.Status.CLOSED
+        )
+        PayoutModel.objects.create(
+            client=self.client_a, cycle=cycle, total_paid=Decimal('155'), commission=Decimal('5'),
+            net_payout=Decimal('150'), requested_by=self.collector, approved_by=self.admin,
+            approved_on=timezone.now().date(), status=PayoutModel.StatusChoices.APPROVED,
+        )
+        PayoutModel.objects.create(
+            client=self.client_b, cycle=closed, total_paid=Decimal('0.10'), commission=Decimal('0'),
+            net_payout=Decimal('0.1'),
+        )
+
+    def assertSameBytes(self, queryset, model_serializer, read_serializer):
+        renderer = JSONRenderer()
+        expected = renderer.render(model_serializer(queryset, many=True).data)
+        actual = renderer.render(read_serializer.to_representation(read_serializer.values(queryset)))
+        self.assertEqual(actual, expected)
+
+    def test_clients(self):
+        self.assertSameBytes(ClientModel.objects.order_by('name'), ClientModelSerializer, ClientReadSerializer)
+
+    def test_contributions(self):
+        self.assertSameBytes(
+            ContributionModel.objects.order_by('amount'), ContributionModelSerializer, ContributionReadSerializer
+        )
+
+    def test_payouts(self):
+        self.assertSameBytes(PayoutModel.objects.order_by('total_paid'), PayoutModelSerializer, PayoutReadSerializer)
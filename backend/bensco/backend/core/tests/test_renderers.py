@@ -0,0 +1,95 @@
+import io
+import json
+import uuid
+from datetime import date, datetime, timedelta, timezone as dt_timezone
+from decimal import Decimal
+
+from django.test import SimpleTestCase, TestCase
+from django.urls import reverse
+from django.utils import timezone
+from django.utils.translation import gettext_lazy
+from rest_framework.exceptions import ParseError
+from rest_framework.renderers import JSONRenderer
+from rest_framework.test import APIClient
+
+from core.parsers import FastJSONParser
+from core.renderers import FastJSONRenderer, stream_json_array
+from users.models import UserModel
+from clients.models import ClientModel
+from contributions.models import ContributionModel
+
+
+class FastJSONRendererTestCase(SimpleTestCase):
+    def test_matches_drf_renderer(self):
+        data = {
+            'id': uuid.uuid4(),
+            'amount': Decimal('12.50'),
+            'when': datetime(2025, 7, 1, 8, 30, 15, 123456, tzinfo=dt_timezone.utc),
+            'day': date(2025, 7, 1),
+            'label': gettext_lazy('Kasoa'),
+            'note': 'line\u2028separator\u2029 \u00e9',
+            'rows': [{'n': 1, 'ok': True, 'none': None, 'ratio': 0.25}],
+            7: 'int key',
+        }
+        self.assertEqual(FastJSONRenderer().render(data), JSONRenderer().render(data))
+
+    def test_decimals_and_datetimes_match_drf(self):
+        data = {
+            'amounts': [Decimal('0.10'), Decimal('12.50'), Decimal('1E+2'), Decimal('-3')],
+            'naive': datetime(2025, 7, 1, 8, 30, 15, 123456),
+            'utc': datetime(2025, 7, 1, 8, 30, tzinfo=dt_timezone.utc),
+            'offset': datetime(2025, 7, 1, 8, 30, 15, 500, tzinfo=dt_timezone(timedelta(hours=1))),
+        }
+        self.assertEqual(FastJSONRenderer().render(data), JSONRenderer().render(data))
+
+    def test_known_differences_from_drf(self):
+        # Exponent floats are spelled differently
+        self.assertEqual(FastJSONRenderer().render({'v': 1e16}), b'{"v":1e16}')
+        self.assertEqual(JSONRenderer().render({'v': 1e16}), b'{"v":1e+16}')
+
+        # Non-finite values become null instead of raising
+        for value in (float('nan'), float('inf'), float('-inf'), Decimal('NaN'), Decimal('Infinity')):
+            self.assertEqual(FastJSONRenderer().render({'v': value}), b'{"v":null}')
+            with self.assertRaises(ValueError):
+                JSONRenderer().render({'v': value})
+
+    def test_indent_falls_back_to_stdlib(self):
+        data = {'a': [1, 2]}
+        self.assertEqual(
+            FastJSONRenderer().render(data, 'application/json; indent=2'),
+            JSONRenderer().render(data, 'application/json; indent=2'),
+        )
+
+    def test_parser(self):
+        parsed = FastJSONParser().parse(io.BytesIO('{"name": "Ama", "amount": 5.5}'.encode()))
+        self.assertEqual(parsed, {'name': 'Ama', 'amount': 5.5})
+        with self.assertRaises(ParseError):
+            FastJSONParser().parse(io.BytesIO(b'{"name": '))
+
+    def test_stream_json_array(self):
+        rows = [{'i': i, 'id': uuid.UUID(int=i)} for i in range(7)]
+        for chunk_size in (1, 3, 7, 100):
+            response = stream_json_array(iter(rows), chunk_size=chunk_size)
+            self.assertEqual(b''.join(response.streaming_content), JSONRenderer().render(rows))
+        self.assertEqual(b''.join(stream_json_array(iter([])).streaming_content), b'[]')
+
+
+class StreamingExportTestCase(TestCase):
+    def setUp(self):
+        self.admin = UserModel.objects.create_user(
+            username='admin1', email='admin1@example.com', password='password123', role='admin'
+        )
+        client = ClientModel.objects.create(
+            name='Ama Owusu', collector=self.admin, amount_daily=5, start_date=timezone.now().date()
+        )
+        for _ in range(3):
+            ContributionModel.objects.create(client=client, collector=self.admin, amount=5)
+        self.api = APIClient()
+        self.api.force_authenticate(user=self.admin)
+
+    def test_contributions_export_streams_every_row(self):
+        response = self.api.get(reverse('list_contributions'), {'stream': '1', 'page_size': 1})
+        self.assertTrue(response.streaming)
+        rows = json.loads(b''.join(response.streaming_content))
+        paginated = self.api.get(reverse('list_contributions')).json()['results']
+        self.assertEqual(rows, paginated)
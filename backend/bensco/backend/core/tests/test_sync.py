@@ -0,0 +1,81 @@
+from datetime import timedelta
+from unittest import mock
+
+from django.test import TestCase
+from django.urls import reverse
+from django.utils import timezone
+from rest_framework.test import APIClient
+
+from users.models import UserModel
+from clients.models import ClientModel
+from contributions.models import ContributionModel
+from savings.models import SavingsCycleModel
+
+
+@mock.patch('core.sync.SYNC_OVERLAP', timedelta(0))
+class SyncChangesTestCase(TestCase):
+    def setUp(self):
+        self.collector = UserModel.objects.create_user(
+            username='collector1',
+            email='collector1@example.com',
+            password='password123',
+            role='collector'
+        )
+        other = UserModel.objects.create_user(
+            username='collector2',
+            email='collector2@example.com',
+            password='password123',
+            role='collector'
+        )
+        self.mine = [
+            ClientModel.objects.create(
+                name=f"Client {i}", collector=self.collector, amount_daily=5, start_date=timezone.now().date()
+            )
+            for i in range(3)
+        ]
+        ClientModel.objects.create(name="Not mine", collector=other, amount_daily=5, start_date=timezone.now().date())
+
+        self.cycle = SavingsCycleModel.objects.create(client=self.mine[0], cycle_length=31)
+        ContributionModel.objects.create(
+            client=self.mine[0], collector=self.collector, savings_cycle=self.cycle, amount=5
+        )
+
+        self.api = APIClient()
+        self.api.force_authenticate(user=self.collector)
+        self.url = reverse('sync_changes')
+
+    def test_first_sync_returns_everything_in_scope(self):
+        response = self.api.get(self.url)
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(len(response.data['clients']), 3)
+        self.assertEqual(len(response.data['cycles']), 1)
+        self.assertEqual(len(response.data['contributions']), 1)
+        self.assertEqual(response.data['payouts'], [])
+        self.assertFalse(response.data['has_more'])
+
+    def test_next_sync_only_returns_changes(self):
+        cursor = self.api.get(self.url).data['cursor']
+
+        empty = self.api.get(self.url, {'cursor': cursor})
+        self.assertEqual(empty.data['clients'], [])
+        self.assertEqual(empty.data['contributions'], [])
+
+        client = self.mine[1]
+        client.name = "Renamed"
+        client.save()
+        changed = self.api.get(self.url, {'cursor': cursor})
+        self.assertEqual([row['name'] for row in changed.data['clients']], ["Renamed"])
+
+    def test_limit_pages_through_a_stream(self):
+        first = self.api.get(self.url, {'limit': 2})
+        self.assertTrue(first.data['has_more'])
+        self.assertEqual(len(first.data['clients']), 2)
+
+        second = self.api.get(self.url, {'limit': 2, 'cursor': first.data['cursor']})
+        self.assertEqual(len(second.data['clients']), 1)
+        seen = {row['id'] for row in first.data['clients']} | {row['id'] for row in second.data['clients']}
+        self.assertEqual(seen, {str(client.id) for client in self.mine})
+
+    def test_tampered_cursor_is_rejected(self):
+        response = self.api.get(self.url, {'cursor': 'not-a-cursor'})
+        self.assertEqual(response.status_code, 400)
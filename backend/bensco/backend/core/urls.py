@@ -1,6 +1,9 @@
 from django.urls import path
 from clients.views import create_address
+from . import views
 
 urlpatterns = [
     path('addr/create/', create_address, name='create_address'),
+    path('sync/changes/', views.sync_changes, name='sync_changes'),
+    path('collector/summary/', views.collector_summary, name='collector_summary'),
 ]
@@ -1,7 +1,9 @@
 import random
-from datetime import date, timedelta
+import threading
+from datetime import date
+from django.db import IntegrityError, connection, transaction
 from savings.models import SavingsCycleModel
-from django.db.models import Sum
+from savings.utils import close_due_cycles
 
 
 
@@ -9,67 +11,170 @@ def generate_hex_id(length=5):
     return ''.join(random.choices('0123456789ABCDEF', k=length))
 
 
+# Codes are 6 hex digits so they can never collide with the random 5-digit
+# codes issued before the allocator existed
+CODE_DIGITS = 6
+CODE_BITS = CODE_DIGITS * 4
+CODE_SPACE = 1 << CODE_BITS
+_HALF_BITS = CODE_BITS // 2
+_HALF_MASK = (1 << _HALF_BITS) - 1
+# Fixed forever: changing these would re-map sequence values already handed out
+_FEISTEL_KEYS = (0x9E3, 0x7F4, 0xA2B, 0x1C6)
+
+
+def _round(value, key):
+    return ((value * 0x5BD + key) ^ (value >> 3)) & _HALF_MASK
+
+
+def permute_code(value):
+    # Keyed Feistel network: a bijection on [0, CODE_SPACE) that scatters sequential values
+    left, right = value >> _HALF_BITS, value & _HALF_MASK
+    for key in _FEISTEL_KEYS:
+        left, right = right, left ^ _round(right, key)
+    return (left << _HALF_BITS) | right
+
+
+def unpermute_code(value):
+    left, right = value >> _HALF_BITS, value & _HALF_MASK
+    for key in reversed(_FEISTEL_KEYS):
+        left, right = right ^ _round(left, key), left
+    return (left << _HALF_BITS) | right
+
+
+class CodeAllocator:
+    """
+    Hands out unique codes from a database sequence without retry queries.
+    Each instance (one per worker process) reserves sequence values in blocks,
+    so most codes cost no query at all.
+    """
+    block_size = 20
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._blocks = {}
+
+    def _reserves_durably(self):
+        # Outside a transaction the reservation commits at once. Inside one, PostgreSQL
+        # reserves on a side connection; elsewhere a rollback would hand the range back
+        return not connection.in_atomic_block or connection.vendor == 'postgresql'
+
+    def _reserve(self, name, count):
+        if connection.in_atomic_block and connection.vendor == 'postgresql':
+            return self._reserve_autocommit(name, count)
+
+        from core.models import CodeSequenceModel  # local import to avoid circular import
+
+        with transaction.atomic():
+            sequence, _ = CodeSequenceModel.objects.select_for_update().get_or_create(name=name)
+            start = sequence.next_value
+            if start + count > CODE_SPACE:
+                raise RuntimeError(f"Unique code space for {name} is exhausted.")
+            sequence.next_value = start + count
+            sequence.save(update_fields=['next_value'])
+        return start, start + count
+
+    def _reserve_autocommit(self, name, count):
+        """
+        One autocommit UPDATE ... RETURNING on its own connection, so the sequence
+        row is locked for that statement only, not until the caller's transaction
+        commits. Concurrent client creation no longer queues on the row.
+        """
+        from core.models import CodeSequenceModel  # local import to avoid circular import
+
+        table = connection.ops.quote_name(CodeSequenceModel._meta.db_table)
+        side = connection.copy()
+        try:
+            with side.cursor() as cursor:
+                cursor.execute(
+                    f"INSERT INTO {table} (name, next_value) VALUES (%s, 0) ON CONFLICT (name) DO NOTHING", [name]
+                )
+                cursor.execute(
+                    f"UPDATE {table} SET next_value = next_value + %s WHERE name = %s RETURNING next_value",
+                    [count, name],
+                )
+                end = cursor.fetchone()[0]
+        finally:
+            side.close()
+        if end > CODE_SPACE:
+            raise RuntimeError(f"Unique code space for {name} is exhausted.")
+        return end - count, end
+
+    def allocate(self, model_class, role_prefix, count=1):
+        name = model_class._meta.label_lower
+        with self._lock:
+            start, end = self._blocks.get(name, (0, 0))
+            take = min(end - start, count)
+            values = list(range(start, start + take))
+            self._blocks[name] = (start + take, end)
+
+            missing = count - take
+            if missing and not self._reserves_durably():
+                # A rollback would hand this range back to the sequence, so cache none of it
+                low, high = self._reserve(name, missing)
+                values.extend(range(low, high))
+            elif missing:
+                low, high = self._reserve(name, max(missing, self.block_size))
+                values.extend(range(low, low + missing))
+                self._blocks[name] = (low + missing, high)
+        return [f"BSL-{role_prefix}-{permute_code(value):0{CODE_DIGITS}X}" for value in values]
+
+
+code_allocator = CodeAllocator()
+
+
+def generate_unique_codes(model_class, role_prefix, count):
+    """
+    example ['BSL-CLI-3F09A1', 'BSL-CLI-B1740C'] — for bulk imports
+    """
+    return code_allocator.allocate(model_class, role_prefix, count)
+
+
 def generate_unique_code(model_class, role_prefix):
     """
-    example BSL-ADM-1A2B3
+    example BSL-ADM-1A2B3C
     """
-    while True:
-        hex_part = generate_hex_id()
-        code = f"BSL-{role_prefix}-{hex_part}"
-        print(f"Trying code: {code}") 
-        if not model_class.objects.filter(unique_code=code).exists():
-            return code
+    return code_allocator.allocate(model_class, role_prefix, 1)[0]
 
 
 def check_and_close_all_cycles():
-    active_cycles = SavingsCycleModel.objects.filter(status=SavingsCycleModel.Status.ACTIVE)
-    for cycle in active_cycles:
-        days_passed = (date.today() - cycle.start_date).days
-        if days_passed >= cycle.cycle_length:
-            cycle.status = SavingsCycleModel.Status.CLOSED
-            cycle.end_date = date.today()
-            cycle.save()
+    # Set-based; see `manage.py close_due_cycles` for batch size, dry-run and resume
+    return close_due_cycles()
 
 def get_active_or_create_savings_cycle(client):
-    # Check for an active cycle
-    active_cycle = SavingsCycleModel.objects.filter(client=client, status=SavingsCycleModel.Status.ACTIVE).first()
-    
-    if active_cycle:
-        return active_cycle
-
-    # If none, create a new one with today's date
-    start = date.today()
-    length = client.cycle_length if hasattr(client, 'cycle_length') else 31
-    end = start + timedelta(days=length)
-
-    return SavingsCycleModel.objects.create(
-        client=client,
-        start_date=start,
-        cycle_length=length,
-        expected_end_date=end,
-        status=SavingsCycleModel.Status.ACTIVE
-    )
-
-
-#Check if Savings cycle is completed
-# def check_and_close(self):
-#     if self.status == self.Status.ACTIVE:
-#         days_passed = (date.today() - self.start_date).days
-#         if days_passed >= self.cycle_length:
-#             self.status = self.Status.CLOSED
-#             self.end_date = date.today()
-#             self.save()
-#             return True
-#     return False
+    """
+    The one place that resolves a client's ACTIVE cycle, creating it if missing.
+    A short row lock on the client serialises concurrent callers for that client;
+    the partial unique index one_active_cycle_per_client backs it at the database.
+    The cycle row is locked too: call it inside the transaction that inserts the
+    contribution, and the close sweep cannot close the cycle before that commits.
+    """
+    active = SavingsCycleModel.Status.ACTIVE
+    with transaction.atomic():
+        list(type(client).objects.select_for_update().filter(pk=client.pk).values_list('pk', flat=True))
+
+        active_cycle = SavingsCycleModel.objects.select_for_update().filter(client=client, status=active).first()
+        if active_cycle:
+            return active_cycle
+
+        try:
+            with transaction.atomic():
+                return SavingsCycleModel.objects.create(
+                    client=client,
+                    collector_id=client.collector_id,
+                    cycle_length=getattr(client, 'cycle_length', 31),
+                    status=active
+                )
+        except IntegrityError:
+            # Only reachable on backends that ignore FOR UPDATE (e.g. SQLite)
+            return SavingsCycleModel.objects.get(client=client, status=active)
+
 
 def check_and_close(self):
         if self.status != self.Status.ACTIVE:
             return False
 
-        # 1) Has the client paid enough days *in this cycle*?
-        contrib_days = self.contributions.aggregate(
-            total_days=Sum('days_covered')
-        )['total_days'] or 0
+        # 1) Has the client paid enough days *in this cycle*? (running counter)
+        contrib_days = self.total_days_covered
 
         # 2) Has the cycle run its natural course?
         days_passed = (date.today() - self.start_date).days
@@ -77,29 +182,7 @@ def check_and_close(self):
         if contrib_days >= self.cycle_length or days_passed >= self.cycle_length:
             self.status = self.Status.CLOSED
             self.end_date = date.today()
-            self.save()
+            self.save(update_fields=['status', 'end_date', 'updated_at'])
             return True
 
         return False
-
-
-# def check_and_close(self):
-#     if self.status != self.Status.ACTIVE:
-#         return False
-
-#     # 1) Has the client paid enough days in total?
-#     contrib_days = self.contributions.aggregate(
-#         total_days=Sum('days_covered')
-#     )['total_days'] or 0
-
-#     # 2) Has the cycle run its natural course?
-#     days_passed = (date.today() - self.start_date).days
-
-#     # Close if either condition is met
-#     if contrib_days >= self.cycle_length or days_passed >= self.cycle_length:
-#         self.status = self.Status.CLOSED
-#         self.end_date = date.today()
-#         self.save()
-#         return True
-
-#     return False
@@ -1,3 +1,50 @@
+import uuid
+
 from django.shortcuts import render
+from rest_framework.decorators import api_view, permission_classes
+from rest_framework.permissions import IsAuthenticated
+from rest_framework.response import Response
+from rest_framework import status
+
+from users.models import UserModel
+from .dashboard import collector_summary as build_collector_summary
+from .sync import InvalidCursor, changes_since
 
 # Create your views here.
+
+
+@api_view(['GET'])
+@permission_classes([IsAuthenticated])
+def sync_changes(request):
+    if request.user.role not in ('admin', 'collector'):
+        return Response({'detail': 'Unauthorized role.'}, status=status.HTTP_403_FORBIDDEN)
+
+    try:
+        limit = min(max(int(request.query_params.get('limit', 500)), 1), 1000)
+    except ValueError:
+        return Response({'error': 'limit must be a number.'}, status=status.HTTP_400_BAD_REQUEST)
+
+    try:
+        payload = changes_since(request.user, request.query_params.get('cursor'), limit=limit)
+    except InvalidCursor:
+        return Response({'error': 'Invalid sync cursor.'}, status=status.HTTP_400_BAD_REQUEST)
+    return Response(payload, status=status.HTTP_200_OK)
+
+
+@api_view(['GET'])
+@permission_classes([IsAuthenticated])
+def collector_summary(request):
+    if request.user.role == 'collector':
+        collector = request.user
+    elif request.user.role == 'admin':
+        try:
+            collector_id = uuid.UUID(request.query_params.get('collector', ''))
+        except ValueError:
+            return Response({'error': 'collector must be a collector id.'}, status=status.HTTP_400_BAD_REQUEST)
+        collector = UserModel.objects.filter(pk=collector_id, role='collector').first()
+        if collector is None:
+            return Response({'error': 'Collector not found.'}, status=status.HTTP_404_NOT_FOUND)
+    else:
+        return Response({'detail': 'Unauthorized role.'}, status=status.HTTP_403_FORBIDDEN)
+
+    return Response(build_collector_summary(collector), status=status.HTTP_200_OK)
@@ -0,0 +1,20 @@
+from django.core.management.base import BaseCommand
+
+from payouts.utils import generate_payouts, summarize_payouts
+
+
+class Command(BaseCommand):
+    help = "Create a PENDING payout for every CLOSED savings cycle without one, computed from its contributions."
+
+    def add_arguments(self, parser):
+        parser.add_argument('--batch-size', type=int, default=1000)
+        parser.add_argument('--dry-run', action='store_true', help="Report the payouts without creating them")
+
+    def handle(self, *args, **options):
+        payouts = generate_payouts(None, batch_size=options['batch_size'], dry_run=options['dry_run'])
+        summary = summarize_payouts(payouts)
+        verb = "would create" if options['dry_run'] else "created"
+        self.stdout.write(self.style.SUCCESS(
+            f"{summary['count']} payout(s) {verb}: total {summary['total_paid']}, "
+            f"commission {summary['commission']}, net {summary['net_payout']}."
+        ))
@@ -0,0 +1,26 @@
+# Generated by Django 5.2.3 on 2026-10-18 08:32
+
+from django.conf import settings
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('clients', '0003_sync_updated_at'),
+        ('payouts', '0003_payoutmodel_approved_on_payoutmodel_rejection_reason_and_more'),
+        ('savings', '0004_sync_updated_at'),
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='payoutmodel',
+            name='updated_at',
+            field=models.DateTimeField(auto_now=True),
+        ),
+        migrations.AddIndex(
+            model_name='payoutmodel',
+            index=models.Index(fields=['updated_at', 'id'], name='payout_updated_idx'),
+        ),
+    ]
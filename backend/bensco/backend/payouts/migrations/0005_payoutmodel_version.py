@@ -0,0 +1,18 @@
+# Generated by Django 5.2.3 on 2026-10-18 09:24
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('payouts', '0004_sync_updated_at'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='payoutmodel',
+            name='version',
+            field=models.PositiveIntegerField(default=0, help_text='Bumped by every state transition; see payouts.state'),
+        ),
+    ]
@@ -0,0 +1,57 @@
+from datetime import datetime, time
+
+from django.conf import settings
+from django.db import migrations, models
+from django.utils import timezone
+import django.utils.timezone
+
+
+def backfill_created_at(apps, schema_editor):
+    # Existing payouts never recorded a creation time. requested_on (auto_now_add) is
+    # the day each was created; start of that day stands in, and id orders within it.
+    # updated_at would not do: 0004 added it without a backfill, so every legacy row
+    # carries the same timestamp, the moment that migration ran.
+    PayoutModel = apps.get_model('payouts', 'PayoutModel')
+    batch = []
+    for payout in PayoutModel.objects.only('id', 'requested_on').iterator(chunk_size=2000):
+        created_at = datetime.combine(payout.requested_on, time.min)
+        payout.created_at = timezone.make_aware(created_at) if settings.USE_TZ else created_at
+        batch.append(payout)
+        if len(batch) == 2000:
+            PayoutModel.objects.bulk_update(batch, ['created_at'])
+            batch = []
+    if batch:
+        PayoutModel.objects.bulk_update(batch, ['created_at'])
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('payouts', '0005_payoutmodel_version'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='payoutmodel',
+            name='created_at',
+            field=models.DateTimeField(auto_now_add=True, default=django.utils.timezone.now),
+            preserve_default=False,
+        ),
+        migrations.AddIndex(
+            model_name='payoutmodel',
+            index=models.Index(fields=['status', '-created_at', '-id'], name='payout_status_created_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='payoutmodel',
+            index=models.Index(fields=['client', '-created_at', '-id'], name='payout_client_created_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='payoutmodel',
+            index=models.Index(fields=['status', 'requested_on'], name='payout_status_requested_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='payoutmodel',
+            index=models.Index(fields=['status', 'approved_on'], name='payout_status_approved_idx'),
+        ),
+        migrations.RunPython(backfill_created_at, migrations.RunPython.noop),
+    ]
@@ -29,11 +29,23 @@ class PayoutModel(models.Model):
     paid_on = models.DateField(null=True, blank=True)
 
     rejection_reason = models.TextField(blank=True, null=True)
+    version = models.PositiveIntegerField(default=0, help_text="Bumped by every state transition; see payouts.state")
+    created_at = models.DateTimeField(auto_now_add=True)
+    updated_at = models.DateTimeField(auto_now=True)
 
     class Meta:
         constraints = [
             models.UniqueConstraint(fields=['client', 'cycle'], name='one_payout_per_cycle')
         ]
+        indexes = [
+            models.Index(fields=['updated_at', 'id'], name='payout_updated_idx'),
+            # Listing: keyset pagination on (created_at, id), optionally narrowed by status or client
+            models.Index(fields=['status', '-created_at', '-id'], name='payout_status_created_idx'),
+            models.Index(fields=['client', '-created_at', '-id'], name='payout_client_created_idx'),
+            # Status with a requested/approved date range
+            models.Index(fields=['status', 'requested_on'], name='payout_status_requested_idx'),
+            models.Index(fields=['status', 'approved_on'], name='payout_status_approved_idx'),
+        ]
 
     def __str__(self):
         return f"{self.client.name} - {self.net_payout} ({self.status})"
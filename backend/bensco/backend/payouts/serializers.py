@@ -1,5 +1,6 @@
 from rest_framework import serializers
 from .models import PayoutModel
+from core.readpath import ReadField, ValuesSerializer, as_date, as_datetime, as_decimal, as_str
 
 class PayoutModelSerializer(serializers.ModelSerializer):
     requested_by_role = serializers.SerializerMethodField()
@@ -20,8 +21,45 @@ class PayoutModelSerializer(serializers.ModelSerializer):
             'approved_by',
             'approved_on',
             'paid_on',
+            'version',
+            'created_at',
         ]
-        read_only_fields = ['id', 'requested_by', 'requested_by_role', 'requested_on']
+        # Amounts are computed from the cycle's contributions, never taken from the request
+        read_only_fields = [
+            'id', 'total_paid', 'commission', 'net_payout', 'requested_by', 'requested_by_role', 'requested_on',
+            'version', 'created_at',
+        ]
+
+    def validate(self, attrs):
+        if attrs['cycle'].client_id != attrs['client'].pk:
+            raise serializers.ValidationError({'cycle': ['This cycle belongs to another client.']})
+        return attrs
+
+    @staticmethod
+    def setup_eager_loading(queryset):
+        # requested_by_role reads the related user
+        return queryset.select_related('requested_by')
 
     def get_requested_by_role(self, obj):
         return obj.requested_by.role if obj.requested_by else None
+
+
+class PayoutReadSerializer(ValuesSerializer):
+    # Same output as PayoutModelSerializer, from .values() rows
+    fields = (
+        ReadField('id', 'id', as_str),
+        ReadField('client', 'client_id'),
+        ReadField('cycle', 'cycle_id'),
+        ReadField('total_paid', 'total_paid', as_decimal(2)),
+        ReadField('commission', 'commission', as_decimal(2)),
+        ReadField('net_payout', 'net_payout', as_decimal(2)),
+        ReadField('status', 'status'),
+        ReadField('requested_by', 'requested_by_id'),
+        ReadField('requested_by_role', 'requested_by__role'),
+        ReadField('requested_on', 'requested_on', as_date),
+        ReadField('approved_by', 'approved_by_id'),
+        ReadField('approved_on', 'approved_on', as_date),
+        ReadField('paid_on', 'paid_on', as_date),
+        ReadField('version', 'version'),
+        ReadField('created_at', 'created_at', as_datetime),
+    )
@@ -0,0 +1,112 @@
+from django.db import connections, models
+from django.db.models import F
+from django.utils import timezone
+
+from .models import PayoutModel
+
+# action -> (status a payout must be in, status it moves to)
+PAYOUT_TRANSITIONS = {
+    'approve': (PayoutModel.StatusChoices.PENDING, PayoutModel.StatusChoices.APPROVED),
+    'reject': (PayoutModel.StatusChoices.PENDING, PayoutModel.StatusChoices.REJECTED),
+    'mark_paid': (PayoutModel.StatusChoices.APPROVED, PayoutModel.StatusChoices.PAID),
+}
+
+
+class PayoutConflict(Exception):
+    """
+    The payout was no longer in the state the transition expected:
+    another writer changed it first.
+    """
+
+    def __init__(self, action, status, version):
+        super().__init__(f"Cannot {action} a payout that is {status} (version {version})")
+        self.action = action
+        self.status = status
+        self.version = version
+
+
+def transition_changes(action, user, reason=None):
+    # Only the columns the action owns are written, plus the version bump
+    today = timezone.now().date()
+    changes = {
+        'status': PAYOUT_TRANSITIONS[action][1],
+        'version': F('version') + 1,
+        'updated_at': timezone.now(),
+    }
+    if action in ('approve', 'reject'):
+        changes.update(approved_by=user, approved_on=today)
+    if action == 'reject':
+        changes['rejection_reason'] = reason
+    if action == 'mark_paid':
+        changes['paid_on'] = today
+    return changes
+
+
+def transition_payout(payout_id, action, user, reason=None, expected_version=None):
+    """
+    Move one payout through `action` with a compare-and-swap UPDATE: it only
+    matches while the payout is in the action's source status (and at
+    `expected_version`, when the caller read one), so of several concurrent
+    transitions exactly one wins and no lock is taken.
+    Raises PayoutModel.DoesNotExist, or PayoutConflict when another write won.
+    """
+    queryset = PayoutModel.objects.filter(pk=payout_id, status=PAYOUT_TRANSITIONS[action][0])
+    if expected_version is not None:
+        queryset = queryset.filter(version=expected_version)
+    if queryset.update(**transition_changes(action, user, reason)):
+        return
+
+    current = PayoutModel.objects.filter(pk=payout_id).values('status', 'version').first()
+    if current is None:
+        raise PayoutModel.DoesNotExist(f"Payout {payout_id} not found")
+    raise PayoutConflict(action, current['status'], current['version'])
+
+
+def _update_returning_pks(payout_ids, source, changes):
+    """
+    One `UPDATE ... WHERE id IN (...) AND status = %s RETURNING id` through a raw
+    cursor (PostgreSQL, SQLite 3.35+): the compare-and-swap of transition_payout
+    for a whole batch, reporting which rows it moved without taking a lock.
+    """
+    connection = connections[PayoutModel.objects.db]
+    quote = connection.ops.quote_name
+    opts = PayoutModel._meta
+    assignments, params = [], []
+    for name, value in changes.items():
+        field = opts.get_field(name)
+        column = quote(field.column)
+        if name == 'version':
+            # transition_changes bumps it with F('version') + 1
+            assignments.append(f'{column} = {column} + 1')
+            continue
+        if isinstance(value, models.Model):
+            value = value.pk
+        assignments.append(f'{column} = %s')
+        params.append(field.get_db_prep_save(value, connection))
+
+    pk = opts.pk
+    ids = [pk.get_db_prep_value(pk.to_python(payout_id), connection) for payout_id in payout_ids]
+    sql = (
+        f'UPDATE {quote(opts.db_table)} SET {", ".join(assignments)} '
+        f'WHERE {quote(pk.column)} IN ({", ".join(["%s"] * len(ids))}) AND {quote(opts.get_field("status").column)} = %s '
+        f'RETURNING {quote(pk.column)}'
+    )
+    with connection.cursor() as cursor:
+        cursor.execute(sql, params + ids + [source])
+        return [pk.to_python(row[0]) for row in cursor.fetchall()]
+
+
+def transition_payouts(payout_ids, action, user, reason=None):
+    """
+    Apply `action` to every payout in `payout_ids` that is still in the status the
+    action expects, as one conditional UPDATE. Returns (updated ids, skipped),
+    where skipped maps each other id to its current status (None if not found).
+    """
+    source, _ = PAYOUT_TRANSITIONS[action]
+    updated = _update_returning_pks(payout_ids, source, transition_changes(action, user, reason)) if payout_ids else []
+    done = set(updated)
+    skipped = {pk: None for pk in payout_ids if pk not in done}
+    if skipped:
+        # Only conflicts cost a second query, to report why they were skipped
+        skipped.update(PayoutModel.objects.filter(pk__in=skipped.keys()).values_list('pk', 'status'))
+    return updated, skipped
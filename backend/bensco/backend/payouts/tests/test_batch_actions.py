@@ -0,0 +1,109 @@
+import uuid
+from datetime import date
+from decimal import Decimal
+
+from django.test import TestCase
+from django.urls import reverse
+from rest_framework.test import APIClient
+
+from clients.models import ClientModel
+from payouts.models import PayoutModel
+from payouts.state import transition_payouts
+from savings.models import SavingsCycleModel
+from users.models import UserModel
+
+PENDING = PayoutModel.StatusChoices.PENDING
+APPROVED = PayoutModel.StatusChoices.APPROVED
+REJECTED = PayoutModel.StatusChoices.REJECTED
+PAID = PayoutModel.StatusChoices.PAID
+
+
+class BatchPayoutActionsTestCase(TestCase):
+    def setUp(self):
+        self.collector = UserModel.objects.create_user(
+            username='collector1',
+            email='collector1@example.com',
+            password='password123',
+            role='collector'
+        )
+        self.admin = UserModel.objects.create_user(
+            username='admin1',
+            email='admin1@example.com',
+            password='password123',
+            role='admin'
+        )
+        self.client_obj = ClientModel.objects.create(
+            name='Client', collector=self.collector, amount_daily=5, start_date=date.today(), is_fixed=True
+        )
+        self.api = APIClient()
+        self.api.force_authenticate(user=self.admin)
+
+    def _payouts(self, count, status=PENDING):
+        payouts = []
+        for _ in range(count):
+            cycle = SavingsCycleModel.objects.create(
+                client=self.client_obj, collector=self.collector, status=SavingsCycleModel.Status.CLOSED
+            )
+            payouts.append(PayoutModel.objects.create(
+                client=self.client_obj, cycle=cycle, total_paid=Decimal('155'), commission=Decimal('5'),
+                net_payout=Decimal('150'), requested_by=self.collector, status=status,
+            ))
+        return [payout.pk for payout in payouts]
+
+    def test_one_statement_whatever_the_batch_size(self):
+        for size in (1, 10, 100):
+            ids = self._payouts(size)
+            with self.assertNumQueries(1):
+                updated, skipped = transition_payouts(ids, 'approve', self.admin)
+            self.assertEqual(sorted(updated), sorted(ids))
+            self.assertEqual(skipped, {})
+
+    def test_conflicts_are_reported_not_overwritten(self):
+        pending = self._payouts(3)
+        rejected = self._payouts(1, status=REJECTED)
+        missing = uuid.uuid4()
+
+        response = self.api.post(
+            reverse('batch-approve-payouts'), {'ids': [str(pk) for pk in pending + rejected] + [str(missing)]},
+            format='json'
+        )
+
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(sorted(response.data['updated']), sorted(pending))
+        self.assertEqual(response.data['skipped'], [
+            {'id': rejected[0], 'status': REJECTED, 'error': 'status_conflict'},
+            {'id': missing, 'status': None, 'error': 'not_found'},
+        ])
+        payout = PayoutModel.objects.get(pk=pending[0])
+        self.assertEqual((payout.status, payout.approved_by, payout.approved_on), (APPROVED, self.admin, date.today()))
+        self.assertEqual(PayoutModel.objects.get(pk=rejected[0]).status, REJECTED)
+
+    def test_reject_needs_a_reason(self):
+        ids = self._payouts(2)
+        url = reverse('batch-reject-payouts')
+        self.assertEqual(self.api.post(url, {'ids': [str(pk) for pk in ids]}, format='json').status_code, 400)
+
+        response = self.api.post(url, {'ids': [str(pk) for pk in ids], 'reason': 'Duplicate'}, format='json')
+        self.assertEqual(len(response.data['updated']), 2)
+        self.assertEqual(
+            set(PayoutModel.objects.values_list('status', 'rejection_reason')), {(REJECTED, 'Duplicate')}
+        )
+
+    def test_mark_paid_only_from_approved(self):
+        approved = self._payouts(2, status=APPROVED)
+        pending = self._payouts(1)
+
+        response = self.api.post(
+            reverse('batch-mark-payouts-paid'), {'ids': [str(pk) for pk in approved + pending]}, format='json'
+        )
+        self.assertEqual(sorted(response.data['updated']), sorted(approved))
+        self.assertEqual(response.data['skipped'][0]['status'], PENDING)
+        self.assertEqual(PayoutModel.objects.get(pk=approved[0]).paid_on, date.today())
+
+    def test_invalid_requests(self):
+        url = reverse('batch-approve-payouts')
+        self.assertEqual(self.api.post(url, {'ids': []}, format='json').status_code, 400)
+        self.assertEqual(self.api.post(url, {'ids': ['nope']}, format='json').status_code, 400)
+
+        self.api.force_authenticate(user=self.collector)
+        self.assertEqual(self.api.post(url, {'ids': [str(uuid.uuid4())]}, format='json').status_code, 403)
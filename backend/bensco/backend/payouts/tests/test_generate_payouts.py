@@ -0,0 +1,123 @@
+from datetime import date
+from decimal import Decimal
+
+from django.core.management import call_command
+from django.test import TestCase
+from django.urls import reverse
+from rest_framework.test import APIClient
+
+from clients.models import ClientModel
+from contributions.models import ContributionModel
+from payouts.models import PayoutModel
+from payouts.utils import generate_payouts
+from savings.models import SavingsCycleModel
+from users.models import UserModel
+
+
+class GeneratePayoutsTestCase(TestCase):
+    def setUp(self):
+        self.collector = UserModel.objects.create_user(
+            username='collector1',
+            email='collector1@example.com',
+            password='password123',
+            role='collector'
+        )
+        self.admin = UserModel.objects.create_user(
+            username='admin1',
+            email='admin1@example.com',
+            password='password123',
+            role='admin'
+        )
+
+    def _cycle(self, amount_daily='5.00', amounts=('5.00',), status=SavingsCycleModel.Status.CLOSED):
+        client = ClientModel.objects.create(
+            name='Client', collector=self.collector, amount_daily=Decimal(amount_daily),
+            start_date=date.today(), is_fixed=True
+        )
+        cycle = SavingsCycleModel.objects.create(client=client, collector=self.collector, status=status)
+        ContributionModel.objects.bulk_create([
+            ContributionModel(client=client, collector=self.collector, savings_cycle=cycle, amount=Decimal(amount))
+            for amount in amounts
+        ])
+        return cycle
+
+    def test_payouts_come_from_the_ledger(self):
+        cycle = self._cycle(amount_daily='10.00', amounts=('100.00', '200.00', '10.00'))
+        payouts = generate_payouts(self.admin)
+
+        self.assertEqual(len(payouts), 1)
+        payout = PayoutModel.objects.get(cycle=cycle)
+        self.assertEqual(payout.client_id, cycle.client_id)
+        self.assertEqual(payout.total_paid, Decimal('310.00'))
+        self.assertEqual(payout.commission, Decimal('10.00'))
+        self.assertEqual(payout.net_payout, Decimal('300.00'))
+        self.assertEqual(payout.status, PayoutModel.StatusChoices.PENDING)
+        self.assertEqual(payout.requested_by, self.admin)
+        cycle.refresh_from_db()
+        self.assertTrue(cycle.commission_deducted)
+
+    def test_commission_never_exceeds_savings(self):
+        cycle = self._cycle(amount_daily='10.00', amounts=('4.00',))
+        generate_payouts(self.admin)
+        payout = PayoutModel.objects.get(cycle=cycle)
+        self.assertEqual((payout.commission, payout.net_payout), (Decimal('4.00'), Decimal('0.00')))
+
+    def test_only_unpaid_closed_cycles_with_savings(self):
+        payable = self._cycle()
+        self._cycle(status=SavingsCycleModel.Status.ACTIVE)
+        self._cycle(amounts=())
+        generate_payouts(self.admin)
+
+        self.assertEqual(list(PayoutModel.objects.values_list('cycle_id', flat=True)), [payable.pk])
+        self.assertEqual(generate_payouts(self.admin), [])
+
+    def test_query_count_is_constant(self):
+        for _ in range(3):
+            self._cycle()
+        with self.assertNumQueries(5):
+            generate_payouts(self.admin)
+
+        for _ in range(30):
+            self._cycle(amounts=('5.00', '5.00'))
+        with self.assertNumQueries(5):
+            self.assertEqual(len(generate_payouts(self.admin)), 30)
+
+    def test_dry_run_writes_nothing(self):
+        self._cycle()
+        self.assertEqual(len(generate_payouts(self.admin, dry_run=True)), 1)
+        self.assertFalse(PayoutModel.objects.exists())
+
+    def test_endpoint_is_admin_only(self):
+        self._cycle(amounts=('5.00', '15.00'))
+        api = APIClient()
+        url = reverse('generate-payouts')
+
+        api.force_authenticate(user=self.collector)
+        self.assertEqual(api.post(url, {}, format='json').status_code, 403)
+
+        api.force_authenticate(user=self.admin)
+        response = api.post(url, {'dry_run': True}, format='json')
+        self.assertEqual(response.status_code, 200)
+        self.assertFalse(PayoutModel.objects.exists())
+
+        response = api.post(url, {}, format='json')
+        self.assertEqual(response.status_code, 201)
+        self.assertEqual(response.data['count'], 1)
+        self.assertEqual(response.data['net_payout'], Decimal('15.00'))
+
+    def test_endpoint_can_target_cycles(self):
+        first, second = self._cycle(), self._cycle()
+        api = APIClient()
+        api.force_authenticate(user=self.admin)
+
+        response = api.post(reverse('generate-payouts'), {'cycles': [str(second.pk)]}, format='json')
+        self.assertEqual(response.data['count'], 1)
+        self.assertEqual(list(PayoutModel.objects.values_list('cycle_id', flat=True)), [second.pk])
+
+        response = api.post(reverse('generate-payouts'), {'cycles': ['nope']}, format='json')
+        self.assertEqual(response.status_code, 400)
+
+    def test_command(self):
+        self._cycle()
+        call_command('generate_payouts', stdout=open('/dev/null', 'w'))
+        self.assertEqual(PayoutModel.objects.count(), 1)
@@ -0,0 +1,108 @@
+from datetime import timedelta
+from decimal import Decimal
+
+from django.db import connection
+from django.test import TestCase
+from django.urls import reverse
+from django.utils import timezone
+from rest_framework.test import APIClient
+
+from clients.models import ClientModel
+from payouts.models import PayoutModel
+from savings.models import SavingsCycleModel
+from users.models import UserModel
+
+PENDING = PayoutModel.StatusChoices.PENDING
+APPROVED = PayoutModel.StatusChoices.APPROVED
+
+
+class ListPayoutsTestCase(TestCase):
+    def setUp(self):
+        self.collector = UserModel.objects.create_user(
+            username='collector1',
+            email='collector1@example.com',
+            password='password123',
+            role='collector'
+        )
+        self.other_collector = UserModel.objects.create_user(
+            username='collector2',
+            email='collector2@example.com',
+            password='password123',
+            role='collector'
+        )
+        self.admin = UserModel.objects.create_user(
+            username='admin1',
+            email='admin1@example.com',
+            password='password123',
+            role='admin'
+        )
+        today = timezone.now().date()
+        self.client_a = ClientModel.objects.create(
+            name="Client A", collector=self.collector, amount_daily=5, start_date=today
+        )
+        self.client_b = ClientModel.objects.create(
+            name="Client B", collector=self.other_collector, amount_daily=5, start_date=today
+        )
+        self.payouts = {}
+        for client, count, status in ((self.client_a, 12, PENDING), (self.client_a, 3, APPROVED), (self.client_b, 5, PENDING)):
+            for _ in range(count):
+                cycle = SavingsCycleModel.objects.create(client=client, status=SavingsCycleModel.Status.CLOSED)
+                payout = PayoutModel.objects.create(
+                    client=client, cycle=cycle, total_paid=Decimal('155'), commission=Decimal('5'),
+                    net_payout=Decimal('150'), requested_by=self.collector, status=status,
+                    approved_by=self.admin if status == APPROVED else None,
+                    approved_on=today if status == APPROVED else None,
+                )
+                self.payouts.setdefault((client.pk, status), []).append(str(payout.pk))
+
+        self.api = APIClient()
+        self.api.force_authenticate(user=self.admin)
+        self.url = reverse('payout-list')
+
+    def _walk(self, params):
+        ids, url, pages = [], self.url, 0
+        while url:
+            response = self.api.get(url, params if pages == 0 else None)
+            self.assertEqual(response.status_code, 200)
+            ids.extend(row['id'] for row in response.data['results'])
+            url = response.data['next']
+            pages += 1
+        return ids, pages
+
+    def test_pages_cover_every_payout_once_newest_first(self):
+        ids, pages = self._walk({'page_size': 6})
+        self.assertEqual(pages, 4)
+        self.assertEqual(len(ids), 20)
+        self.assertEqual(len(set(ids)), 20)
+        expected = [str(pk) for pk in PayoutModel.objects.order_by('-created_at', '-id').values_list('pk', flat=True)]
+        self.assertEqual(ids, expected)
+
+    def test_status_client_and_collector_filters(self):
+        ids, _ = self._walk({'status': PENDING, 'client': str(self.client_a.pk)})
+        self.assertEqual(sorted(ids), sorted(self.payouts[(self.client_a.pk, PENDING)]))
+
+        ids, _ = self._walk({'collector': str(self.other_collector.pk)})
+        self.assertEqual(sorted(ids), sorted(self.payouts[(self.client_b.pk, PENDING)]))
+
+    def test_date_range_filters(self):
+        today = timezone.now().date()
+        ids, _ = self._walk({'approved_from': today.isoformat(), 'approved_to': today.isoformat()})
+        self.assertEqual(sorted(ids), sorted(self.payouts[(self.client_a.pk, APPROVED)]))
+
+        ids, _ = self._walk({'requested_to': (today - timedelta(days=1)).isoformat()})
+        self.assertEqual(ids, [])
+
+    def test_invalid_filters(self):
+        for params in ({'status': 'lost'}, {'client': 'nope'}, {'requested_from': '18-10-2026'}):
+            self.assertEqual(self.api.get(self.url, params).status_code, 400, params)
+
+    def test_each_page_is_one_query(self):
+        with self.assertNumQueries(1):
+            response = self.api.get(self.url, {'status': PENDING, 'page_size': 5})
+        self.assertEqual(response.data['results'][0]['requested_by_role'], 'collector')
+
+    def test_pending_screen_uses_the_status_index(self):
+        if connection.vendor != 'sqlite':
+            self.skipTest('plan text checked on SQLite only')
+        plan = PayoutModel.objects.filter(status=PENDING).order_by('-created_at', '-id')[:50].explain()
+        self.assertIn('payout_status_created_idx', plan)
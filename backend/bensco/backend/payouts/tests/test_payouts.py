@@ -5,6 +5,7 @@ from users.models import UserModel
 from clients.models import ClientModel, AddressModel
 from savings.models import SavingsCycleModel
 from payouts.models import PayoutModel
+from contributions.models import ContributionModel
 from datetime import date, timedelta
 import uuid
 
@@ -48,6 +49,13 @@ class PayoutRequestTests(TestCase):
             total_saved=310.00,
             status=SavingsCycleModel.Status.CLOSED
         )
+        # Ledger rows behind total_saved; bulk_create leaves the cycle totals as set above
+        ContributionModel.objects.bulk_create([
+            ContributionModel(
+                client=self.client, collector=self.collector, savings_cycle=self.cycle,
+                amount=310.00, days_covered=31, is_bulk=True
+            )
+        ])
 
         self.url = reverse('create-payout')  # Update this name based on your urls.py
 
@@ -100,3 +108,40 @@ class PayoutRequestTests(TestCase):
         payout_id = response.data['id']
         payout = PayoutModel.objects.get(id=payout_id)
         self.assertEqual(payout.requested_by, self.collector)
+
+    def test_amounts_are_computed_from_the_cycle(self):
+        self.client_api.force_authenticate(user=self.collector)
+        data = {
+            "client": str(self.client.id),
+            "cycle": str(self.cycle.id),
+            "total_paid": 9999.00,
+            "commission": 0.00,
+            "net_payout": 9999.00,
+        }
+        response = self.client_api.post(self.url, data, format='json')
+        self.assertEqual(response.status_code, 201)
+        self.assertEqual(response.data['total_paid'], '310.00')
+        self.assertEqual(response.data['commission'], '10.00')
+        self.assertEqual(response.data['net_payout'], '300.00')
+        self.cycle.refresh_from_db()
+        self.assertTrue(self.cycle.commission_deducted)
+
+    def test_active_cycle_cannot_be_paid_out(self):
+        SavingsCycleModel.objects.filter(pk=self.cycle.pk).update(status=SavingsCycleModel.Status.ACTIVE)
+        self.client_api.force_authenticate(user=self.admin)
+        response = self.client_api.post(
+            self.url, {"client": str(self.client.id), "cycle": str(self.cycle.id)}, format='json'
+        )
+        self.assertEqual(response.status_code, 400)
+        self.assertFalse(PayoutModel.objects.exists())
+
+    def test_cycle_of_another_client_is_rejected(self):
+        other = ClientModel.objects.create(
+            name='Client B', phone_number='0500000001', collector=self.collector,
+            start_date=date.today(), amount_daily=5.00, is_fixed=True,
+        )
+        self.client_api.force_authenticate(user=self.admin)
+        response = self.client_api.post(
+            self.url, {"client": str(other.id), "cycle": str(self.cycle.id)}, format='json'
+        )
+        self.assertEqual(response.status_code, 400)
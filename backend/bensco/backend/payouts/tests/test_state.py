@@ -0,0 +1,157 @@
+import random
+import threading
+import time
+from datetime import date
+from decimal import Decimal
+
+from django.db import OperationalError, connection
+from django.test import TestCase, TransactionTestCase
+from django.urls import reverse
+from rest_framework.test import APIClient
+
+from clients.models import ClientModel
+from payouts.models import PayoutModel
+from payouts.state import PayoutConflict, transition_payout
+from savings.models import SavingsCycleModel
+from users.models import UserModel
+
+PENDING = PayoutModel.StatusChoices.PENDING
+APPROVED = PayoutModel.StatusChoices.APPROVED
+REJECTED = PayoutModel.StatusChoices.REJECTED
+PAID = PayoutModel.StatusChoices.PAID
+
+
+class PayoutFixtures:
+    def _users(self):
+        self.collector = UserModel.objects.create_user(
+            username='collector1',
+            email='collector1@example.com',
+            password='password123',
+            role='collector'
+        )
+        self.admin = UserModel.objects.create_user(
+            username='admin1',
+            email='admin1@example.com',
+            password='password123',
+            role='admin'
+        )
+        self.client_obj = ClientModel.objects.create(
+            name='Client', collector=self.collector, amount_daily=5, start_date=date.today(), is_fixed=True
+        )
+
+    def _payout(self, status=PENDING):
+        cycle = SavingsCycleModel.objects.create(
+            client=self.client_obj, collector=self.collector, status=SavingsCycleModel.Status.CLOSED
+        )
+        return PayoutModel.objects.create(
+            client=self.client_obj, cycle=cycle, total_paid=Decimal('155'), commission=Decimal('5'),
+            net_payout=Decimal('150'), requested_by=self.collector, status=status,
+        )
+
+
+class PayoutStateMachineTestCase(PayoutFixtures, TestCase):
+    def setUp(self):
+        self._users()
+
+    def test_transition_bumps_version(self):
+        payout = self._payout()
+        transition_payout(payout.pk, 'approve', self.admin)
+        transition_payout(payout.pk, 'mark_paid', self.admin)
+
+        payout.refresh_from_db()
+        self.assertEqual((payout.status, payout.version), (PAID, 2))
+        self.assertEqual(payout.paid_on, date.today())
+
+    def test_second_transition_from_the_same_state_loses(self):
+        payout = self._payout()
+        transition_payout(payout.pk, 'approve', self.admin)
+
+        with self.assertRaises(PayoutConflict) as raised:
+            transition_payout(payout.pk, 'reject', self.admin, reason='Too late')
+        self.assertEqual((raised.exception.status, raised.exception.version), (APPROVED, 1))
+        payout.refresh_from_db()
+        self.assertEqual(payout.status, APPROVED)
+        self.assertIsNone(payout.rejection_reason)
+
+    def test_stale_version_loses(self):
+        payout = self._payout()
+        with self.assertRaises(PayoutConflict):
+            transition_payout(payout.pk, 'approve', self.admin, expected_version=3)
+        transition_payout(payout.pk, 'approve', self.admin, expected_version=0)
+
+    def test_missing_payout(self):
+        payout = self._payout()
+        PayoutModel.objects.filter(pk=payout.pk).delete()
+        with self.assertRaises(PayoutModel.DoesNotExist):
+            transition_payout(payout.pk, 'approve', self.admin)
+
+    def test_writes_only_the_transition_columns(self):
+        payout = self._payout()
+        # Someone corrects the amount after this payout object was read
+        PayoutModel.objects.filter(pk=payout.pk).update(net_payout=Decimal('149'))
+        transition_payout(payout.pk, 'approve', self.admin)
+        payout.refresh_from_db()
+        self.assertEqual(payout.net_payout, Decimal('149'))
+
+    def test_views_report_conflicts(self):
+        payout = self._payout()
+        api = APIClient()
+        api.force_authenticate(user=self.admin)
+
+        response = api.post(reverse('approve-payout', args=[payout.pk]), {'version': 5}, format='json')
+        self.assertEqual(response.status_code, 409)
+        self.assertEqual(response.data['version'], 0)
+
+        response = api.post(reverse('approve-payout', args=[payout.pk]), {'version': 0}, format='json')
+        self.assertEqual(response.status_code, 200)
+
+        response = api.post(reverse('reject-payout', args=[payout.pk]), {'reason': 'No'}, format='json')
+        self.assertEqual(response.status_code, 400)
+        self.assertEqual(response.data['status'], APPROVED)
+
+
+class PayoutConcurrencyTestCase(PayoutFixtures, TransactionTestCase):
+    threads = 8
+    payouts = 10
+
+    def setUp(self):
+        self._users()
+
+    def _attempt(self, payout_id, action, barrier, outcomes):
+        barrier.wait()
+        try:
+            while True:
+                try:
+                    transition_payout(payout_id, action, self.admin, reason='Stress')
+                    outcomes.append(('won', action))
+                    return
+                except PayoutConflict:
+                    outcomes.append(('lost', action))
+                    return
+                except OperationalError:
+                    # SQLite's shared in-memory test database reports a busy table instead of waiting
+                    time.sleep(0.001)
+        finally:
+            connection.close()
+
+    def test_exactly_one_concurrent_transition_wins(self):
+        for _ in range(self.payouts):
+            payout = self._payout()
+            barrier = threading.Barrier(self.threads)
+            outcomes = []
+            actions = [random.choice(('approve', 'reject')) for _ in range(self.threads)]
+            workers = [
+                threading.Thread(target=self._attempt, args=(payout.pk, action, barrier, outcomes))
+                for action in actions
+            ]
+            for worker in workers:
+                worker.start()
+            for worker in workers:
+                worker.join()
+
+            winners = [action for result, action in outcomes if result == 'won']
+            self.assertEqual(len(outcomes), self.threads)
+            self.assertEqual(len(winners), 1, outcomes)
+            payout.refresh_from_db()
+            self.assertEqual(payout.version, 1)
+            self.assertEqual(payout.status, APPROVED if winners[0] == 'approve' else REJECTED)
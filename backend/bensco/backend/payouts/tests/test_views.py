@@ -7,6 +7,7 @@ from users.models import UserModel
 from clients.models import ClientModel
 from savings.models import SavingsCycleModel
 from payouts.models import PayoutModel
+from contributions.models import ContributionModel
 
 import uuid
 from datetime import timedelta
@@ -51,6 +52,13 @@ class PayoutViewTests(APITestCase):
             cycle_length=31,
             total_saved=150.0
         )
+        # Ledger rows behind total_saved; payouts are computed from them
+        ContributionModel.objects.bulk_create([
+            ContributionModel(
+                client=self.client_user, collector=self.collector_user, savings_cycle=self.savings_cycle,
+                amount=150.0, days_covered=30, is_bulk=True
+            )
+        ])
 
         # Auth token
         self.client_auth = APIClient()
@@ -3,9 +3,13 @@ from . import views
 
 urlpatterns = [
     path('request/', views.create_payout, name='create-payout'),
+    path('generate/', views.generate_payouts_view, name='generate-payouts'),
     path('approve/<uuid:payout_id>/', views.approve_payout, name='approve-payout'),
     path('list/', views.list_payouts, name='payout-list'),
     path('reject/<uuid:payout_id>/', views.reject_payout, name='reject-payout'),
     path('mark-paid/<uuid:payout_id>/', views.mark_payout_paid, name='mark-payout-paid'),
+    path('batch/approve/', views.batch_approve_payouts, name='batch-approve-payouts'),
+    path('batch/reject/', views.batch_reject_payouts, name='batch-reject-payouts'),
+    path('batch/mark-paid/', views.batch_mark_payouts_paid, name='batch-mark-payouts-paid'),
 
 ]
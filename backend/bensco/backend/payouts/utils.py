@@ -0,0 +1,83 @@
+from decimal import Decimal
+
+from django.db import IntegrityError, transaction
+from django.db.models import Sum
+from django.utils import timezone
+
+from savings.models import SavingsCycleModel
+from .models import PayoutModel
+
+# Commission kept by the business: this many days of the client's daily amount per cycle
+COMMISSION_DAYS = 1
+
+
+def compute_commission(amount_daily, total_paid):
+    # Never more than the client saved, so net_payout is not negative
+    return min(Decimal(str(amount_daily or 0)) * COMMISSION_DAYS, total_paid)
+
+
+def payable_cycles(queryset=None):
+    """
+    CLOSED cycles without a payout and with money saved, one row per cycle with
+    its contributions total, computed in a single grouped query.
+    """
+    if queryset is None:
+        queryset = SavingsCycleModel.objects.all()
+    return (
+        queryset
+        .filter(status=SavingsCycleModel.Status.CLOSED, payoutmodel__isnull=True)
+        .values('pk', 'client_id', 'client__amount_daily')
+        .annotate(ledger_total=Sum('contributions__amount'))
+        .filter(ledger_total__gt=0)
+        .order_by('pk')
+    )
+
+
+def build_payout(row, requested_by):
+    total_paid = row['ledger_total']
+    commission = compute_commission(row['client__amount_daily'], total_paid)
+    return PayoutModel(
+        client_id=row['client_id'],
+        cycle_id=row['pk'],
+        total_paid=total_paid,
+        commission=commission,
+        net_payout=total_paid - commission,
+        requested_by=requested_by,
+    )
+
+
+def generate_payouts(requested_by, queryset=None, batch_size=1000, dry_run=False):
+    """
+    Create a PENDING payout for every payable cycle, with totals from the
+    contributions ledger, and flag each cycle's commission as deducted.
+    Returns the payouts built (saved unless dry_run).
+    """
+    try:
+        return _generate(requested_by, queryset, batch_size, dry_run)
+    except IntegrityError:
+        # A concurrent run paid out one of our cycles first; the retry leaves it out
+        return _generate(requested_by, queryset, batch_size, dry_run)
+
+
+def _generate(requested_by, queryset, batch_size, dry_run):
+    payouts = [build_payout(row, requested_by) for row in payable_cycles(queryset)]
+    if dry_run or not payouts:
+        return payouts
+
+    with transaction.atomic():
+        for start in range(0, len(payouts), batch_size):
+            batch = payouts[start:start + batch_size]
+            PayoutModel.objects.bulk_create(batch)
+            SavingsCycleModel.objects.filter(pk__in=[payout.cycle_id for payout in batch]).update(
+                commission_deducted=True, updated_at=timezone.now()
+            )
+    return payouts
+
+
+def summarize_payouts(payouts):
+    return {
+        'count': len(payouts),
+        'total_paid': sum((payout.total_paid for payout in payouts), Decimal('0')),
+        'commission': sum((payout.commission for payout in payouts), Decimal('0')),
+        'net_payout': sum((payout.net_payout for payout in payouts), Decimal('0')),
+    }
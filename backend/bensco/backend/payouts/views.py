@@ -1,95 +1,219 @@
 from django.shortcuts import render
 from rest_framework.decorators import api_view, permission_classes
 from rest_framework.permissions import IsAuthenticated
-from .serializers import PayoutModelSerializer
+from .serializers import PayoutModelSerializer, PayoutReadSerializer
 from rest_framework.response import Response
 from .models import PayoutModel
+from .state import PAYOUT_TRANSITIONS, PayoutConflict, transition_payout, transition_payouts
+from .utils import build_payout, generate_payouts, payable_cycles, summarize_payouts
+from django.db import IntegrityError, transaction
 from django.utils import timezone
+from django.utils.dateparse import parse_date
+from core.pagination import CreatedAtCursorPagination
+from core.renderers import stream_json_array
+from savings.models import SavingsCycleModel
+import uuid
 
 # Create your views here.
 @api_view(['POST'])
 @permission_classes([IsAuthenticated])
 def create_payout(request):
     serializer = PayoutModelSerializer(data=request.data)
-    if serializer.is_valid():
-        serializer.save(requested_by=request.user)
-        return Response(serializer.data, status=201)
-    return Response(serializer.errors, status=400)
+    if not serializer.is_valid():
+        return Response(serializer.errors, status=400)
+
+    cycle = serializer.validated_data['cycle']
+    row = payable_cycles(SavingsCycleModel.objects.filter(pk=cycle.pk)).first()
+    if row is None:
+        return Response(
+            {'cycle': ['Only a closed cycle with contributions and no payout can be paid out.']}, status=400
+        )
+
+    payout = build_payout(row, request.user)
+    try:
+        with transaction.atomic():
+            serializer.save(
+                requested_by=request.user,
+                total_paid=payout.total_paid,
+                commission=payout.commission,
+                net_payout=payout.net_payout,
+            )
+            SavingsCycleModel.objects.filter(pk=cycle.pk).update(commission_deducted=True, updated_at=timezone.now())
+    except IntegrityError:
+        return Response({'cycle': ['This cycle already has a payout.']}, status=400)
+    return Response(serializer.data, status=201)
+
+
+@api_view(['POST'])
+@permission_classes([IsAuthenticated])
+def generate_payouts_view(request):
+    # Month-end closeout: one PENDING payout for every closed cycle that has none
+    if request.user.role != 'admin':
+        return Response({'error': 'Only admins can generate payouts'}, status=403)
+
+    queryset = SavingsCycleModel.objects.all()
+    cycle_ids = request.data.get('cycles')
+    if cycle_ids is not None:
+        if not isinstance(cycle_ids, list):
+            return Response({'cycles': ['Expected a list of cycle ids.']}, status=400)
+        try:
+            queryset = queryset.filter(pk__in=[uuid.UUID(str(cycle_id)) for cycle_id in cycle_ids])
+        except ValueError:
+            return Response({'cycles': ['Every cycle id must be a UUID.']}, status=400)
+
+    dry_run = request.data.get('dry_run') in (True, 'true', '1')
+    payouts = generate_payouts(request.user, queryset, dry_run=dry_run)
+    summary = summarize_payouts(payouts)
+    summary['dry_run'] = dry_run
+    return Response(summary, status=200 if dry_run else 201)
 
 #list all payouts
 @api_view(['GET'])
 @permission_classes([IsAuthenticated])
 def list_payouts(request):
-    instance = PayoutModel.objects.all()
-    serializer = PayoutModelSerializer(instance=instance, many=True)
-    return Response(serializer.data, status=200)
-
+    params = request.query_params
+    payouts = PayoutModel.objects.all()
+
+    if params.get('status'):
+        if params['status'] not in PayoutModel.StatusChoices.values:
+            return Response({'error': 'Invalid status.'}, status=400)
+        payouts = payouts.filter(status=params['status'])
+
+    # client and status line up with (<column>, created_at, id) indexes; collector goes through the client
+    for param, field in (('client', 'client_id'), ('collector', 'client__collector_id')):
+        if params.get(param):
+            try:
+                payouts = payouts.filter(**{field: uuid.UUID(params[param])})
+            except ValueError:
+                return Response({'error': f'Invalid {param} id.'}, status=400)
+
+    for param, lookup in (
+        ('requested_from', 'requested_on__gte'), ('requested_to', 'requested_on__lte'),
+        ('approved_from', 'approved_on__gte'), ('approved_to', 'approved_on__lte'),
+    ):
+        if params.get(param):
+            try:
+                value = parse_date(params[param])
+            except ValueError:
+                value = None
+            if value is None:
+                return Response({'error': f'{param} must be YYYY-MM-DD.'}, status=400)
+            payouts = payouts.filter(**{lookup: value})
+
+    # One query per page: requested_by__role is joined in, other users are ids
+    rows = PayoutReadSerializer.values(payouts)
+    if params.get('stream') in ('1', 'true') and request.user.role == 'admin':
+        # Export: rows are encoded as the database cursor yields them
+        rows = rows.order_by('-created_at', '-id').iterator(chunk_size=2000)
+        return stream_json_array(PayoutReadSerializer.iter_representation(rows))
+
+    paginator = CreatedAtCursorPagination()
+    page = paginator.paginate_queryset(rows, request)
+    return paginator.get_paginated_response(PayoutReadSerializer.to_representation(page))
+
+
+def _transition(request, payout_id, action, message, invalid_status_error):
+    version = request.data.get('version')
+    if version is not None:
+        try:
+            version = int(version)
+        except (TypeError, ValueError):
+            return Response({'version': ['A valid integer is required.']}, status=400)
 
-@api_view(['POST'])
-@permission_classes([IsAuthenticated])
-def approve_payout(request, payout_id):
     try:
-        payout = PayoutModel.objects.get(id=payout_id)
+        transition_payout(
+            payout_id, action, request.user, reason=request.data.get('reason'), expected_version=version
+        )
     except PayoutModel.DoesNotExist:
         return Response({'error': 'Payout not found'}, status=404)
+    except PayoutConflict as conflict:
+        if conflict.status != PAYOUT_TRANSITIONS[action][0]:
+            return Response({'error': invalid_status_error, 'status': conflict.status}, status=400)
+        # Right status, but changed since the caller read it
+        return Response(
+            {'error': 'Payout was changed by someone else', 'status': conflict.status, 'version': conflict.version},
+            status=409,
+        )
+    return Response({'message': message}, status=200)
 
-    if payout.status != PayoutModel.StatusChoices.PENDING:
-        return Response({'error': 'Only pending payouts can be approved'}, status=400)
 
+@api_view(['POST'])
+@permission_classes([IsAuthenticated])
+def approve_payout(request, payout_id):
     if request.user.role != 'admin':
         return Response({'error': 'Only admins can approve payouts'}, status=403)
+    return _transition(
+        request, payout_id, 'approve', 'Payout approved successfully', 'Only pending payouts can be approved'
+    )
 
-    payout.status = PayoutModel.StatusChoices.APPROVED
-    payout.approved_by = request.user
-    payout.approved_on = timezone.now().date()
-    payout.save()
 
-    return Response({'message': 'Payout approved successfully'}, status=200)
+@api_view(['POST'])
+@permission_classes([IsAuthenticated])
+def reject_payout(request, payout_id):
+    if request.user.role != 'admin':
+        return Response({'error': 'Only admins can reject payouts'}, status=403)
+    if not request.data.get('reason', ''):
+        return Response({'error': 'Rejection reason is required'}, status=400)
+    return _transition(
+        request, payout_id, 'reject', 'Payout rejected successfully', 'Only pending payouts can be rejected'
+    )
 
 
 @api_view(['POST'])
 @permission_classes([IsAuthenticated])
-def reject_payout(request, payout_id):
-    try:
-        payout = PayoutModel.objects.get(id=payout_id)
-    except PayoutModel.DoesNotExist:
-        return Response({'error': 'Payout not found'}, status=404)
+def mark_payout_paid(request, payout_id):
+    if request.user.role != 'admin':
+        return Response({'error': 'Only admins can mark payouts as paid'}, status=403)
+    return _transition(
+        request, payout_id, 'mark_paid', 'Payout marked as paid', 'Only approved payouts can be marked as paid'
+    )
 
-    if payout.status != PayoutModel.StatusChoices.PENDING:
-        return Response({'error': 'Only pending payouts can be rejected'}, status=400)
+# Largest number of payouts one batch request may change
+MAX_BATCH_SIZE = 1000
 
+
+def _batch_transition(request, action):
     if request.user.role != 'admin':
-        return Response({'error': 'Only admins can reject payouts'}, status=403)
+        return Response({'error': 'Only admins can change payouts'}, status=403)
+
+    ids = request.data.get('ids')
+    if not isinstance(ids, list) or not ids:
+        return Response({'ids': ['Expected a non-empty list of payout ids.']}, status=400)
+    if len(ids) > MAX_BATCH_SIZE:
+        return Response({'ids': [f'At most {MAX_BATCH_SIZE} payouts per request.']}, status=400)
+    try:
+        # dict.fromkeys drops repeats and keeps the request order
+        payout_ids = list(dict.fromkeys(uuid.UUID(str(payout_id)) for payout_id in ids))
+    except ValueError:
+        return Response({'ids': ['Every payout id must be a UUID.']}, status=400)
 
     reason = request.data.get('reason', '')
-    if not reason:
+    if action == 'reject' and not reason:
         return Response({'error': 'Rejection reason is required'}, status=400)
 
-    payout.status = PayoutModel.StatusChoices.REJECTED
-    payout.approved_by = request.user
-    payout.approved_on = timezone.now().date()
-    payout.rejection_reason = reason
-    payout.save()
-
-    return Response({'message': 'Payout rejected successfully'}, status=200)
+    updated, skipped = transition_payouts(payout_ids, action, request.user, reason=reason or None)
+    return Response({
+        'updated': updated,
+        'skipped': [
+            {'id': payout_id, 'status': current, 'error': 'not_found' if current is None else 'status_conflict'}
+            for payout_id, current in skipped.items()
+        ],
+    }, status=200)
 
 
 @api_view(['POST'])
 @permission_classes([IsAuthenticated])
-def mark_payout_paid(request, payout_id):
-    try:
-        payout = PayoutModel.objects.get(id=payout_id)
-    except PayoutModel.DoesNotExist:
-        return Response({'error': 'Payout not found'}, status=404)
+def batch_approve_payouts(request):
+    return _batch_transition(request, 'approve')
 
-    if payout.status != PayoutModel.StatusChoices.APPROVED:
-        return Response({'error': 'Only approved payouts can be marked as paid'}, status=400)
 
-    if request.user.role != 'admin':
-        return Response({'error': 'Only admins can mark payouts as paid'}, status=403)
+@api_view(['POST'])
+@permission_classes([IsAuthenticated])
+def batch_reject_payouts(request):
+    return _batch_transition(request, 'reject')
 
-    payout.status = PayoutModel.StatusChoices.PAID
-    payout.paid_on = timezone.now().date()
-    payout.save()
 
-    return Response({'message': 'Payout marked as paid'}, status=200)
+@api_view(['POST'])
+@permission_classes([IsAuthenticated])
+def batch_mark_payouts_paid(request):
+    return _batch_transition(request, 'mark_paid')
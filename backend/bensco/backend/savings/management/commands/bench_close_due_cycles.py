@@ -0,0 +1,66 @@
+import resource
+import time
+import tracemalloc
+import uuid
+from datetime import timedelta
+
+from django.core.management.base import BaseCommand
+from django.db import transaction
+from django.utils import timezone
+
+from clients.models import ClientModel
+from savings.models import SavingsCycleModel
+from savings.utils import close_due_cycles
+from users.models import UserModel
+
+
+class Command(BaseCommand):
+    help = "Seed N active cycles (half of them due), run the closure sweep and report time and memory. Rolled back."
+
+    def add_arguments(self, parser):
+        parser.add_argument('--cycles', type=int, default=1_000_000)
+        parser.add_argument('--batch-size', type=int, default=5000)
+        parser.add_argument('--seed-chunk', type=int, default=10_000)
+
+    def handle(self, *args, **options):
+        total = options['cycles']
+        chunk = options['seed_chunk']
+        today = timezone.now().date()
+
+        with transaction.atomic():
+            tag = uuid.uuid4().hex[:8]
+            collector = UserModel.objects.create_user(
+                username=f'bench-{tag}', email=f'bench-{tag}@example.com', password='x', role='collector'
+            )
+
+            started = time.perf_counter()
+            for offset in range(0, total, chunk):
+                size = min(chunk, total - offset)
+                clients = ClientModel.objects.bulk_create([
+                    ClientModel(name='Bench', collector=collector, amount_daily=5, start_date=today)
+                    for _ in range(size)
+                ])
+                SavingsCycleModel.objects.bulk_create([
+                    SavingsCycleModel(
+                        client=client,
+                        collector=collector,
+                        expected_end_date=today - timedelta(days=1) if i % 2 else today + timedelta(days=10),
+                    )
+                    for i, client in enumerate(clients)
+                ])
+            self.stdout.write(f"seeded {total} cycles in {time.perf_counter() - started:.1f}s")
+
+            tracemalloc.start()
+            started = time.perf_counter()
+            closed = close_due_cycles(batch_size=options['batch_size'])
+            elapsed = time.perf_counter() - started
+            _, peak = tracemalloc.get_traced_memory()
+            tracemalloc.stop()
+
+            self.stdout.write(
+                f"closed {closed} cycles in {elapsed:.2f}s "
+                f"({closed / elapsed if elapsed else 0:,.0f}/s); "
+                f"peak python heap {peak / 1024 / 1024:.1f} MiB; "
+                f"max RSS {resource.getrusage(resource.RUSAGE_SELF).ru_maxrss / 1024:.1f} MiB"
+            )
+            transaction.set_rollback(True)
@@ -0,0 +1,27 @@
+from django.core.management.base import BaseCommand
+
+from savings.utils import close_due_cycles
+
+
+class Command(BaseCommand):
+    help = "Close ACTIVE savings cycles that are due by date or by days covered, in bounded batches."
+
+    def add_arguments(self, parser):
+        parser.add_argument('--batch-size', type=int, default=1000)
+        parser.add_argument('--dry-run', action='store_true', help="Count due cycles without closing them")
+        parser.add_argument('--resume-from', help="Skip cycles up to and including this pk (printed after each batch)")
+
+    def handle(self, *args, **options):
+        verb = "would close" if options['dry_run'] else "closed"
+
+        def report(closed, last_pk):
+            if options['verbosity'] > 1:
+                self.stdout.write(f"batch {verb} {closed}, last pk {last_pk}")
+
+        total = close_due_cycles(
+            batch_size=options['batch_size'],
+            dry_run=options['dry_run'],
+            resume_from=options['resume_from'],
+            on_batch=report,
+        )
+        self.stdout.write(self.style.SUCCESS(f"{total} cycle(s) {verb}."))
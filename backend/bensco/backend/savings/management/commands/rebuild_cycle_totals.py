@@ -0,0 +1,28 @@
+from django.core.management.base import BaseCommand
+
+from savings.models import SavingsCycleModel
+from savings.utils import drifted_cycles, rebuild_cycle_totals
+
+
+class Command(BaseCommand):
+    help = "Rebuild SavingsCycleModel.total_saved and total_days_covered from the contributions ledger."
+
+    def add_arguments(self, parser):
+        parser.add_argument('--cycle', help="Only repair this cycle id")
+        parser.add_argument('--dry-run', action='store_true', help="Report drifted cycles without writing")
+
+    def handle(self, *args, **options):
+        queryset = SavingsCycleModel.objects.all()
+        if options['cycle']:
+            queryset = queryset.filter(pk=options['cycle'])
+
+        if options['dry_run']:
+            for cycle in drifted_cycles(queryset).iterator():
+                self.stdout.write(
+                    f"{cycle.pk}: saved {cycle.total_saved} -> {cycle.ledger_saved}, "
+                    f"days {cycle.total_days_covered} -> {cycle.ledger_days}"
+                )
+            return
+
+        repaired = rebuild_cycle_totals(queryset)
+        self.stdout.write(self.style.SUCCESS(f"Repaired {repaired} cycle(s)."))
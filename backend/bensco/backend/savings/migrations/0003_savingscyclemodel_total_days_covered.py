@@ -0,0 +1,42 @@
+# Generated by Django 5.2.3 on 2026-10-18 08:29
+
+from decimal import Decimal
+
+from django.db import migrations, models
+from django.db.models import OuterRef, Subquery, Sum, Value
+from django.db.models.functions import Coalesce
+
+
+def backfill_totals(apps, schema_editor):
+    # A frozen copy of savings.utils.ledger_totals, so later changes there leave this migration alone
+    SavingsCycleModel = apps.get_model('savings', 'SavingsCycleModel')
+    ContributionModel = apps.get_model('contributions', 'ContributionModel')
+    ledger = ContributionModel.objects.filter(savings_cycle=OuterRef('pk')).order_by().values('savings_cycle')
+    saved = Coalesce(
+        Subquery(ledger.annotate(total=Sum('amount')).values('total')),
+        Value(Decimal('0')),
+        output_field=models.DecimalField(max_digits=10, decimal_places=2),
+    )
+    days = Coalesce(
+        Subquery(ledger.annotate(total=Sum('days_covered')).values('total')),
+        Value(0),
+        output_field=models.PositiveIntegerField(),
+    )
+    SavingsCycleModel.objects.update(total_saved=saved, total_days_covered=days)
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('contributions', '0003_rename_cycle_contributionmodel_savings_cycle_and_more'),
+        ('savings', '0002_savingscyclemodel_collector_and_more'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='savingscyclemodel',
+            name='total_days_covered',
+            field=models.PositiveIntegerField(default=0, help_text="Running sum of days_covered over this cycle's contributions"),
+        ),
+        migrations.RunPython(backfill_totals, migrations.RunPython.noop),
+    ]
@@ -0,0 +1,20 @@
+# Generated by Django 5.2.3 on 2026-10-18 08:32
+
+from django.conf import settings
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('clients', '0003_sync_updated_at'),
+        ('savings', '0003_savingscyclemodel_total_days_covered'),
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='savingscyclemodel',
+            index=models.Index(fields=['updated_at', 'id'], name='cycle_updated_idx'),
+        ),
+    ]
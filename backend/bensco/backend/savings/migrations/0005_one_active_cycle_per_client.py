@@ -0,0 +1,40 @@
+# Generated by Django 5.2.3 on 2026-10-18 08:35
+
+from django.conf import settings
+from django.db import migrations, models
+from django.utils import timezone
+
+
+def close_duplicate_active_cycles(apps, schema_editor):
+    # Keep each client's oldest active cycle; close the extras so the index can be built
+    SavingsCycleModel = apps.get_model('savings', 'SavingsCycleModel')
+    keep = {}
+    extras = []
+    for pk, client_id in (
+        SavingsCycleModel.objects.filter(status='active').order_by('created_at').values_list('pk', 'client_id')
+    ):
+        if client_id in keep:
+            extras.append(pk)
+        else:
+            keep[client_id] = pk
+    if extras:
+        SavingsCycleModel.objects.filter(pk__in=extras).update(
+            status='closed', end_date=timezone.now().date(), updated_at=timezone.now()
+        )
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('clients', '0003_sync_updated_at'),
+        ('savings', '0004_sync_updated_at'),
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+    ]
+
+    operations = [
+        migrations.RunPython(close_duplicate_active_cycles, migrations.RunPython.noop),
+        migrations.AddConstraint(
+            model_name='savingscyclemodel',
+            constraint=models.UniqueConstraint(condition=models.Q(('status', 'active')), fields=('client',), name='one_active_cycle_per_client'),
+        ),
+    ]
@@ -0,0 +1,41 @@
+# Generated by Django 5.2.3 on 2026-10-18 08:36
+
+from django.conf import settings
+from datetime import timedelta
+
+from django.db import migrations, models
+
+
+def backfill_expected_end_date(apps, schema_editor):
+    SavingsCycleModel = apps.get_model('savings', 'SavingsCycleModel')
+    batch = []
+    for cycle in SavingsCycleModel.objects.only('start_date', 'cycle_length').iterator(chunk_size=2000):
+        cycle.expected_end_date = cycle.start_date + timedelta(days=cycle.cycle_length)
+        batch.append(cycle)
+        if len(batch) >= 2000:
+            SavingsCycleModel.objects.bulk_update(batch, ['expected_end_date'])
+            batch = []
+    if batch:
+        SavingsCycleModel.objects.bulk_update(batch, ['expected_end_date'])
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('clients', '0003_sync_updated_at'),
+        ('savings', '0005_one_active_cycle_per_client'),
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='savingscyclemodel',
+            name='expected_end_date',
+            field=models.DateField(blank=True, help_text='start_date + cycle_length, kept for the closure sweep', null=True),
+        ),
+        migrations.RunPython(backfill_expected_end_date, migrations.RunPython.noop),
+        migrations.AddIndex(
+            model_name='savingscyclemodel',
+            index=models.Index(condition=models.Q(('status', 'active')), fields=['expected_end_date'], name='cycle_active_due_idx'),
+        ),
+    ]
@@ -27,7 +27,9 @@ from django.db import models
 # from users.models import UserModel
 # from clients.models import ClientModel
 from datetime import date, timedelta
-from django.db.models import Sum
+from decimal import Decimal
+from django.db.models import F
+from django.utils import timezone
 
 class SavingsCycleModel(models.Model):
     class Status(models.TextChoices):
@@ -42,17 +44,38 @@ class SavingsCycleModel(models.Model):
     start_date = models.DateField(auto_now_add=True)
     end_date = models.DateField(null=True, blank=True)
     cycle_length = models.PositiveIntegerField(default=31, help_text="Number of days for this savings cycle")
+    expected_end_date = models.DateField(null=True, blank=True, help_text="start_date + cycle_length, kept for the closure sweep")
 
     total_saved = models.DecimalField(max_digits=10, decimal_places=2, default=0.00)
+    total_days_covered = models.PositiveIntegerField(default=0, help_text="Running sum of days_covered over this cycle's contributions")
     commission_deducted = models.BooleanField(default=False)
     status = models.CharField(max_length=20, choices=Status.choices, default=Status.ACTIVE)
 
     created_at = models.DateTimeField(auto_now_add=True)
     updated_at = models.DateTimeField(auto_now=True)
 
+    class Meta:
+        indexes = [
+            models.Index(fields=['updated_at', 'id'], name='cycle_updated_idx'),
+            models.Index(fields=['expected_end_date'], condition=models.Q(status='active'), name='cycle_active_due_idx'),
+        ]
+        constraints = [
+            models.UniqueConstraint(
+                fields=['client'],
+                condition=models.Q(status='active'),
+                name='one_active_cycle_per_client'
+            ),
+        ]
+
     def __str__(self):
         return f"{self.client.name} - {self.start_date} to {self.end_date or 'Present'}"
 
+    def save(self, *args, **kwargs):
+        # start_date is auto_now_add, so a new cycle always starts today
+        start = date.today() if self._state.adding or not self.start_date else self.start_date
+        self.expected_end_date = start + timedelta(days=self.cycle_length)
+        super().save(*args, **kwargs)
+
     # def check_and_close(self):
     #     if self.status == self.Status.ACTIVE:
     #         days_passed = (date.today() - self.start_date).days
@@ -62,20 +85,30 @@ class SavingsCycleModel(models.Model):
     #             self.save()
     #             return True
     #     return False
+    @classmethod
+    def adjust_totals(cls, cycle_id, amount, days):
+        # In-database increment so concurrent writers never lose an update;
+        # pass negative values to reverse a contribution
+        return cls.objects.filter(pk=cycle_id).update(
+            total_saved=F('total_saved') + Decimal(str(amount)),
+            total_days_covered=F('total_days_covered') + days,
+            updated_at=timezone.now(),
+        )
+
+    def apply_contribution(self, amount, days):
+        SavingsCycleModel.adjust_totals(self.pk, amount, days)
+        self.refresh_from_db(fields=['total_saved', 'total_days_covered', 'status', 'end_date'])
+
     def check_and_close(self):
         if self.status != self.Status.ACTIVE:
             return False
 
-        contrib_days = self.contributions.aggregate(
-            total_days=Sum('days_covered')
-        )['total_days'] or 0
-
         days_passed = (date.today() - self.start_date).days
 
-        if contrib_days >= self.cycle_length or days_passed >= self.cycle_length:
+        if self.total_days_covered >= self.cycle_length or days_passed >= self.cycle_length:
             self.status = self.Status.CLOSED
             self.end_date = date.today()
-            self.save()
+            self.save(update_fields=['status', 'end_date', 'updated_at'])
             return True
 
         return False
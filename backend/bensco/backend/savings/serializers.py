@@ -0,0 +1,22 @@
+from rest_framework import serializers
+from .models import SavingsCycleModel
+
+
+class SavingsCycleModelSerializer(serializers.ModelSerializer):
+    class Meta:
+        model = SavingsCycleModel
+        fields = [
+            'id',
+            'client',
+            'collector',
+            'start_date',
+            'end_date',
+            'cycle_length',
+            'total_saved',
+            'total_days_covered',
+            'commission_deducted',
+            'status',
+            'created_at',
+            'updated_at',
+        ]
+        read_only_fields = fields
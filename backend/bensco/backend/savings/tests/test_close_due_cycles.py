@@ -0,0 +1,61 @@
+from datetime import timedelta
+from io import StringIO
+
+from django.core.management import call_command
+from django.test import TestCase
+from django.utils import timezone
+
+from users.models import UserModel
+from clients.models import ClientModel
+from savings.models import SavingsCycleModel
+from savings.utils import close_due_cycles
+
+
+class CloseDueCyclesTestCase(TestCase):
+    def setUp(self):
+        self.collector = UserModel.objects.create_user(
+            username='collector1', email='collector1@example.com', password='password123', role='collector'
+        )
+        today = timezone.now().date()
+
+        def cycle(**fields):
+            client = ClientModel.objects.create(
+                name="Client", collector=self.collector, amount_daily=5, start_date=today
+            )
+            return SavingsCycleModel.objects.create(client=client, **fields)
+
+        self.by_date = [cycle() for _ in range(3)]
+        SavingsCycleModel.objects.filter(pk__in=[c.pk for c in self.by_date]).update(
+            expected_end_date=today - timedelta(days=1)
+        )
+        self.by_days = cycle(cycle_length=5, total_days_covered=5)
+        self.open = cycle()
+
+    def _statuses(self):
+        return dict(SavingsCycleModel.objects.values_list('pk', 'status'))
+
+    def test_closes_only_due_cycles_in_batches(self):
+        batches = []
+        closed = close_due_cycles(batch_size=2, on_batch=lambda n, pk: batches.append(n))
+
+        self.assertEqual(closed, 4)
+        self.assertEqual(batches, [2, 2])
+        statuses = self._statuses()
+        self.assertEqual(statuses[self.open.pk], SavingsCycleModel.Status.ACTIVE)
+        self.assertEqual(statuses[self.by_days.pk], SavingsCycleModel.Status.CLOSED)
+
+    def test_dry_run_writes_nothing(self):
+        out = StringIO()
+        call_command('close_due_cycles', '--dry-run', stdout=out)
+        self.assertIn('4 cycle(s) would close.', out.getvalue())
+        self.assertEqual(
+            SavingsCycleModel.objects.filter(status=SavingsCycleModel.Status.ACTIVE).count(), 5
+        )
+
+    def test_resume_skips_already_walked_keys(self):
+        due = sorted([c.pk for c in self.by_date] + [self.by_days.pk])
+        closed = close_due_cycles(resume_from=due[1])
+        self.assertEqual(closed, 2)
+
+    def test_new_cycles_record_expected_end_date(self):
+        self.assertEqual(self.open.expected_end_date, timezone.now().date() + timedelta(days=31))
@@ -0,0 +1,74 @@
+import threading
+
+from django.db import IntegrityError, connection, transaction
+from django.test import TestCase, TransactionTestCase, skipUnlessDBFeature
+from django.utils import timezone
+
+from users.models import UserModel
+from clients.models import ClientModel
+from contributions.serializers import ContributionModelSerializer
+from core.utils import get_active_or_create_savings_cycle
+from savings.models import SavingsCycleModel
+
+
+def make_client(username):
+    collector = UserModel.objects.create_user(
+        username=username, email=f'{username}@example.com', password='password123', role='collector'
+    )
+    return ClientModel.objects.create(
+        name="Test Client", collector=collector, amount_daily=5, start_date=timezone.now().date()
+    )
+
+
+class CycleResolutionTestCase(TestCase):
+    def setUp(self):
+        self.client_record = make_client('collector1')
+
+    def test_second_active_cycle_is_rejected_by_the_database(self):
+        SavingsCycleModel.objects.create(client=self.client_record)
+        with self.assertRaises(IntegrityError), transaction.atomic():
+            SavingsCycleModel.objects.create(client=self.client_record)
+
+    def test_closed_cycles_do_not_count(self):
+        SavingsCycleModel.objects.create(client=self.client_record, status=SavingsCycleModel.Status.CLOSED)
+        SavingsCycleModel.objects.create(client=self.client_record, status=SavingsCycleModel.Status.CLOSED)
+        cycle = get_active_or_create_savings_cycle(self.client_record)
+        self.assertEqual(cycle.status, SavingsCycleModel.Status.ACTIVE)
+
+    def test_serializer_reuses_the_active_cycle(self):
+        for _ in range(3):
+            serializer = ContributionModelSerializer(data={'client': str(self.client_record.id), 'amount': '5.00'})
+            self.assertTrue(serializer.is_valid(), serializer.errors)
+            serializer.save()
+        self.assertEqual(SavingsCycleModel.objects.filter(client=self.client_record).count(), 1)
+
+
+@skipUnlessDBFeature('has_select_for_update')
+class CycleResolutionConcurrencyTestCase(TransactionTestCase):
+    threads = 16
+
+    def test_concurrent_resolution_yields_one_active_cycle(self):
+        client_record = make_client('collector1')
+        barrier = threading.Barrier(self.threads)
+        resolved, errors = [], []
+
+        def worker():
+            try:
+                barrier.wait()
+                resolved.append(get_active_or_create_savings_cycle(client_record).pk)
+            except Exception as exc:
+                errors.append(exc)
+            finally:
+                connection.close()
+
+        workers = [threading.Thread(target=worker) for _ in range(self.threads)]
+        for thread in workers:
+            thread.start()
+        for thread in workers:
+            thread.join()
+
+        self.assertEqual(errors, [])
+        self.assertEqual(len(set(resolved)), 1)
+        self.assertEqual(
+            SavingsCycleModel.objects.filter(client=client_record, status=SavingsCycleModel.Status.ACTIVE).count(), 1
+        )
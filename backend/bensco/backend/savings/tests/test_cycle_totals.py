@@ -0,0 +1,87 @@
+from django.core.management import call_command
+from django.test import TestCase
+from django.utils import timezone
+from decimal import Decimal
+from io import StringIO
+
+from users.models import UserModel
+from clients.models import ClientModel
+from contributions.models import ContributionModel
+from savings.models import SavingsCycleModel
+
+
+class CycleTotalsTestCase(TestCase):
+    def setUp(self):
+        self.collector = UserModel.objects.create_user(
+            username='collector1',
+            email='collector1@example.com',
+            password='password123',
+            role='collector'
+        )
+        self.client = ClientModel.objects.create(
+            name="Test Client",
+            collector=self.collector,
+            amount_daily=5.0,
+            start_date=timezone.now().date(),
+            is_fixed=True
+        )
+        self.cycle = SavingsCycleModel.objects.create(
+            client=self.client,
+            collector=self.collector,
+            cycle_length=31,
+        )
+
+    def _contribute(self, amount):
+        return ContributionModel.objects.create(
+            client=self.client,
+            collector=self.collector,
+            amount=amount,
+            savings_cycle=self.cycle
+        )
+
+    def test_totals_follow_inserts_edits_and_deletes(self):
+        first = self._contribute(Decimal('10.00'))
+        self._contribute(Decimal('5.00'))
+        self.cycle.refresh_from_db()
+        self.assertEqual(self.cycle.total_saved, Decimal('15.00'))
+        self.assertEqual(self.cycle.total_days_covered, 3)
+
+        first.amount = Decimal('20.00')
+        first.save()
+        self.cycle.refresh_from_db()
+        self.assertEqual(self.cycle.total_saved, Decimal('25.00'))
+        self.assertEqual(self.cycle.total_days_covered, 5)
+
+        first.delete()
+        self.cycle.refresh_from_db()
+        self.assertEqual(self.cycle.total_saved, Decimal('5.00'))
+        self.assertEqual(self.cycle.total_days_covered, 1)
+
+    def test_queryset_delete_reverses_totals(self):
+        first = self._contribute(Decimal('10.00'))
+        self._contribute(Decimal('5.00'))
+        self._contribute(Decimal('15.00'))
+
+        ContributionModel.objects.exclude(pk=first.pk).delete()
+        self.cycle.refresh_from_db()
+        self.assertEqual(self.cycle.total_saved, Decimal('10.00'))
+        self.assertEqual(self.cycle.total_days_covered, 2)
+
+    def test_check_and_close_reads_counter_without_aggregating(self):
+        SavingsCycleModel.objects.filter(pk=self.cycle.pk).update(total_days_covered=31)
+        self.cycle.refresh_from_db()
+        with self.assertNumQueries(1):
+            self.assertTrue(self.cycle.check_and_close())
+        self.assertEqual(self.cycle.status, SavingsCycleModel.Status.CLOSED)
+
+    def test_rebuild_command_repairs_drift(self):
+        self._contribute(Decimal('10.00'))
+        SavingsCycleModel.objects.filter(pk=self.cycle.pk).update(total_saved=0, total_days_covered=0)
+
+        out = StringIO()
+        call_command('rebuild_cycle_totals', stdout=out)
+        self.assertIn('Repaired 1 cycle(s).', out.getvalue())
+
+        self.cycle.refresh_from_db()
+        self.assertEqual(self.cycle.total_saved, Decimal('10.00'))
+        self.assertEqual(self.cycle.total_days_covered, 2)
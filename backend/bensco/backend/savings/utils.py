@@ -0,0 +1,98 @@
+from datetime import date
+from decimal import Decimal
+
+from django.db import transaction
+from django.db.models import DecimalField, F, OuterRef, PositiveIntegerField, Q, Subquery, Sum, Value
+from django.db.models.functions import Coalesce
+from django.utils import timezone
+
+from .models import SavingsCycleModel
+
+
+def ledger_totals(contribution_model):
+    # Per-cycle totals recomputed from the contributions ledger, as subquery expressions
+    ledger = contribution_model.objects.filter(savings_cycle=OuterRef('pk')).order_by().values('savings_cycle')
+    saved = Coalesce(
+        Subquery(ledger.annotate(total=Sum('amount')).values('total')),
+        Value(Decimal('0')),
+        output_field=DecimalField(max_digits=10, decimal_places=2),
+    )
+    days = Coalesce(
+        Subquery(ledger.annotate(total=Sum('days_covered')).values('total')),
+        Value(0),
+        output_field=PositiveIntegerField(),
+    )
+    return saved, days
+
+
+def drifted_cycles(queryset=None):
+    """
+    Cycles whose running totals no longer match their contributions.
+    """
+    from contributions.models import ContributionModel  # local import to avoid circular import
+
+    if queryset is None:
+        queryset = SavingsCycleModel.objects.all()
+    saved, days = ledger_totals(ContributionModel)
+    return queryset.annotate(ledger_saved=saved, ledger_days=days).filter(
+        ~Q(total_saved=F('ledger_saved')) | ~Q(total_days_covered=F('ledger_days'))
+    )
+
+
+def rebuild_cycle_totals(queryset=None):
+    """
+    Rewrite total_saved and total_days_covered from the ledger for drifted cycles.
+    Returns the number of cycles repaired.
+    """
+    from contributions.models import ContributionModel  # local import to avoid circular import
+
+    saved, days = ledger_totals(ContributionModel)
+    drifted = drifted_cycles(queryset).values('pk')
+    return SavingsCycleModel.objects.filter(pk__in=drifted).update(
+        total_saved=saved,
+        total_days_covered=days,
+        updated_at=timezone.now(),
+    )
+
+
+def due_cycles(today=None):
+    # ACTIVE cycles that have run their length or whose client has paid every day
+    today = today or date.today()
+    return SavingsCycleModel.objects.filter(status=SavingsCycleModel.Status.ACTIVE).filter(
+        Q(expected_end_date__lte=today) | Q(total_days_covered__gte=F('cycle_length'))
+    )
+
+
+def close_due_cycles(batch_size=1000, dry_run=False, resume_from=None, on_batch=None):
+    """
+    Close every due cycle with set-based UPDATEs of at most `batch_size` rows.
+    Batches walk the primary key and commit separately, so an interrupted run
+    can continue from the last reported pk. Returns the number of cycles closed
+    (or found, for a dry run).
+    """
+    today = date.today()
+    last_pk = resume_from
+    total = 0
+    while True:
+        batch = due_cycles(today).order_by('pk')
+        if last_pk is not None:
+            batch = batch.filter(pk__gt=last_pk)
+        pks = list(batch.values_list('pk', flat=True)[:batch_size])
+        if not pks:
+            return total
+
+        if dry_run:
+            closed = len(pks)
+        else:
+            with transaction.atomic():
+                closed = SavingsCycleModel.objects.filter(
+                    pk__in=pks, status=SavingsCycleModel.Status.ACTIVE
+                ).update(
+                    status=SavingsCycleModel.Status.CLOSED,
+                    end_date=today,
+                    updated_at=timezone.now(),
+                )
+        total += closed
+        last_pk = pks[-1]
+        if on_batch:
+            on_batch(closed, last_pk)
@@ -0,0 +1,169 @@
+import atexit
+import logging
+import threading
+from collections import deque
+
+from django.conf import settings
+from django.db import close_old_connections, connection
+
+from .models import AuthLogModel
+
+logger = logging.getLogger(__name__)
+
+
+class AuditBuffer:
+    """
+    Write-behind buffer for audit rows. record() only appends to a bounded
+    in-memory queue; a background thread bulk_creates the rows in arrival order
+    once `batch_size` are waiting, every `flush_interval` seconds, and at
+    interpreter exit. A hard crash loses at most the rows still queued
+    (never more than `max_size`).
+
+    `overflow` decides what happens when `max_size` rows are already waiting:
+      'flush'        write on the caller's thread first; nothing is lost, the caller waits
+      'drop_newest'  discard the new row
+      'drop_oldest'  discard the oldest queued row
+    A batch that fails to insert goes back to the front of the queue and is
+    dropped after `max_retries` attempts. With flush_interval=None no thread is
+    started and the owner calls flush() itself.
+    """
+    OVERFLOW_POLICIES = ('flush', 'drop_newest', 'drop_oldest')
+    DEFAULTS = {'max_size': 10000, 'batch_size': 500, 'flush_interval': 2.0, 'overflow': 'flush', 'max_retries': 3}
+
+    def __init__(self, model, setting=None, **options):
+        self.model = model
+        self.setting = setting
+        self._options = options
+        if self.overflow not in self.OVERFLOW_POLICIES:
+            raise ValueError(f"overflow must be one of {self.OVERFLOW_POLICIES}")
+        self.dropped = 0
+
+        self._queue = deque()
+        self._lock = threading.Lock()
+        self._flush_lock = threading.Lock()  # one writer at a time keeps batches in order
+        self._wakeup = threading.Event()
+        self._thread = None
+        self._closing = False
+        self._atexit_registered = False
+
+    def _option(self, name):
+        # Read on every use, so override_settings applies to a buffer built at import
+        options = getattr(settings, self.setting, {}) if self.setting else {}
+        return self._options.get(name, options.get(name, self.DEFAULTS[name]))
+
+    max_size = property(lambda self: self._option('max_size'))
+    batch_size = property(lambda self: self._option('batch_size'))
+    flush_interval = property(lambda self: self._option('flush_interval'))
+    overflow = property(lambda self: self._option('overflow'))
+    max_retries = property(lambda self: self._option('max_retries'))
+
+    def __len__(self):
+        return len(self._queue)
+
+    def record(self, **fields):
+        row = self.model(**fields)
+        row._audit_attempts = 0
+
+        if self.overflow == 'flush' and len(self._queue) >= self.max_size:
+            self.flush()
+
+        with self._lock:
+            if len(self._queue) >= self.max_size:
+                self.dropped += 1
+                if self.overflow == 'drop_newest':
+                    return
+                # drop_oldest, or 'flush' when the database is refusing writes
+                self._queue.popleft()
+            self._queue.append(row)
+            pending = len(self._queue)
+
+        self._ensure_thread()
+        if pending >= self.batch_size:
+            self._wakeup.set()
+
+    def flush(self):
+        """
+        Write every queued row, oldest first, `batch_size` per INSERT.
+        Returns False if a batch failed and was put back.
+        """
+        with self._flush_lock:
+            while True:
+                with self._lock:
+                    batch = [self._queue.popleft() for _ in range(min(self.batch_size, len(self._queue)))]
+                if not batch:
+                    return True
+                try:
+                    self.model.objects.bulk_create(batch)
+                except Exception:
+                    logger.exception("Audit flush of %d %s rows failed", len(batch), self.model.__name__)
+                    self._requeue(batch)
+                    return False
+
+    def _requeue(self, batch):
+        retry = []
+        for row in batch:
+            row._audit_attempts += 1
+            if row._audit_attempts < self.max_retries:
+                retry.append(row)
+        with self._lock:
+            self.dropped += len(batch) - len(retry)
+            self._queue.extendleft(reversed(retry))
+            while len(self._queue) > self.max_size:
+                self._queue.pop()
+                self.dropped += 1
+
+    def close(self):
+        # Stop the flusher and write whatever is left on this thread
+        self._closing = True
+        self._wakeup.set()
+        if self._thread is not None:
+            self._thread.join(timeout=10)
+            self._thread = None
+        self.flush()
+        self._closing = False
+
+    def _ensure_thread(self):
+        if self.flush_interval is None or (self._thread is not None and self._thread.is_alive()):
+            return
+        with self._lock:
+            if self._thread is not None and self._thread.is_alive():
+                return
+            # Threads do not survive a fork, so this also restarts the flusher in a new worker
+            self._thread = threading.Thread(target=self._run, name=f'audit-{self.model.__name__}', daemon=True)
+            self._thread.start()
+            if not self._atexit_registered:
+                atexit.register(self.close)
+                self._atexit_registered = True
+
+    def _run(self):
+        try:
+            while not self._closing:
+                self._wakeup.wait(self.flush_interval)
+                self._wakeup.clear()
+                if not self._closing:
+                    # The thread's own connection: drop it if the database closed or
+                    # restarted under us, as core.jobs does (never on a caller's thread,
+                    # where it would close a connection inside an open transaction)
+                    close_old_connections()
+                    self.flush()
+        finally:
+            connection.close()
+
+
+auth_log_buffer = AuditBuffer(AuthLogModel, setting='AUTH_LOG_BUFFER')
+
+
+def log_auth_event(request, user, action):
+    """
+    Queue an AuthLogModel row for `user`; returns without touching the database.
+    With AUTH_LOG_BUFFER flush_interval None (tests override it so) there is no
+    flusher thread, so the row is written at once, in the caller's transaction.
+    """
+    auth_log_buffer.record(
+        user_id=user.pk,
+        action=action,
+        ip_address=request.META.get('REMOTE_ADDR') or '0.0.0.0',
+        user_agent=request.META.get('HTTP_USER_AGENT', ''),
+    )
+    if auth_log_buffer.flush_interval is None:
+        auth_log_buffer.flush()
@@ -1,19 +1,128 @@
+import threading
+import time
+
+from django.conf import settings
 from django.contrib.auth.backends import ModelBackend
 from django.contrib.auth import get_user_model
 from django.db.models import Q
+from django.db.models.functions import Lower
+from rest_framework.permissions import SAFE_METHODS
+from rest_framework_simplejwt.authentication import JWTAuthentication
+from rest_framework_simplejwt.exceptions import AuthenticationFailed, InvalidToken
+from rest_framework_simplejwt.settings import api_settings
+
+from .revocation import revocation_registry
 
 UserModel = get_user_model()
 
 class EmailOrUsernameBackend(ModelBackend):
     def authenticate(self, request, username=None, password=None, **kwargs):
+        if username is None:
+            username = kwargs.get(UserModel.USERNAME_FIELD)
         if username is None or password is None:
             return None
-        
-        try:
-            user = UserModel.objects.get(Q(username__iexact=username) | Q(email__iexact=username))
-        except UserModel.DoesNotExist:
+
+        # lower() on both sides matches the functional indexes on username and email
+        identifier = username.lower()
+        candidates = list(
+            UserModel.objects.alias(username_lower=Lower('username'), email_lower=Lower('email'))
+            .filter(Q(username_lower=identifier) | Q(email_lower=identifier))[:2]
+        )
+        if not candidates:
+            # Hash anyway so a missing user takes as long as a wrong password
+            UserModel().set_password(password)
             return None
 
-        if user.check_password(password) and self.user_can_authenticate(user):
-            return user
+        for user in candidates:
+            if user.check_password(password) and self.user_can_authenticate(user):
+                return user
         return None
+
+
+class UserStateCache:
+    """
+    In-process TTL cache of whether a (user id, token version) pair may still
+    authenticate. Deactivation and revocation take effect within the TTL.
+    """
+
+    def __init__(self, maxsize=10000):
+        self.maxsize = maxsize
+        self._entries = {}
+        self._lock = threading.Lock()
+
+    def is_valid(self, user_id, token_version):
+        key = (str(user_id), token_version)
+        now = time.monotonic()
+        with self._lock:
+            entry = self._entries.get(key)
+        if entry is not None and entry[0] > now:
+            return entry[1]
+
+        valid = UserModel.objects.filter(pk=user_id, is_active=True, token_version=token_version).exists()
+        ttl = getattr(settings, 'AUTH_USER_STATE_TTL', 30)
+        with self._lock:
+            self._entries.pop(key, None)
+            if len(self._entries) >= self.maxsize:
+                self._entries = {k: v for k, v in self._entries.items() if v[0] > now}
+                while len(self._entries) >= self.maxsize:
+                    del self._entries[next(iter(self._entries))]
+            self._entries[key] = (now + ttl, valid)
+        return valid
+
+    def clear(self):
+        with self._lock:
+            self._entries.clear()
+
+
+user_state_cache = UserStateCache()
+
+CLAIM_FIELDS = ('username', 'role', 'unique_code', 'must_change_password')
+
+
+def user_from_claims(validated_token):
+    """
+    UserModel instance built from token claims without a query. Other fields
+    are deferred and load on first access; the instance refuses to save().
+    """
+    loaded = {field: validated_token.get(field) for field in CLAIM_FIELDS}
+    loaded['id'] = validated_token[api_settings.USER_ID_CLAIM]
+    loaded['is_active'] = True
+    loaded['token_version'] = validated_token.get('token_version', 0)
+
+    fields = [field.attname for field in UserModel._meta.concrete_fields if field.attname in loaded]
+    user = UserModel.from_db(UserModel.objects.db, fields, [loaded[field] for field in fields])
+    user.id = UserModel._meta.pk.to_python(user.id)
+    user.from_claims = True
+    return user
+
+
+class StatelessJWTAuthentication(JWTAuthentication):
+    """
+    Safe-method requests get a user built from the verified token claims, with
+    no per-request user query; only the cached (id, token_version) check hits the
+    database, once per TTL. Writes load the full user and check its version exactly.
+    """
+
+    def authenticate(self, request):
+        self.safe_method = request.method in SAFE_METHODS
+        return super().authenticate(request)
+
+    def get_validated_token(self, raw_token):
+        validated_token = super().get_validated_token(raw_token)
+        if revocation_registry.is_revoked(validated_token.get(api_settings.JTI_CLAIM)):
+            raise AuthenticationFailed("Token has been revoked", code="token_revoked")
+        return validated_token
+
+    def get_user(self, validated_token):
+        version = validated_token.get('token_version', 0)
+        if getattr(self, 'safe_method', False):
+            if api_settings.USER_ID_CLAIM not in validated_token:
+                raise InvalidToken("Token contained no recognizable user identification")
+            if not user_state_cache.is_valid(validated_token[api_settings.USER_ID_CLAIM], version):
+                raise AuthenticationFailed("User is inactive or the token was revoked", code="token_revoked")
+            return user_from_claims(validated_token)
+
+        user = super().get_user(validated_token)
+        if user.token_version != version:
+            raise AuthenticationFailed("User is inactive or the token was revoked", code="token_revoked")
+        return user
@@ -0,0 +1,68 @@
+import time
+import uuid
+
+from django.contrib.auth.hashers import make_password
+from django.core.management.base import BaseCommand
+from django.db import connection, transaction
+from django.db.models import Q
+from django.db.models.functions import Lower
+
+from users.authentication import EmailOrUsernameBackend
+from users.models import UserModel
+
+
+class Command(BaseCommand):
+    help = "Benchmark login lookups: iexact OR vs lower() indexed lookup, over a large user table (rolled back)."
+
+    def add_arguments(self, parser):
+        parser.add_argument('--users', type=int, default=100_000)
+        parser.add_argument('--lookups', type=int, default=500)
+        parser.add_argument('--logins', type=int, default=20, help="Full authenticate() calls, hashing included")
+
+    def handle(self, *args, **options):
+        with transaction.atomic():
+            tag = uuid.uuid4().hex[:8]
+            password = make_password('password123')
+            UserModel.objects.bulk_create([
+                UserModel(
+                    username=f'Collector-{tag}-{i}', email=f'Collector-{tag}-{i}@Example.com',
+                    unique_code=f'BENCH-{tag}-{i}', password=password, role='collector',
+                )
+                for i in range(options['users'])
+            ], batch_size=5000)
+            with connection.cursor() as cursor:
+                cursor.execute('ANALYZE')
+
+            step = max(1, options['users'] // options['lookups'])
+            identifiers = [
+                f'collector-{tag}-{i}' if i % 2 else f'COLLECTOR-{tag}-{i}@EXAMPLE.COM'
+                for i in range(0, options['users'], step)
+            ][:options['lookups']]
+
+            def legacy(identifier):
+                return list(UserModel.objects.filter(Q(username__iexact=identifier) | Q(email__iexact=identifier)))
+
+            def indexed(identifier):
+                identifier = identifier.lower()
+                return list(
+                    UserModel.objects.alias(username_lower=Lower('username'), email_lower=Lower('email'))
+                    .filter(Q(username_lower=identifier) | Q(email_lower=identifier))[:2]
+                )
+
+            self.stdout.write(f"{options['users']} users on {connection.vendor}")
+            for name, lookup in (('iexact OR', legacy), ('lower() index', indexed)):
+                started = time.perf_counter()
+                for identifier in identifiers:
+                    assert lookup(identifier)
+                elapsed = time.perf_counter() - started
+                self.stdout.write(f"{name:>14}: {len(identifiers) / elapsed:10.0f} lookups/sec")
+
+            backend = EmailOrUsernameBackend()
+            logins = identifiers[:options['logins']]
+            started = time.perf_counter()
+            for identifier in logins:
+                assert backend.authenticate(None, username=identifier, password='password123')
+            elapsed = time.perf_counter() - started
+            self.stdout.write(f"{'authenticate':>14}: {len(logins) / elapsed:10.1f} logins/sec (password hashing included)")
+
+            transaction.set_rollback(True)
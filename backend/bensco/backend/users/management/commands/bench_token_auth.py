@@ -0,0 +1,68 @@
+import time
+import uuid
+from datetime import timedelta
+
+from django.core.management.base import BaseCommand
+from django.db import transaction
+from django.utils import timezone
+from rest_framework.test import APIRequestFactory
+from rest_framework_simplejwt.authentication import JWTAuthentication
+
+from users.authentication import StatelessJWTAuthentication, user_state_cache
+from users.models import RevokedTokenModel, UserModel
+from users.revocation import revocation_registry
+from users.serializers import CustomTokenObtainPairSerializer
+
+
+class Command(BaseCommand):
+    help = "Benchmark per-request JWT auth overhead, with revoked tokens loaded in the filter (rolled back)."
+
+    def add_arguments(self, parser):
+        parser.add_argument('--revoked', type=int, default=100_000, help="Revoked tokens to load")
+        parser.add_argument('--requests', type=int, default=5000)
+
+    def handle(self, *args, **options):
+        count = options['requests']
+        factory = APIRequestFactory()
+
+        with transaction.atomic():
+            tag = uuid.uuid4().hex[:8]
+            user = UserModel.objects.create_user(
+                username=f'bench-{tag}', email=f'bench-{tag}@example.com', password='x', role='collector'
+            )
+            expires_at = timezone.now() + timedelta(days=1)
+            RevokedTokenModel.objects.bulk_create(
+                [RevokedTokenModel(jti=uuid.uuid4().hex, expires_at=expires_at) for _ in range(options['revoked'])],
+                batch_size=5000,
+            )
+            started = time.perf_counter()
+            revocation_registry.refresh()
+            load_ms = (time.perf_counter() - started) * 1000
+            user_state_cache.clear()
+
+            header = f'Bearer {CustomTokenObtainPairSerializer.get_token(user).access_token}'
+            request = factory.get('/', HTTP_AUTHORIZATION=header)
+            write = factory.post('/', HTTP_AUTHORIZATION=header)
+            jti = uuid.uuid4().hex
+
+            cases = [
+                ('revocation check only', lambda: revocation_registry.is_revoked(jti)),
+                ('simplejwt JWTAuthentication (GET)', lambda: JWTAuthentication().authenticate(request)),
+                ('StatelessJWTAuthentication (GET)', lambda: StatelessJWTAuthentication().authenticate(request)),
+                ('StatelessJWTAuthentication (POST)', lambda: StatelessJWTAuthentication().authenticate(write)),
+            ]
+
+            self.stdout.write(
+                f"{options['revoked']} revoked tokens loaded in {load_ms:.0f} ms, "
+                f"{revocation_registry.memory_bytes() / 2 ** 20:.1f} MiB of jti data and filter bits"
+            )
+            for name, run in cases:
+                run()
+                started = time.perf_counter()
+                for _ in range(count):
+                    run()
+                per_request = (time.perf_counter() - started) / count * 1e6
+                self.stdout.write(f"{name:>36}: {per_request:8.1f} us/request")
+
+            transaction.set_rollback(True)
+        revocation_registry.refresh()
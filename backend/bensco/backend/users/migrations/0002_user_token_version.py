@@ -0,0 +1,18 @@
+# Generated by Django 5.2.3 on 2026-10-18 08:57
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('users', '0001_initial'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='usermodel',
+            name='token_version',
+            field=models.PositiveIntegerField(default=0, help_text='Bumped to invalidate every token issued so far'),
+        ),
+    ]
@@ -0,0 +1,23 @@
+# Generated by Django 5.2.3 on 2026-10-18 09:04
+
+import django.db.models.functions.text
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('auth', '0012_alter_user_first_name_max_length'),
+        ('users', '0003_revoked_tokens'),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='usermodel',
+            index=models.Index(django.db.models.functions.text.Lower('username'), name='user_username_lower_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='usermodel',
+            index=models.Index(django.db.models.functions.text.Lower('email'), name='user_email_lower_idx'),
+        ),
+    ]
@@ -0,0 +1,19 @@
+# Generated by Django 5.2.3 on 2026-10-18 09:07
+
+import django.utils.timezone
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('users', '0004_login_lower_indexes'),
+    ]
+
+    operations = [
+        migrations.AlterField(
+            model_name='authlogmodel',
+            name='timestamp',
+            field=models.DateTimeField(default=django.utils.timezone.now),
+        ),
+    ]
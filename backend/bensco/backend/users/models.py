@@ -1,21 +1,20 @@
 from django.contrib.auth.models import AbstractUser
 from django.db import models
+from django.db.models import F
+from django.db.models.functions import Lower
+from django.utils import timezone
 from core.utils import generate_unique_code, generate_hex_id
 import uuid
 
 
 def generate_user_code(role):
     prefix = {
-        'admin': 'BSL-ADM-',
-        'collector': 'BSL-COL-',
-    }.get(role, 'BSL-UNK-')
+        'admin': 'ADM',
+        'collector': 'COL',
+    }.get(role, 'UNK')
 
     from users.models import UserModel  # local import to avoid circular import
-    while True:
-        hex_part = generate_hex_id()
-        code = f"{prefix}{hex_part}"
-        if not UserModel.objects.filter(unique_code=code).exists():
-            return code
+    return generate_unique_code(UserModel, prefix)
 class Roles(models.TextChoices):
     ADMIN = 'admin', 'Admin'
     COLLECTOR = 'collector', 'Collector'
@@ -27,6 +26,7 @@ class UserModel(AbstractUser):
     must_change_password = models.BooleanField(default=True)
     is_active = models.BooleanField(default=True)
     email = models.EmailField(blank=True, null=True, unique=True)
+    token_version = models.PositiveIntegerField(default=0, help_text="Bumped to invalidate every token issued so far")
     
 
     created_at = models.DateTimeField(auto_now_add=True)
@@ -36,10 +36,19 @@ class UserModel(AbstractUser):
     USERNAME_FIELD = 'email'
     REQUIRED_FIELDS = ['username']  # Still required when creating superuser
 
+    class Meta(AbstractUser.Meta):
+        indexes = [
+            # Case-insensitive login lookups (EmailOrUsernameBackend) compare lower() values
+            models.Index(Lower('username'), name='user_username_lower_idx'),
+            models.Index(Lower('email'), name='user_email_lower_idx'),
+        ]
+
     def __str__(self):
         return f"{self.username} ({self.role})"
     
     def save(self, *args, **kwargs):
+        if getattr(self, 'from_claims', False):
+            raise ValueError("A user built from token claims cannot be saved; load it from the database.")
         if not self.unique_code and self.role:
             prefix = {
                 'admin': 'ADM',
@@ -48,6 +57,18 @@ class UserModel(AbstractUser):
             self.unique_code = generate_unique_code(UserModel, prefix)
         super().save(*args, **kwargs)
 
+    def change_password(self, raw_password):
+        # A deliberate change also revokes every token issued so far. Not done in set_password:
+        # check_password calls that too, to upgrade a stale hash during a normal login
+        self.set_password(raw_password)
+        self.token_version = F('token_version') + 1
+        self.save(update_fields=['password', 'token_version', 'updated_at'])
+        self.refresh_from_db(fields=['token_version'])
+
+    def revoke_tokens(self):
+        UserModel.objects.filter(pk=self.pk).update(token_version=F('token_version') + 1, updated_at=timezone.now())
+        self.refresh_from_db(fields=['token_version'])
+
 class AuthLogModel(models.Model):
     ACTION_CHOICES = [
         ('login', 'Login'),
@@ -61,16 +82,21 @@ class AuthLogModel(models.Model):
     action = models.CharField(max_length=50, choices=ACTION_CHOICES)
     ip_address = models.GenericIPAddressField()
     user_agent = models.TextField()
-    timestamp = models.DateTimeField(auto_now_add=True)
+    timestamp = models.DateTimeField(default=timezone.now)  # event time; rows are written later in batches
 
     def __str__(self):
         return f"{self.user.username} - {self.action}"
 
 
-    def save(self, *args, **kwargs):
-        if not self.unique_code and self.role:
-            self.unique_code = generate_user_code(self.role)
-        super().save(*args, **kwargs)
+class RevokedTokenModel(models.Model):
+    id = models.UUIDField(primary_key=True, default=uuid.uuid4, editable=False)
+    jti = models.CharField(max_length=255, unique=True)
+    user = models.ForeignKey(UserModel, on_delete=models.CASCADE, null=True, blank=True, related_name='revoked_tokens')
+    expires_at = models.DateTimeField(db_index=True, help_text="When the token would have expired; the row is useless after")
+    revoked_at = models.DateTimeField(auto_now_add=True)
+
+    def __str__(self):
+        return f"Revoked {self.jti}"
 
 
 class PasswordResetRequestModel(models.Model):
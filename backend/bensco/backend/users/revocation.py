@@ -0,0 +1,116 @@
+import hashlib
+import math
+import threading
+import time
+from datetime import datetime, timezone as dt_timezone
+
+from django.conf import settings
+from django.utils import timezone
+from rest_framework_simplejwt.settings import api_settings
+
+from .models import RevokedTokenModel
+
+
+class BloomFilter:
+    """
+    Fixed-size Bloom filter over strings: never a false negative, about
+    `error_rate` false positives at `capacity` items.
+    """
+
+    def __init__(self, capacity, error_rate=0.01):
+        capacity = max(capacity, 1)
+        self.size = max(64, int(-capacity * math.log(error_rate) / math.log(2) ** 2))
+        self.hashes = max(1, round(self.size / capacity * math.log(2)))
+        self.bits = bytearray((self.size + 7) // 8)
+
+    def _positions(self, item):
+        # Double hashing over one 128-bit digest
+        digest = hashlib.blake2b(item.encode(), digest_size=16).digest()
+        first = int.from_bytes(digest[:8], 'little')
+        step = int.from_bytes(digest[8:], 'little') | 1
+        return ((first + i * step) % self.size for i in range(self.hashes))
+
+    def add(self, item):
+        for position in self._positions(item):
+            self.bits[position >> 3] |= 1 << (position & 7)
+
+    def __contains__(self, item):
+        bits = self.bits
+        for position in self._positions(item):
+            if not bits[position >> 3] & (1 << (position & 7)):
+                return False
+        return True
+
+
+class RevocationRegistry:
+    """
+    Revoked token ids (jti) held in process. The Bloom filter answers the common
+    "not revoked" case; the exact set confirms its positives. Rebuilt from
+    RevokedTokenModel every TOKEN_REVOCATION_REFRESH seconds, so a revocation
+    made by another worker applies within that interval, and one made by this
+    worker applies at once.
+    """
+
+    def __init__(self):
+        self._bloom = BloomFilter(0)
+        self._exact = set()
+        self._loaded_at = None
+        self._lock = threading.Lock()
+
+    def is_revoked(self, jti):
+        if jti is None:
+            return False
+        self._refresh_if_stale()
+        bloom, exact = self._bloom, self._exact
+        return jti in bloom and jti in exact
+
+    def add(self, jti):
+        with self._lock:
+            self._bloom.add(jti)
+            self._exact.add(jti)
+
+    def _refresh_if_stale(self):
+        interval = getattr(settings, 'TOKEN_REVOCATION_REFRESH', 5)
+        if self._loaded_at is not None and time.monotonic() - self._loaded_at < interval:
+            return
+        # Only the first load waits; later, one thread rebuilds while the rest use the current snapshot
+        if not self._lock.acquire(blocking=self._loaded_at is None):
+            return
+        try:
+            self._load()
+        finally:
+            self._lock.release()
+
+    def refresh(self):
+        with self._lock:
+            self._load()
+
+    def _load(self):
+        jtis = list(
+            RevokedTokenModel.objects.filter(expires_at__gt=timezone.now()).values_list('jti', flat=True)
+        )
+        # Headroom for revocations added locally before the next rebuild
+        bloom = BloomFilter(max(1024, 2 * len(jtis)))
+        for jti in jtis:
+            bloom.add(jti)
+        self._bloom, self._exact = bloom, set(jtis)
+        self._loaded_at = time.monotonic()
+
+    def memory_bytes(self):
+        return len(self._bloom.bits) + sum(len(jti) for jti in self._exact)
+
+
+revocation_registry = RevocationRegistry()
+
+
+def revoke_token(token):
+    """
+    Record a validated token's jti as revoked until it would have expired anyway.
+    """
+    jti = token[api_settings.JTI_CLAIM]
+    expires_at = datetime.fromtimestamp(token['exp'], tz=dt_timezone.utc)
+    RevokedTokenModel.objects.filter(expires_at__lte=timezone.now()).delete()
+    RevokedTokenModel.objects.get_or_create(
+        jti=jti, defaults={'user_id': token.get(api_settings.USER_ID_CLAIM), 'expires_at': expires_at}
+    )
+    revocation_registry.add(jti)
@@ -1,6 +1,11 @@
 from rest_framework import serializers
 from .models import UserModel
-from rest_framework_simplejwt.serializers import TokenObtainPairSerializer
+from rest_framework_simplejwt.exceptions import InvalidToken, TokenError
+from rest_framework_simplejwt.serializers import TokenObtainPairSerializer, TokenRefreshSerializer
+from rest_framework_simplejwt.settings import api_settings
+from rest_framework_simplejwt.tokens import RefreshToken
+from .audit import log_auth_event
+from .revocation import revocation_registry
 class UserModelSerializer(serializers.ModelSerializer):
     class Meta:
         model = UserModel
@@ -44,6 +49,17 @@ class CreateUserSerializer(serializers.ModelSerializer):
         user = UserModel.objects.create_user(**validated_data)
         return user
 
+class CustomTokenRefreshSerializer(TokenRefreshSerializer):
+    def validate(self, attrs):
+        try:
+            jti = RefreshToken(attrs['refresh']).get(api_settings.JTI_CLAIM)
+        except TokenError:
+            jti = None  # the parent reports the invalid token
+        if revocation_registry.is_revoked(jti):
+            raise InvalidToken("Token has been revoked")
+        return super().validate(attrs)
+
+
 class CustomTokenObtainPairSerializer(TokenObtainPairSerializer):
     @classmethod
     def get_token(cls, user):
@@ -54,12 +70,16 @@ class CustomTokenObtainPairSerializer(TokenObtainPairSerializer):
         token['role'] = user.role
         token['unique_code'] = user.unique_code
         token['must_change_password'] = user.must_change_password
+        token['token_version'] = user.token_version
         return token
 
     def validate(self, attrs):
         data = super().validate(attrs)
 
         user = self.user
+        request = self.context.get('request')
+        if request is not None:
+            log_auth_event(request, user, 'login')
         data['user'] = {
             'id': str(user.id),
             'username': user.username,
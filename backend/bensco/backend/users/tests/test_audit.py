@@ -0,0 +1,148 @@
+import time
+from unittest import mock
+
+from django.test import RequestFactory, TestCase, TransactionTestCase, override_settings
+
+from users.audit import AuditBuffer, auth_log_buffer, log_auth_event
+from users.models import AuthLogModel, UserModel
+
+
+def make_user():
+    return UserModel.objects.create_user(
+        username='collector1',
+        email='collector1@example.com',
+        password='password123',
+        role='collector'
+    )
+
+
+class AuditBufferTestCase(TestCase):
+    def setUp(self):
+        self.user = make_user()
+
+    def _buffer(self, **options):
+        options.setdefault('flush_interval', None)
+        return AuditBuffer(AuthLogModel, **options)
+
+    def _record(self, buffer, *agents):
+        for agent in agents:
+            buffer.record(user_id=self.user.pk, action='login', ip_address='127.0.0.1', user_agent=agent)
+
+    def _stored(self):
+        return list(AuthLogModel.objects.order_by('timestamp').values_list('user_agent', flat=True))
+
+    def test_record_does_not_touch_the_database(self):
+        buffer = self._buffer()
+        with self.assertNumQueries(0):
+            self._record(buffer, 'a', 'b')
+        self.assertEqual(len(buffer), 2)
+
+    def test_flush_writes_in_order_in_batches(self):
+        buffer = self._buffer(batch_size=2)
+        self._record(buffer, *'abcde')
+        with self.assertNumQueries(3):
+            self.assertTrue(buffer.flush())
+        self.assertEqual(self._stored(), list('abcde'))
+        self.assertEqual(len(buffer), 0)
+
+    def test_overflow_drop_newest(self):
+        buffer = self._buffer(max_size=3, overflow='drop_newest')
+        self._record(buffer, *'abcde')
+        buffer.flush()
+        self.assertEqual(self._stored(), list('abc'))
+        self.assertEqual(buffer.dropped, 2)
+
+    def test_overflow_drop_oldest(self):
+        buffer = self._buffer(max_size=3, overflow='drop_oldest')
+        self._record(buffer, *'abcde')
+        buffer.flush()
+        self.assertEqual(self._stored(), list('cde'))
+        self.assertEqual(buffer.dropped, 2)
+
+    def test_overflow_flush_keeps_everything(self):
+        buffer = self._buffer(max_size=3, overflow='flush')
+        self._record(buffer, *'abcde')
+        self.assertLessEqual(len(buffer), 3)
+        buffer.flush()
+        self.assertEqual(self._stored(), list('abcde'))
+        self.assertEqual(buffer.dropped, 0)
+
+    def test_failed_flush_requeues_in_order_then_gives_up(self):
+        buffer = self._buffer(batch_size=10, max_retries=2)
+        self._record(buffer, *'abc')
+        with mock.patch.object(AuthLogModel.objects, 'bulk_create', side_effect=RuntimeError('db down')), \
+                self.assertLogs('users.audit', 'ERROR'):
+            self.assertFalse(buffer.flush())
+            self.assertEqual([row.user_agent for row in buffer._queue], list('abc'))
+            self.assertFalse(buffer.flush())
+        self.assertEqual(len(buffer), 0)
+        self.assertEqual(buffer.dropped, 3)
+
+    def test_queue_never_exceeds_max_size_while_database_is_down(self):
+        buffer = self._buffer(max_size=4, batch_size=2, overflow='flush')
+        with mock.patch.object(AuthLogModel.objects, 'bulk_create', side_effect=RuntimeError('db down')), \
+                self.assertLogs('users.audit', 'ERROR'):
+            self._record(buffer, *'abcdefgh')
+        self.assertLessEqual(len(buffer), 4)
+        self.assertEqual(len(buffer) + buffer.dropped, 8)
+
+
+class LogAuthEventTestCase(TestCase):
+    @override_settings(AUTH_LOG_BUFFER={'flush_interval': None})
+    def test_writes_on_the_callers_thread_without_a_flusher(self):
+        user = make_user()
+        request = RequestFactory().post('/', HTTP_USER_AGENT='tests', REMOTE_ADDR='10.0.0.1')
+        self.assertIsNone(auth_log_buffer.flush_interval)
+
+        log_auth_event(request, user, 'login')
+
+        self.assertIsNone(auth_log_buffer._thread)
+        self.assertEqual(len(auth_log_buffer), 0)
+        self.assertEqual(
+            list(AuthLogModel.objects.values_list('user_id', 'action', 'ip_address', 'user_agent')),
+            [(user.pk, 'login', '10.0.0.1', 'tests')],
+        )
+
+    def test_settings_are_read_on_use(self):
+        self.assertEqual(auth_log_buffer.flush_interval, 2.0)
+        with self.settings(AUTH_LOG_BUFFER={'flush_interval': None, 'batch_size': 7}):
+            self.assertIsNone(auth_log_buffer.flush_interval)
+            self.assertEqual(auth_log_buffer.batch_size, 7)
+            self.assertEqual(auth_log_buffer.max_size, 10000)
+
+
+class AuditBufferThreadTestCase(TransactionTestCase):
+    def setUp(self):
+        self.user = make_user()
+
+    def _record(self, buffer, count):
+        for i in range(count):
+            buffer.record(user_id=self.user.pk, action='login', ip_address='127.0.0.1', user_agent=str(i))
+
+    def _wait_for(self, count):
+        deadline = time.monotonic() + 5
+        while AuthLogModel.objects.count() < count and time.monotonic() < deadline:
+            time.sleep(0.02)
+        return AuthLogModel.objects.count()
+
+    def test_background_flush_by_size_and_time(self):
+        buffer = AuditBuffer(AuthLogModel, batch_size=3, flush_interval=0.1)
+        self._record(buffer, 3)
+        self.assertEqual(self._wait_for(3), 3)
+        self._record(buffer, 1)
+        self.assertEqual(self._wait_for(4), 4)
+        buffer.close()
+
+    def test_flusher_drops_dead_connections_before_each_flush(self):
+        buffer = AuditBuffer(AuthLogModel, batch_size=1, flush_interval=0.1)
+        with mock.patch('users.audit.close_old_connections') as close_old:
+            self._record(buffer, 1)
+            self.assertEqual(self._wait_for(1), 1)
+            buffer.close()
+        self.assertTrue(close_old.called)
+
+    def test_close_flushes_what_is_left(self):
+        buffer = AuditBuffer(AuthLogModel, batch_size=100, flush_interval=60)
+        self._record(buffer, 5)
+        buffer.close()
+        self.assertEqual(AuthLogModel.objects.count(), 5)
@@ -1,8 +1,9 @@
-from django.test import TestCase
+from django.test import TestCase, override_settings
 from django.urls import reverse
 from rest_framework.test import APIClient
 from users.models import UserModel
 
+@override_settings(AUTH_LOG_BUFFER={'flush_interval': None})
 class AuthTestCase(TestCase):
     def setUp(self):
         self.client = APIClient()
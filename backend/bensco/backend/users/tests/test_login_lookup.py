@@ -0,0 +1,39 @@
+from django.contrib.auth import authenticate
+from django.db import connection
+from django.db.models import Q
+from django.db.models.functions import Lower
+from django.test import TestCase
+
+from users.authentication import EmailOrUsernameBackend
+from users.models import UserModel
+
+
+class EmailOrUsernameBackendTestCase(TestCase):
+    def setUp(self):
+        self.user = UserModel.objects.create_user(
+            username='Collector1',
+            email='Collector1@Example.com',
+            password='password123',
+            role='collector'
+        )
+        self.backend = EmailOrUsernameBackend()
+
+    def test_username_or_email_in_any_case(self):
+        for identifier in ('collector1', 'COLLECTOR1', 'collector1@example.com', 'COLLECTOR1@EXAMPLE.COM'):
+            self.assertEqual(self.backend.authenticate(None, username=identifier, password='password123'), self.user)
+
+    def test_email_keyword_from_token_serializer(self):
+        self.assertEqual(authenticate(email='collector1@example.com', password='password123'), self.user)
+
+    def test_wrong_password_or_unknown_user(self):
+        self.assertIsNone(self.backend.authenticate(None, username='collector1', password='wrong'))
+        self.assertIsNone(self.backend.authenticate(None, username='nobody', password='password123'))
+
+    def test_lookup_uses_the_lower_indexes(self):
+        if connection.vendor != 'sqlite':
+            self.skipTest('plan text checked on SQLite only')
+        plan = UserModel.objects.alias(
+            username_lower=Lower('username'), email_lower=Lower('email')
+        ).filter(Q(username_lower='collector1') | Q(email_lower='collector1')).explain()
+        self.assertIn('user_username_lower_idx', plan)
+        self.assertIn('user_email_lower_idx', plan)
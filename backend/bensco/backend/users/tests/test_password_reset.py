@@ -0,0 +1,57 @@
+from django.core import mail
+from django.urls import reverse
+from rest_framework.test import APIClient
+from django.test import TestCase, override_settings
+
+from core.models import JobModel, NotificationModel
+from core.notifications import dispatch_notifications
+from users.models import AuthLogModel, PasswordResetRequestModel, UserModel
+
+
+@override_settings(AUTH_LOG_BUFFER={'flush_interval': None})
+class PasswordResetRequestTestCase(TestCase):
+    def setUp(self):
+        self.collector = UserModel.objects.create_user(
+            username='collector1',
+            email='collector1@example.com',
+            password='password123',
+            role='collector'
+        )
+        UserModel.objects.create_user(
+            username='admin1',
+            email='admin1@example.com',
+            password='password123',
+            role='admin'
+        )
+        self.client = APIClient()
+
+    def _request_reset(self):
+        return self.client.post(
+            reverse('collector_password_reset_request'), {'email_or_username': 'collector1'}, format='json'
+        )
+
+    def test_request_queues_the_admin_email(self):
+        response = self._request_reset()
+
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(PasswordResetRequestModel.objects.filter(user=self.collector).count(), 1)
+        self.assertTrue(AuthLogModel.objects.filter(user=self.collector, action='password_reset').exists())
+        self.assertEqual(len(mail.outbox), 0)
+        self.assertEqual(NotificationModel.objects.filter(recipient='admin1@example.com').count(), 1)
+        self.assertEqual(JobModel.objects.filter(status=JobModel.Status.PENDING).count(), 1)
+
+        dispatch_notifications()
+
+        self.assertEqual(len(mail.outbox), 1)
+        self.assertEqual(mail.outbox[0].to, ['admin1@example.com'])
+        self.assertIn('collector1', mail.outbox[0].body)
+
+    def test_burst_of_requests_is_one_email_per_admin(self):
+        for _ in range(3):
+            self._request_reset()
+
+        self.assertEqual(JobModel.objects.filter(status=JobModel.Status.PENDING).count(), 1)
+        dispatch_notifications()
+
+        self.assertEqual(len(mail.outbox), 1)
+        self.assertEqual(mail.outbox[0].subject, '3 notifications from Bensco')
@@ -0,0 +1,77 @@
+import uuid
+from datetime import timedelta
+
+from django.test import SimpleTestCase, TestCase, override_settings
+from django.urls import reverse
+from django.utils import timezone
+from rest_framework.test import APIClient
+
+from users.authentication import user_state_cache
+from users.models import RevokedTokenModel, UserModel
+from users.revocation import BloomFilter, revocation_registry
+from users.serializers import CustomTokenObtainPairSerializer
+
+
+class BloomFilterTestCase(SimpleTestCase):
+    def test_no_false_negatives_and_few_false_positives(self):
+        bloom = BloomFilter(1000)
+        members = [uuid.uuid4().hex for _ in range(1000)]
+        for member in members:
+            bloom.add(member)
+
+        self.assertTrue(all(member in bloom for member in members))
+        false_positives = sum(uuid.uuid4().hex in bloom for _ in range(10000))
+        self.assertLess(false_positives, 300)
+
+
+@override_settings(AUTH_LOG_BUFFER={'flush_interval': None})
+class TokenRevocationTestCase(TestCase):
+    def setUp(self):
+        user_state_cache.clear()
+        revocation_registry.refresh()
+        self.collector = UserModel.objects.create_user(
+            username='collector1',
+            email='collector1@example.com',
+            password='password123',
+            role='collector'
+        )
+        self.refresh = CustomTokenObtainPairSerializer.get_token(self.collector)
+        self.access = self.refresh.access_token
+        self.api = APIClient()
+        self.api.credentials(HTTP_AUTHORIZATION=f'Bearer {self.access}')
+
+    def test_logout_revokes_access_and_refresh_tokens(self):
+        self.assertEqual(self.api.get(reverse('list_clients')).status_code, 200)
+
+        response = self.api.post(reverse('logout'), {'refresh': str(self.refresh)}, format='json')
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(RevokedTokenModel.objects.count(), 2)
+
+        self.assertEqual(self.api.get(reverse('list_clients')).status_code, 401)
+        response = APIClient().post(reverse('token_refresh'), {'refresh': str(self.refresh)}, format='json')
+        self.assertEqual(response.status_code, 401)
+
+    def test_unrevoked_check_does_not_query(self):
+        self.api.get(reverse('list_clients'))
+        with self.assertNumQueries(0):
+            self.assertFalse(revocation_registry.is_revoked(self.access['jti']))
+
+    @override_settings(TOKEN_REVOCATION_REFRESH=0)
+    def test_revocations_from_other_workers_are_picked_up_on_refresh(self):
+        jti = self.access['jti']
+        RevokedTokenModel.objects.create(jti=jti, expires_at=timezone.now() + timedelta(minutes=5))
+        self.assertTrue(revocation_registry.is_revoked(jti))
+        self.assertEqual(self.api.get(reverse('list_clients')).status_code, 401)
+
+    @override_settings(TOKEN_REVOCATION_REFRESH=0)
+    def test_expired_revocations_are_dropped(self):
+        RevokedTokenModel.objects.create(jti='old', expires_at=timezone.now() - timedelta(minutes=1))
+        self.assertFalse(revocation_registry.is_revoked('old'))
+
+    def test_logout_all_revokes_every_token(self):
+        other_session = CustomTokenObtainPairSerializer.get_token(self.collector)
+        self.api.post(reverse('logout'), {'all': True}, format='json')
+
+        api = APIClient()
+        api.credentials(HTTP_AUTHORIZATION=f'Bearer {other_session.access_token}')
+        self.assertEqual(api.post(reverse('logout'), {}, format='json').status_code, 401)
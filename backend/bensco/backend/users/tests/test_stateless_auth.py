@@ -0,0 +1,114 @@
+from django.contrib.auth.hashers import make_password
+from django.test import TestCase, override_settings
+from django.urls import reverse
+from django.utils import timezone
+from rest_framework.test import APIClient, APIRequestFactory
+from rest_framework_simplejwt.exceptions import AuthenticationFailed
+
+from clients.models import ClientModel
+from users.authentication import StatelessJWTAuthentication, user_state_cache
+from users.revocation import revocation_registry
+from users.models import AuthLogModel, UserModel
+from users.serializers import CustomTokenObtainPairSerializer
+
+
+@override_settings(TOKEN_REVOCATION_REFRESH=3600, AUTH_LOG_BUFFER={'flush_interval': None})
+class StatelessJWTAuthenticationTestCase(TestCase):
+    def setUp(self):
+        user_state_cache.clear()
+        revocation_registry.refresh()
+        self.collector = UserModel.objects.create_user(
+            username='collector1',
+            email='collector1@example.com',
+            password='password123',
+            role='collector'
+        )
+        self.factory = APIRequestFactory()
+
+    def _token(self, user=None):
+        return str(CustomTokenObtainPairSerializer.get_token(user or self.collector).access_token)
+
+    def _authenticate(self, method='get', token=None):
+        request = getattr(self.factory, method)('/', HTTP_AUTHORIZATION=f'Bearer {token or self._token()}')
+        return StatelessJWTAuthentication().authenticate(request)
+
+    def test_reads_skip_the_user_query_once_cached(self):
+        token = self._token()
+        with self.assertNumQueries(1):
+            user, _ = self._authenticate(token=token)
+        with self.assertNumQueries(0):
+            user, _ = self._authenticate(token=token)
+
+        self.assertEqual(user.pk, self.collector.pk)
+        self.assertEqual(user.role, 'collector')
+        self.assertTrue(user.is_authenticated)
+        with self.assertRaises(ValueError):
+            user.save()
+
+    def test_claims_user_works_in_querysets(self):
+        ClientModel.objects.create(
+            name='Ama Owusu', collector=self.collector, amount_daily=5, start_date=timezone.now().date()
+        )
+        user, _ = self._authenticate()
+        self.assertEqual(ClientModel.objects.filter(collector=user).count(), 1)
+
+    def test_writes_load_the_full_user(self):
+        with self.assertNumQueries(1):
+            user, _ = self._authenticate(method='post')
+        self.assertFalse(getattr(user, 'from_claims', False))
+
+    @override_settings(AUTH_USER_STATE_TTL=0)
+    def test_revoked_and_inactive_users_are_rejected(self):
+        token = self._token()
+        self._authenticate(token=token)
+
+        self.collector.revoke_tokens()
+        for method in ('get', 'post'):
+            with self.assertRaises(AuthenticationFailed):
+                self._authenticate(method=method, token=token)
+        self._authenticate(token=self._token())
+
+        UserModel.objects.filter(pk=self.collector.pk).update(is_active=False)
+        with self.assertRaises(AuthenticationFailed):
+            self._authenticate()
+
+    def test_revocation_waits_for_the_ttl_on_reads(self):
+        token = self._token()
+        self._authenticate(token=token)
+        self.collector.revoke_tokens()
+
+        # Still inside the cached window for reads, rejected at once for writes
+        self._authenticate(token=token)
+        with self.assertRaises(AuthenticationFailed):
+            self._authenticate(method='post', token=token)
+
+    def test_password_change_revokes_tokens(self):
+        token = self._token()
+        self.collector.change_password('new-password-456')
+        with self.assertRaises(AuthenticationFailed):
+            self._authenticate(method='post', token=token)
+
+    def test_login_that_upgrades_the_hash_issues_working_tokens(self):
+        # check_password re-hashes and saves a password stored with an older hasher
+        UserModel.objects.filter(pk=self.collector.pk).update(
+            password=make_password('password123', hasher='pbkdf2_sha1')
+        )
+        api = APIClient()
+        response = api.post(
+            reverse('token_obtain_pair'), {'email': 'collector1', 'password': 'password123'}, format='json'
+        )
+        self.assertEqual(response.status_code, 200)
+        self.collector.refresh_from_db()
+        self.assertTrue(self.collector.password.startswith('pbkdf2_sha256$'))
+        self.assertEqual(self.collector.token_version, 0)
+        self.assertTrue(AuthLogModel.objects.filter(user=self.collector, action='login').exists())
+
+        api.credentials(HTTP_AUTHORIZATION=f"Bearer {response.data['access']}")
+        self.assertEqual(api.get(reverse('list_clients')).status_code, 200)
+        self.assertEqual(self._authenticate(method='post', token=response.data['access'])[0].pk, self.collector.pk)
+
+    def test_endpoint_with_bearer_token(self):
+        api = APIClient()
+        api.credentials(HTTP_AUTHORIZATION=f'Bearer {self._token()}')
+        response = api.get(reverse('list_clients'))
+        self.assertEqual(response.status_code, 200)
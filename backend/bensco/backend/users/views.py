@@ -1,19 +1,52 @@
-from rest_framework_simplejwt.views import TokenObtainPairView
-from .serializers import CustomTokenObtainPairSerializer, UserModelSerializer, CreateUserSerializer
+from rest_framework_simplejwt.exceptions import TokenError
+from rest_framework_simplejwt.settings import api_settings
+from rest_framework_simplejwt.tokens import RefreshToken
+from rest_framework_simplejwt.views import TokenObtainPairView, TokenRefreshView
+from .serializers import CustomTokenObtainPairSerializer, CustomTokenRefreshSerializer, UserModelSerializer, CreateUserSerializer
+from .audit import log_auth_event
+from .revocation import revoke_token
 from rest_framework.decorators import api_view, permission_classes
 from rest_framework.response import Response
 from rest_framework.permissions  import IsAuthenticated
 from django.db.models import Q
 from users.models import UserModel
 from .models import PasswordResetRequestModel
-from django.core.mail import send_mail
-from django.conf import settings
+from django.db import transaction
+from core.notifications import notify_admins
 from rest_framework import status
 
 class CustomTokenObtainPairView(TokenObtainPairView):
     serializer_class = CustomTokenObtainPairSerializer
 
 
+class CustomTokenRefreshView(TokenRefreshView):
+    serializer_class = CustomTokenRefreshSerializer
+
+
+@api_view(['POST'])
+@permission_classes([IsAuthenticated])
+def logout_view(request):
+    # Revokes the calling access token, the given refresh token, or with "all" every token of the user
+    refresh = request.data.get('refresh')
+    if refresh:
+        try:
+            refresh_token = RefreshToken(refresh)
+        except TokenError:
+            return Response({'detail': 'Invalid refresh token.'}, status=400)
+        if str(refresh_token.get(api_settings.USER_ID_CLAIM)) != str(request.user.pk):
+            return Response({'detail': 'Refresh token belongs to another user.'}, status=403)
+        revoke_token(refresh_token)
+
+    if request.auth is not None and hasattr(request.auth, 'payload'):
+        revoke_token(request.auth)
+
+    if request.data.get('all'):
+        request.user.revoke_tokens()
+
+    log_auth_event(request, request.user, 'logout')
+    return Response({'detail': 'Logged out.'}, status=200)
+
+
 
 @api_view(['POST'])
 def collector_password_reset_request_view(request):
@@ -25,22 +58,14 @@ def collector_password_reset_request_view(request):
         if user.role != 'collector':
             return Response({'detail': 'Only collectors can request password reset through this route.'}, status=403)
 
-        # Create request
-        PasswordResetRequestModel.objects.create(user=user)
-
-        # Notify admins
-        admins = UserModel.objects.filter(role='admin', is_active=True)
-        admin_emails = [admin.email for admin in admins if admin.email]
-        print(admin_emails)
-
-        if admin_emails:
-            send_mail(
+        # Admins are mailed from the notification outbox, not on this request
+        with transaction.atomic():
+            PasswordResetRequestModel.objects.create(user=user)
+            notify_admins(
                 subject='Password Reset Request from Collector',
-                message=f'Collector {user.username} ({user.email}) has requested a password reset.\nPlease log in to resolve.',
-                from_email=settings.DEFAULT_FROM_EMAIL,
-                recipient_list=admin_emails,
-                fail_silently=True,
+                body=f'Collector {user.username} ({user.email}) has requested a password reset.\nPlease log in to resolve.',
             )
+        log_auth_event(request, user, 'password_reset')
 
         return Response({'detail': 'Request submitted. Admin will respond soon.'}, status=200)
 